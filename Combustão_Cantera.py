@@ -1,3 +1,5 @@
+import logging
+
 import pandas as pd
 from CoolProp.CoolProp import PropsSI 
 import matplotlib.pyplot as plt
@@ -8,6 +10,8 @@ from gasmistura_pkg import corr_vazao_normal
 from gasmistura_pkg import vaz_combustao
 from gasmistura_pkg import temp_adiabatica
 
+# Exibe o log da busca da temperatura adiabática no terminal
+logging.basicConfig(level=logging.INFO, format="%(message)s")
 
 
 
@@ -96,11 +100,12 @@ df_entalpias = pd.DataFrame(
     index = ["hf", "hT"]
 )
 
-temp_K, raz_equ, dataframe_b = temp_adiabatica(
+temp_K, raz_equ, info_busca = temp_adiabatica(
     df_reagentes= df_vazoes,
     df_produtos= df_vaz_comb,
     ar_teorico= ar_teo,
     metodo="moran",
-    nmax_iter=1e3
-    
+    nmax_iter=1e3,
+    temp_reagentes=temp_gas_afSI,
+    salva_dados=True
 )
\ No newline at end of file
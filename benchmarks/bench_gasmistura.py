@@ -0,0 +1,487 @@
+"""
+    Benchmarks das funções de gasmistura_pkg e das rotinas do Cantera.
+
+    As composições de gás de alto-forno são lidas de `composicao.json` e os
+    tamanhos dos lotes reproduzem varreduras reais (um dia de historiador a
+    1 s, grades de cenários). Nenhum caso acessa a rede: o banco de
+    entalpias de formação é o arquivo distribuído com o pacote e a
+    atualização do banco é medida a partir de uma planilha local gerada
+    com os mesmos valores.
+
+    Para cada caso são registrados:
+    · o tempo de parede da primeira execução, com os caches do pacote
+    vazios ("t_frio"), e a mediana das execuções seguintes ("t_quente");
+    · o número de chamadas ao PropsSI na execução a frio e nas seguintes;
+    · o número de avaliações do resíduo de energia, quando a função o
+    informa.
+
+    Uso:
+
+        python benchmarks/bench_gasmistura.py              # compara
+        python benchmarks/bench_gasmistura.py --grava      # nova referência
+        python benchmarks/bench_gasmistura.py --cantera -k chama
+
+    O retorno é diferente de zero quando algum tempo excede a referência
+    além da tolerância ou quando algum contador aumenta. Os tempos da
+    referência dependem da máquina: grave-a novamente no servidor em que a
+    comparação será feita.
+"""
+import argparse
+import json
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+RAIZ = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RAIZ))
+
+from gasmistura_pkg import entalpia  # noqa: E402
+from gasmistura_pkg import propriedades  # noqa: E402
+from gasmistura_pkg import termoquimica  # noqa: E402
+from gasmistura_pkg.corrente import CorrenteGas  # noqa: E402
+from gasmistura_pkg.equilibrio import carrega_nasa7  # noqa: E402
+from gasmistura_pkg.equilibrio import equilibrio_hp  # noqa: E402
+from gasmistura_pkg.estequiometria import PRODUTOS  # noqa: E402
+from gasmistura_pkg.estequiometria import produtos_combustao  # noqa: E402
+from gasmistura_pkg.incerteza import propaga_incerteza  # noqa: E402
+from gasmistura_pkg.lote import temp_adiabatica_lote  # noqa: E402
+from gasmistura_pkg.mistura import corr_vazao_normal  # noqa: E402
+from gasmistura_pkg.mistura import mm_aparente_mistura  # noqa: E402
+from gasmistura_pkg.mistura import temp_adiabatica  # noqa: E402
+from gasmistura_pkg.mistura import vaz_combustao  # noqa: E402
+from gasmistura_pkg.processo import calcula_fator_o2  # noqa: E402
+from gasmistura_pkg.processo import calcula_processo  # noqa: E402
+
+REFERENCIA = Path(__file__).parent / "baseline.json"
+
+CASOS = {}
+
+
+def caso(nome, repeticoes=5, cantera=False):
+    """
+        Registra uma função de benchmark. A função recebe o dict de dados
+        fixos e retorna um dict (possivelmente vazio) de contadores extras.
+    """
+    def registra(funcao):
+        CASOS[nome] = {
+            "funcao": funcao, "repeticoes": repeticoes, "cantera": cantera
+        }
+        return funcao
+    return registra
+
+
+class ContadorPropsSI:
+    """
+        Substitui o PropsSI dos módulos do pacote por um invólucro que conta
+        as chamadas, sem alterar os resultados.
+    """
+
+    modulos = (entalpia, propriedades)
+
+    def __init__(self):
+        self.chamadas = 0
+        self._originais = {}
+
+    def __enter__(self):
+        for modulo in self.modulos:
+            original = modulo.PropsSI
+            self._originais[modulo] = original
+
+            def contado(*args, _original=original):
+                self.chamadas += 1
+                return _original(*args)
+
+            modulo.PropsSI = contado
+        return self
+
+    def __exit__(self, *exc):
+        for modulo, original in self._originais.items():
+            modulo.PropsSI = original
+
+
+def limpa_caches():
+    """
+        Esvazia todos os caches do pacote (execução a frio).
+    """
+    entalpia.cria_backend.cache_clear()
+    entalpia._propssi_vetor.cache_clear()
+    entalpia._tabela_especie.cache_clear()
+    propriedades.limpa_caches()
+    termoquimica.carrega_tabela.cache_clear()
+    carrega_nasa7.cache_clear()
+
+
+# ----------------------------------------------------------------------------
+# Dados fixos
+# ----------------------------------------------------------------------------
+
+def dados_fixos():
+    """
+        Monta as entradas dos casos a partir de `composicao.json`, seguindo
+        as etapas de `Combustão_Cantera.py` (95 °C, 4,54 Nm³/s, O2 livre de
+        19,08 % dos gases de combustão secos).
+    """
+    df_composicao = pd.read_json(RAIZ / "composicao.json", orient="split")
+    compostos = list(df_composicao.columns)
+    mmolar = df_composicao.loc["Massa Molar - (g/mol)"].to_numpy(dtype=float)
+    fracao = df_composicao.loc["% em Massa"].to_numpy(dtype=float) / 100
+    temp = 95 + 273.15
+
+    mma, _, z_m = mm_aparente_mistura(compostos, mmolar, fracao, "fmol")
+    _, vaz_mol = corr_vazao_normal(4.54, z_m, mma, temp)
+    df_reagentes = pd.DataFrame(
+        [fracao * mma / mmolar * vaz_mol], columns=compostos,
+        index=["vazao molar individual"]
+    )
+    df_reagentes, df_produtos = vaz_combustao(df_reagentes)
+    ar_teorico = df_reagentes["O2"].iloc[0]
+    o2_livre = 0.1908 * df_produtos[["CO2", "N2"]].iloc[0].sum()
+    df_reagentes["N2"] += 3.76 * o2_livre
+    df_reagentes["O2"] += o2_livre
+
+    gerador = np.random.default_rng(20220501)
+    # Perturbações de ±10 % da composição em torno do gás de referência,
+    # como as leituras do cromatógrafo ao longo de um dia
+    n_dia = 86400
+    fracoes_dia = fracao * gerador.uniform(0.9, 1.1, (n_dia, len(fracao)))
+    fracoes_dia /= fracoes_dia.sum(axis=1, keepdims=True)
+
+    return {
+        "compostos": compostos,
+        "mmolar": mmolar,
+        "fracao": fracao,
+        "temp": temp,
+        "df_reagentes": df_reagentes,
+        "df_produtos": df_produtos,
+        "ar_teorico": ar_teorico,
+        "fracoes_dia": fracoes_dia,
+        # Temperaturas com a resolução de 0,1 K do historiador
+        "temps_dia": gerador.uniform(340, 400, n_dia).round(1),
+        "vazoes_dia": gerador.uniform(14e3, 17e3, n_dia),
+        "fatores_o2_dia": gerador.uniform(0.05, 0.3, n_dia),
+    }
+
+
+# ----------------------------------------------------------------------------
+# Casos
+# ----------------------------------------------------------------------------
+
+def _temp_adiabatica(dados, metodo, backend="tabela"):
+    _, _, info = temp_adiabatica(
+        dados["df_reagentes"], dados["df_produtos"], dados["ar_teorico"],
+        metodo, backend=backend, temp_reagentes=dados["temp"],
+    )
+    return {"n_avaliacoes": info["n_avaliacoes"]}
+
+
+for _metodo in ("moran", "brentq", "toms748", "newton", "halley"):
+    caso(f"temp_adiabatica_{_metodo}")(
+        lambda dados, _m=_metodo: _temp_adiabatica(dados, _m)
+    )
+for _backend in ("nasa7", "coolprop"):
+    caso(f"temp_adiabatica_brentq_{_backend}")(
+        lambda dados, _b=_backend: _temp_adiabatica(dados, "brentq", _b)
+    )
+
+
+@caso("mm_aparente_mistura_escalar", repeticoes=20)
+def _mm_escalar(dados):
+    mm_aparente_mistura(
+        dados["compostos"], dados["mmolar"], dados["fracao"], "fmol"
+    )
+    return {}
+
+
+@caso("mm_aparente_mistura_dia")
+def _mm_dia(dados):
+    mm_aparente_mistura(
+        dados["compostos"], dados["mmolar"], dados["fracoes_dia"], "fmol",
+        CNTP=False, TP=(dados["temps_dia"], 101325)
+    )
+    return {}
+
+
+@caso("corr_vazao_normal_dia", repeticoes=20)
+def _corr_dia(dados):
+    corr_vazao_normal(dados["vazoes_dia"] / 3600, 0.9995, 29.5,
+        dados["temps_dia"])
+    return {}
+
+
+@caso("corr_vazao_normal_heos_1000")
+def _corr_heos(dados):
+    n = 1000
+    corr_vazao_normal(
+        dados["vazoes_dia"][:n] / 3600, None, 29.5, dados["temps_dia"][:n],
+        eos="HEOS", compostos=dados["compostos"],
+        fracoes=dados["fracoes_dia"][:n],
+    )
+    return {}
+
+
+@caso("vaz_combustao_linha", repeticoes=20)
+def _vaz_linha(dados):
+    vaz_combustao(dados["df_reagentes"][dados["compostos"]])
+    return {}
+
+
+@caso("vaz_combustao_linha_corrente", repeticoes=20)
+def _vaz_linha_corrente(dados):
+    vaz_combustao(CorrenteGas.de_dataframe(
+        dados["df_reagentes"].drop(columns="O2")
+    ))
+    return {}
+
+
+@caso("vaz_combustao_10000")
+def _vaz_10000(dados):
+    vaz_combustao(pd.DataFrame(
+        dados["fracoes_dia"][:10000], columns=dados["compostos"]
+    ))
+    return {}
+
+
+@caso("temp_adiabatica_lote_dia")
+def _lote_dia(dados):
+    compostos = dados["compostos"]
+    fracoes = dados["fracoes_dia"]
+    produtos, o2_teo = produtos_combustao(fracoes, compostos)
+    secos = produtos[:, PRODUTOS.index("CO2")] +\
+        produtos[:, PRODUTOS.index("N2")]
+    o2_ar = o2_teo + dados["fatores_o2_dia"] * secos
+    produtos, _ = produtos_combustao(fracoes, compostos, o2_ar)
+
+    n_reagentes = np.column_stack([fracoes, o2_ar])
+    n_reagentes[:, compostos.index("N2")] += 3.72 * o2_ar
+    _, _, info = temp_adiabatica_lote(
+        n_reagentes, produtos[:, :4], compostos + ["O2"], PRODUTOS[:4],
+        temp_reagentes=dados["temps_dia"],
+    )
+    return {"n_avaliacoes": info["n_avaliacoes"]}
+
+
+@caso("equilibrio_hp_nativo_dia")
+def _equilibrio_nativo_dia(dados):
+    compostos = dados["compostos"]
+    fracoes = dados["fracoes_dia"]
+    produtos, o2_teo = produtos_combustao(fracoes, compostos)
+    secos = produtos[:, PRODUTOS.index("CO2")] +\
+        produtos[:, PRODUTOS.index("N2")]
+    o2_ar = o2_teo + dados["fatores_o2_dia"] * secos
+
+    n_reagentes = np.column_stack([fracoes, o2_ar])
+    n_reagentes[:, compostos.index("N2")] += 3.72 * o2_ar
+    _, _, _, info = equilibrio_hp(
+        n_reagentes, compostos + ["O2"], temp_reagentes=dados["temps_dia"]
+    )
+    return {"n_avaliacoes": info["n_iter"]}
+
+
+@caso("calcula_processo_dia")
+def _processo_dia(dados):
+    calcula_processo(
+        dados["compostos"], dados["fracoes_dia"], dados["vazoes_dia"],
+        dados["temps_dia"], dados["fatores_o2_dia"],
+    )
+    return {}
+
+
+@caso("calcula_fator_o2_dia")
+def _fator_o2_dia(dados):
+    calcula_fator_o2(
+        dados["compostos"], dados["fracoes_dia"], dados["vazoes_dia"],
+        dados["temps_dia"], 1150.,
+    )
+    return {}
+
+
+@caso("propaga_incerteza_1e5", repeticoes=3)
+def _incerteza_1e5(dados):
+    resultado = propaga_incerteza(
+        dados["compostos"], dados["fracao"], 16344., dados["temp"],
+        incerteza_fracao=0.005, incerteza_vazao=150., incerteza_temp=2.,
+        n_amostras=10**5, semente=0,
+    )
+    return {"n_amostras": len(resultado["tad"])}
+
+
+@caso("atualiza_tabela_local", repeticoes=3)
+def _atualiza_tabela(dados):
+    indice, _ = termoquimica.carrega_tabela()
+    with tempfile.TemporaryDirectory() as pasta:
+        planilha = Path(pasta) / "NBS_Tables Library.xlsx"
+        # Planilha no leiaute do NIST: fórmula na 1ª coluna e ΔHf° em
+        # kJ/mol na 8ª
+        colunas = {f"c{i}": [""] * len(indice) for i in range(8)}
+        colunas["c0"] = list(indice)
+        colunas["c7"] = [v / 1e3 for v in indice.values()]
+        pd.DataFrame(colunas).to_excel(planilha, index=False)
+        termoquimica.atualiza_tabela(planilha, Path(pasta) / "tabela.npz")
+    return {}
+
+
+@caso("chama_livre_fria", repeticoes=1, cantera=True)
+def _chama_fria(dados):
+    from gasmistura_pkg.chama import ContinuacaoChama
+    with tempfile.TemporaryDirectory() as pasta:
+        continuacao = ContinuacaoChama(diretorio_cache=pasta, tipo_fracao="X")
+        continuacao.resolve(
+            "CO:0.20, H2:0.10, CH4:0.05, O2:0.25, N2:0.40", 300.0
+        )
+    return {}
+
+
+@caso("chama_livre_fria_reduzido", repeticoes=1, cantera=True)
+def _chama_fria_reduzido(dados):
+    from gasmistura_pkg.chama import ContinuacaoChama
+    with tempfile.TemporaryDirectory() as pasta:
+        continuacao = ContinuacaoChama(
+            "reduzido", diretorio_cache=pasta, tipo_fracao="X"
+        )
+        continuacao.resolve(
+            "CO:0.20, H2:0.10, CH4:0.05, O2:0.25, N2:0.40", 300.0
+        )
+    return {}
+
+
+@caso("chama_livre_continuacao", repeticoes=1, cantera=True)
+def _chama_continuacao(dados):
+    from gasmistura_pkg.chama import ContinuacaoChama
+    with tempfile.TemporaryDirectory() as pasta:
+        continuacao = ContinuacaoChama(diretorio_cache=pasta, tipo_fracao="X")
+        continuacao.varre([
+            ("CO:0.20, H2:0.10, CH4:0.05, O2:0.25, N2:0.40", t, 101325.0)
+                for t in (300.0, 320.0, 340.0, 360.0)
+        ])
+    return {}
+
+
+@caso("equilibrio_hp_100", repeticoes=3, cantera=True)
+def _equilibrio(dados):
+    from gasmistura_pkg.equilibrio_cantera import varre_equilibrio
+    varre_equilibrio(np.linspace(0.3, 3.5, 100))
+    return {}
+
+
+# ----------------------------------------------------------------------------
+# Execução e comparação
+# ----------------------------------------------------------------------------
+
+def mede(nome, dados):
+    """
+        Executa um caso a frio e repetidamente a quente.
+
+        Retornos:
+        · dict com os tempos (s) e os contadores do caso.
+    """
+    definicao = CASOS[nome]
+    funcao = definicao["funcao"]
+
+    limpa_caches()
+    with ContadorPropsSI() as contador:
+        inicio = time.perf_counter()
+        extras = funcao(dados)
+        t_frio = time.perf_counter() - inicio
+    propssi_frio = contador.chamadas
+
+    tempos = []
+    with ContadorPropsSI() as contador:
+        for _ in range(definicao["repeticoes"]):
+            inicio = time.perf_counter()
+            funcao(dados)
+            tempos.append(time.perf_counter() - inicio)
+
+    resultado = {
+        "t_frio": t_frio,
+        "t_quente": statistics.median(tempos),
+        "propssi_frio": propssi_frio,
+        "propssi_quente": contador.chamadas // definicao["repeticoes"],
+    }
+    resultado.update(extras)
+    return resultado
+
+
+def compara(atual, referencia, tolerancia, folga=0.005):
+    """
+        Lista as regressões de um caso em relação à referência: tempos
+        acima de (1 + tolerancia) vezes o de referência mais a folga
+        absoluta (s), que evita falsos alarmes em casos de poucos
+        milissegundos, e contadores maiores que os de referência.
+    """
+    regressoes = []
+    for chave, valor in atual.items():
+        if chave not in referencia:
+            continue
+        ref = referencia[chave]
+        if chave.startswith("t_"):
+            if valor > ref * (1 + tolerancia) + folga:
+                regressoes.append(f"{chave} {valor:.4g} s > {ref:.4g} s")
+        elif valor > ref:
+            regressoes.append(f"{chave} {valor} > {ref}")
+    return regressoes
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Benchmarks de gasmistura_pkg."
+    )
+    parser.add_argument("-k", "--filtro", default="",
+        help="executa apenas os casos cujo nome contém o texto")
+    parser.add_argument("--cantera", action="store_true",
+        help="inclui os casos do Cantera (FreeFlame e equilíbrio)")
+    parser.add_argument("--grava", action="store_true",
+        help="grava os resultados como nova referência")
+    parser.add_argument("--referencia", type=Path, default=REFERENCIA)
+    parser.add_argument("--tolerancia", type=float, default=0.25,
+        help="aumento relativo de tempo tolerado (padrão 0,25)")
+    parser.add_argument("--folga", type=float, default=0.005,
+        help="aumento absoluto de tempo tolerado em s (padrão 0,005)")
+    args = parser.parse_args(argv)
+
+    nomes = [
+        n for n, d in CASOS.items()
+            if args.filtro in n and (args.cantera or not d["cantera"])
+    ]
+    if args.referencia.exists():
+        referencia = json.loads(args.referencia.read_text())
+    else:
+        referencia = {}
+
+    dados = dados_fixos()
+    resultados, falhas = {}, 0
+    for nome in nomes:
+        try:
+            resultados[nome] = mede(nome, dados)
+        except ImportError as erro:
+            print(f"{nome:36s} ignorado ({erro})")
+            continue
+        r = resultados[nome]
+        regressoes = compara(
+            r, referencia.get(nome, {}), args.tolerancia, args.folga
+        )
+        falhas += bool(regressoes)
+        print(
+            f"{nome:36s} frio {r['t_frio']:9.4f} s  "
+            f"quente {r['t_quente']:9.4f} s  "
+            f"PropsSI {r['propssi_frio']:6d}/{r['propssi_quente']:<4d} "
+            f"aval. {r.get('n_avaliacoes', '-')!s:>5s}  "
+            + ("REGRESSÃO: " + "; ".join(regressoes) if regressoes else "")
+        )
+
+    if args.grava:
+        referencia.update(resultados)
+        args.referencia.write_text(
+            json.dumps(referencia, indent=2, sort_keys=True) + "\n"
+        )
+        print(f"Referência gravada em {args.referencia}.")
+        return 0
+    return 1 if falhas else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
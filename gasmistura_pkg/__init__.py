@@ -0,0 +1,34 @@
+"""
+    Pacote de simulação da temperatura adiabática de chama para a queima de
+    gases de alto-forno.
+
+    As mensagens do pacote são emitidas pelo módulo logging; configure-o
+    (por exemplo, logging.basicConfig(level=logging.INFO)) para exibi-las.
+"""
+import logging
+
+from .mistura import mm_aparente_mistura
+from .mistura import corr_vazao_normal
+from .mistura import vaz_combustao
+from .mistura import temp_adiabatica
+from .corrente import CorrenteGas
+from .termoquimica import entalpia_formacao
+from .termoquimica import entalpias_formacao
+from .entalpia import cria_backend
+from .entalpia import valida_backend
+from .lote import temp_adiabatica_lote
+from .lote import sensibilidades_tad
+from .estequiometria import o2_teorico
+from .estequiometria import produtos_combustao
+from .equilibrio import equilibrio_hp
+from .processo import calcula_processo
+from .processo import calcula_fator_o2
+from .incerteza import propaga_incerteza
+from .grafo import GrafoProcesso
+from .instrumentacao import coleta_metricas
+from .instrumentacao import soma_resumos
+from .tabela_tad import TabelaTad
+from .tabela_tad import gera_tabela_tad
+from .servico import ServicoTad
+
+logging.getLogger(__name__).addHandler(logging.NullHandler())
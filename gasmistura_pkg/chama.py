@@ -0,0 +1,208 @@
+"""
+    Continuação de soluções de chamas pré-misturadas livres (ct.FreeFlame)
+    com cache em disco.
+
+    Cada solução convergida é gravada no diretório de cache, identificada
+    pelo hash de (conteúdo do arquivo do mecanismo, composição, T, p,
+    modelo de transporte, critérios de refino, largura). Um caso já
+    resolvido é apenas lido do disco; um caso novo parte do perfil
+    convergido mais próximo e requer somente a etapa de refino, em vez da
+    solução a frio com `auto=True`.
+
+    Requer: cantera >= 2.5.0
+"""
+import hashlib
+import json
+from pathlib import Path
+
+import cantera as ct
+import numpy as np
+
+from .mecanismos import assinatura_mecanismo
+from .mecanismos import caminho_mecanismo
+
+# Nomes dos modelos de transporte aceitos pelo Cantera 3
+_TRANSPORTE = {"Mix": "mixture-averaged", "Multi": "multicomponent"}
+
+CRITERIOS_PADRAO = {"ratio": 3, "slope": 0.06, "curve": 0.12}
+
+
+def _modelo_transporte(transporte):
+    if int(ct.__version__.split(".")[0]) >= 3:
+        return _TRANSPORTE.get(transporte, transporte)
+    return transporte
+
+
+class ContinuacaoChama:
+    """
+        Resolve chamas livres em sequência reaproveitando soluções.
+
+        Parâmetros:
+        · [mecanismo] opcional - arquivo do mecanismo de cinética ou nome
+        abreviado (ver mecanismos.py), por exemplo "reduzido";
+        · [largura] opcional - largura do domínio em metros;
+        · [criterios] opcional - dict com os critérios de refino (ratio,
+        slope, curve, prune);
+        · [diretorio_cache] opcional - diretório das soluções gravadas;
+        · [tipo_fracao] opcional - "Y" (fração mássica, como em
+        `Combustão_Cantera.py`) ou "X" (fração molar).
+    """
+
+    def __init__(
+        self,
+        mecanismo = "gri30.yaml",
+        largura = 0.03,
+        criterios = None,
+        diretorio_cache = "cache_chamas",
+        tipo_fracao = "Y",
+    ):
+        self.mecanismo = mecanismo
+        self.largura = largura
+        self.criterios = dict(criterios or CRITERIOS_PADRAO)
+        self.diretorio_cache = Path(diretorio_cache)
+        self.tipo_fracao = tipo_fracao
+        self.gas = ct.Solution(caminho_mecanismo(mecanismo))
+        self.diretorio_cache.mkdir(parents=True, exist_ok=True)
+        self._arquivo_indice = self.diretorio_cache / "indice.json"
+        if self._arquivo_indice.exists():
+            self._indice = json.loads(self._arquivo_indice.read_text())
+        else:
+            self._indice = {}
+
+    def _fracoes(self, composicao):
+        """
+            Vetor normalizado de frações na ordem das espécies do mecanismo.
+        """
+        self.gas.TP = 300, ct.one_atm
+        setattr(self.gas, self.tipo_fracao, composicao)
+        return getattr(self.gas, self.tipo_fracao)
+
+    def _configuracao(self):
+        texto = json.dumps([
+            assinatura_mecanismo(self.mecanismo), self.largura,
+            self.criterios, self.tipo_fracao
+        ], sort_keys=True)
+        return hashlib.sha256(texto.encode()).hexdigest()[:24]
+
+    def _chave(self, fracoes, temp, press, transporte):
+        caso = {
+            "configuracao": self._configuracao(),
+            "fracoes": np.round(fracoes, 10).tolist(),
+            "temp": round(float(temp), 6),
+            "press": round(float(press), 3),
+            "transporte": transporte,
+        }
+        texto = json.dumps(caso, sort_keys=True)
+        return hashlib.sha256(texto.encode()).hexdigest()[:24]
+
+    def _mais_proximo(self, fracoes, temp, press, transporte):
+        """
+            Caso gravado mais próximo com a mesma configuração e o mesmo 
+            modelo de transporte, pela distância entre composições (norma L1)
+            e estados normalizados.
+        """
+        configuracao = self._configuracao()
+        melhor, menor = None, np.inf
+        for chave, caso in self._indice.items():
+            if caso["configuracao"] != configuracao or \
+                    caso["transporte"] != transporte:
+                continue
+            distancia = np.abs(np.asarray(caso["fracoes"]) - fracoes).sum() +\
+                abs(caso["temp"] - temp) / 100 +\
+                abs(caso["press"] - press) / press
+            if distancia < menor:
+                melhor, menor = chave, distancia
+        return melhor
+
+    def _nova_chama(self, fracoes, temp, press):
+        self.gas.TP = temp, press
+        setattr(self.gas, self.tipo_fracao, fracoes)
+        chama = ct.FreeFlame(self.gas, width=self.largura)
+        chama.set_refine_criteria(**self.criterios)
+        return chama
+
+    def _arquivo(self, chave):
+        return self.diretorio_cache / f"{chave}.yaml"
+
+    def resolve(
+        self, composicao, temp, press=ct.one_atm, transporte="Mix",
+        loglevel=0
+    ):
+        """
+            Resolve a chama livre para a composição e o estado de entrada.
+
+            Parâmetros:
+            · composicao - string ("CO:.37, H2:.09, ...") ou dict com as
+            frações dos reagentes;
+            · temp - temperatura de entrada em K;
+            · [press] opcional - pressão em Pa;
+            · [transporte] opcional - "Mix" ou "Multi". A solução "Multi"
+            sem caso próximo é iniciada a partir da solução "Mix";
+            · [loglevel] opcional - nível de diagnóstico do Cantera.
+
+            Retornos:
+            · ct.FreeFlame convergida;
+            · str - origem da solução: "cache", "continuacao" ou "fria".
+        """
+        fracoes = self._fracoes(composicao)
+        chave = self._chave(fracoes, temp, press, transporte)
+        chama = self._nova_chama(fracoes, temp, press)
+
+        if chave in self._indice:
+            chama.restore(str(self._arquivo(chave)), "solucao")
+            return chama, "cache"
+
+        vizinho = self._mais_proximo(fracoes, temp, press, transporte)
+        if vizinho is None and transporte != "Mix":
+            self.resolve(composicao, temp, press, "Mix", loglevel)
+            vizinho = self._mais_proximo(fracoes, temp, press, "Mix")
+
+        origem = "fria"
+        if vizinho is not None:
+            try:
+                chama.restore(str(self._arquivo(vizinho)), "solucao")
+                chama.transport_model = _modelo_transporte(transporte)
+                chama.P = press
+                chama.inlet.T = temp
+                self.gas.TP = temp, press
+                setattr(self.gas, self.tipo_fracao, fracoes)
+                chama.inlet.Y = self.gas.Y
+                chama.solve(loglevel=loglevel, auto=False)
+                origem = "continuacao"
+            except ct.CanteraError:
+                chama = self._nova_chama(fracoes, temp, press)
+
+        if origem == "fria":
+            chama.transport_model = _modelo_transporte(transporte)
+            chama.solve(loglevel=loglevel, auto=True)
+
+        chama.save(
+            str(self._arquivo(chave)), "solucao",
+            f"{transporte} T={temp} p={press}", overwrite=True
+        )
+        self._indice[chave] = {
+            "configuracao": self._configuracao(),
+            "fracoes": fracoes.tolist(),
+            "temp": float(temp),
+            "press": float(press),
+            "transporte": transporte,
+        }
+        self._arquivo_indice.write_text(json.dumps(self._indice))
+        return chama, origem
+
+    def varre(self, casos, transporte="Mix", loglevel=0):
+        """
+            Resolve uma sequência de casos (composição, T, p) por
+            continuação, na ordem informada.
+
+            Retornos:
+            · lista de tuplas (velocidade de chama em m/s, temperatura
+            adiabática em K, origem da solução).
+        """
+        resultados = []
+        for composicao, temp, press in casos:
+            chama, origem = self.resolve(
+                composicao, temp, press, transporte, loglevel
+            )
+            resultados.append((chama.velocity[0], chama.T[-1], origem))
+        return resultados
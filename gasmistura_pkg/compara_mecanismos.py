@@ -0,0 +1,209 @@
+"""
+    Comparação de mecanismos de cinética (ver mecanismos.py) nas chamas
+    livres e no equilíbrio HP sobre um conjunto de composições.
+
+    Cada par (caso, mecanismo) é resolvido a frio, com os critérios de
+    refino de chama.py, em um processo próprio; assim o pico de memória do
+    processo (ru_maxrss) corresponde a um único caso e os pares podem ser
+    distribuídos entre vários processos. São registrados a velocidade de
+    chama, a temperatura final da chama e a de equilíbrio, o tempo de
+    carga do mecanismo e o de solução da chama e o pico de memória.
+
+    Uso pela linha de comando (gás de `composicao.json` com ar):
+
+        python -m gasmistura_pkg.compara_mecanismos --phi 0.8 1.0 1.2
+
+    Requer: cantera >= 2.5.0
+"""
+import argparse
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import cantera as ct
+import numpy as np
+import pandas as pd
+
+from .chama import CRITERIOS_PADRAO
+from .mecanismos import caminho_mecanismo
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def _memoria_pico():
+    """
+        Pico de memória residente do processo em MB (NaN se indisponível).
+    """
+    if resource is None:
+        return np.nan
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _resolve_caso(
+    mecanismo, combustivel, phi, temp, press, oxidante, base, largura,
+    criterios
+):
+    """
+        Resolve um caso com um mecanismo (executado nos processos filhos).
+    """
+    inicio = time.perf_counter()
+    gas = ct.Solution(caminho_mecanismo(mecanismo))
+    tempo_carga = time.perf_counter() - inicio
+
+    gas.TP = temp, press
+    gas.set_equivalence_ratio(phi, combustivel, oxidante, basis=base)
+    reagentes = gas.state
+    gas.equilibrate("HP")
+    tad_equilibrio = gas.T
+    gas.state = reagentes
+
+    chama = ct.FreeFlame(gas, width=largura)
+    chama.set_refine_criteria(**criterios)
+    inicio = time.perf_counter()
+    try:
+        chama.solve(loglevel=0, auto=True)
+        velocidade, tad_chama = chama.velocity[0], chama.T[-1]
+        convergiu = True
+    except ct.CanteraError:
+        velocidade, tad_chama = np.nan, np.nan
+        convergiu = False
+    tempo_chama = time.perf_counter() - inicio
+
+    return {
+        "mecanismo": mecanismo,
+        "n_especies": gas.n_species,
+        "n_reacoes": gas.n_reactions,
+        "velocidade": velocidade,
+        "tad_chama": tad_chama,
+        "tad_equilibrio": tad_equilibrio,
+        "tempo_carga": tempo_carga,
+        "tempo_chama": tempo_chama,
+        "memoria_pico": _memoria_pico(),
+        "convergiu": convergiu,
+    }
+
+
+def compara_mecanismos(
+    casos,
+    mecanismos = ("gri30", "reduzido"),
+    oxidante = "O2:1.0, N2:3.76",
+    base = "mole",
+    largura = 0.03,
+    criterios = None,
+    n_processos = None,
+):
+    """
+        Resolve cada caso com cada mecanismo.
+
+        Parâmetros:
+        · casos - sequência de tuplas (combustivel, phi, temp, press), com
+        o combustível em string ("CO:.22, H2:.05, ...") ou dict, a razão
+        de equivalência, a temperatura de entrada em K e a pressão em Pa;
+        · [mecanismos] opcional - arquivos ou nomes abreviados;
+        · [oxidante] opcional - composição do oxidante;
+        · [base] opcional - "mole" ou "mass", base das frações do
+        combustível e do oxidante;
+        · [largura] opcional - largura do domínio da chama em metros;
+        · [criterios] opcional - critérios de refino (ver chama.py);
+        · [n_processos] opcional - número de processos simultâneos, por
+        padrão o número de CPUs.
+
+        Retornos:
+        · DataFrame com uma linha por (caso, mecanismo): "caso", "phi",
+        "temp", a velocidade de chama "velocidade" (m/s), as temperaturas
+        "tad_chama" e "tad_equilibrio" (K), os tempos "tempo_carga" e
+        "tempo_chama" (s), a "memoria_pico" (MB), o tamanho do mecanismo
+        e a máscara "convergiu".
+    """
+    criterios = dict(criterios or CRITERIOS_PADRAO)
+    tarefas = [
+        (k, (m, combustivel, phi, temp, press, oxidante, base, largura,
+            criterios))
+        for k, (combustivel, phi, temp, press) in enumerate(casos)
+            for m in mecanismos
+    ]
+
+    # Um processo novo por tarefa, para que a memória de pico e o tempo
+    # de carga não sejam afetados pelas tarefas anteriores
+    with ProcessPoolExecutor(
+        max_workers=n_processos or os.cpu_count(),
+        mp_context=multiprocessing.get_context("spawn"),
+        max_tasks_per_child=1,
+    ) as pool:
+        futuros = [
+            (k, pool.submit(_resolve_caso, *argumentos))
+                for k, argumentos in tarefas
+        ]
+        linhas = []
+        for k, futuro in futuros:
+            _, phi, temp, _ = casos[k]
+            linhas.append(
+                {"caso": k, "phi": phi, "temp": temp, **futuro.result()}
+            )
+    return pd.DataFrame(linhas)
+
+
+def lado_a_lado(resultados, referencia="gri30"):
+    """
+        Dispõe os resultados de compara_mecanismos lado a lado, um bloco de
+        colunas por mecanismo, com os desvios em relação à referência:
+        "desvio_velocidade" (%), "desvio_tad_chama" e
+        "desvio_tad_equilibrio" (K) e "aceleracao" (tempo de chama da
+        referência / tempo de chama).
+    """
+    tabela = resultados.pivot(
+        index=["caso", "phi", "temp"], columns="mecanismo",
+        values=["velocidade", "tad_chama", "tad_equilibrio", "tempo_chama",
+            "memoria_pico"],
+    )
+    ref = tabela.xs(referencia, axis=1, level="mecanismo")
+    for m in resultados["mecanismo"].unique():
+        if m == referencia:
+            continue
+        atual = tabela.xs(m, axis=1, level="mecanismo")
+        tabela[("desvio_velocidade", m)] = 100 * (
+            atual["velocidade"] / ref["velocidade"] - 1
+        )
+        tabela[("desvio_tad_chama", m)] = atual["tad_chama"] -\
+            ref["tad_chama"]
+        tabela[("desvio_tad_equilibrio", m)] = atual["tad_equilibrio"] -\
+            ref["tad_equilibrio"]
+        tabela[("aceleracao", m)] = ref["tempo_chama"] / atual["tempo_chama"]
+    return tabela
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Compara mecanismos nas chamas livres do gás de "
+            "composicao.json com ar."
+    )
+    parser.add_argument("--composicao", default="composicao.json")
+    parser.add_argument("--phi", type=float, nargs="+",
+        default=[0.8, 1.0, 1.2])
+    parser.add_argument("--temp", type=float, nargs="+", default=[368.15])
+    parser.add_argument("--mecanismos", nargs="+",
+        default=["gri30", "reduzido"])
+    parser.add_argument("--processos", type=int, default=None)
+    parser.add_argument("--destino", default=None,
+        help="grava os resultados por caso em CSV")
+    args = parser.parse_args()
+
+    # Linha "% em Massa": frações mássicas do gás combustível
+    df_composicao = pd.read_json(args.composicao, orient="split")
+    combustivel = df_composicao.loc["% em Massa"].astype(float).to_dict()
+    casos = [
+        (combustivel, phi, temp, ct.one_atm)
+            for temp in args.temp for phi in args.phi
+    ]
+    resultados = compara_mecanismos(
+        casos, args.mecanismos, base="mass", n_processos=args.processos
+    )
+    if args.destino:
+        resultados.to_csv(args.destino, index=False)
+    with pd.option_context("display.width", 200,
+            "display.max_columns", None):
+        print(lado_a_lado(resultados, args.mecanismos[0]).round(4))
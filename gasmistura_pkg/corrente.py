@@ -0,0 +1,133 @@
+"""
+    Corrente gasosa: lote de N pontos de operação com as vazões molares (ou
+    frações) de cada composto em um único array NumPy contíguo (N,
+    n_compostos) e um índice fixo composto -> coluna.
+
+    É o tipo aceito e retornado por mm_aparente_mistura, corr_vazao_normal,
+    vaz_combustao e temp_adiabatica, em substituição aos DataFrames de uma
+    linha "vazao molar individual". O acesso a um composto é uma consulta
+    a um dict e uma vista de coluna, sem a resolução de rótulos do pandas;
+    a conversão de e para DataFrames fica restrita às bordas (leitura de
+    planilhas, relatórios).
+"""
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+# Rótulo da linha de vazões molares nos DataFrames do pacote
+LINHA_VAZAO = "vazao molar individual"
+
+
+@lru_cache(maxsize=None)
+def _indice(compostos):
+    if len(set(compostos)) != len(compostos):
+        raise ValueError(
+            f"Compostos repetidos na corrente: {', '.join(compostos)}."
+        )
+    return {c: j for j, c in enumerate(compostos)}
+
+
+class CorrenteGas:
+    """
+        Vazões molares de N pontos de operação.
+
+        Parâmetros:
+        · compostos - sequência com as fórmulas químicas das colunas;
+        · vazoes - array (n_compostos,) ou (N, n_compostos) com as vazões
+        molares (ou frações). Um array 1-D corresponde a um único ponto.
+
+        corrente["CO"] retorna a vista (N,) da coluna do composto, que pode
+        ser atribuída (corrente["N2"] += ...).
+    """
+
+    __slots__ = ("compostos", "vazoes", "_indice")
+
+    def __init__(self, compostos, vazoes):
+        self.compostos = tuple(compostos)
+        self._indice = _indice(self.compostos)
+        self.vazoes = np.ascontiguousarray(
+            np.atleast_2d(np.asarray(vazoes, dtype=float))
+        )
+        if self.vazoes.ndim != 2 or \
+                self.vazoes.shape[1] != len(self.compostos):
+            raise ValueError(
+                f"Vazões de forma {self.vazoes.shape} incompatíveis com "
+                f"{len(self.compostos)} compostos."
+            )
+
+    @property
+    def n_pontos(self):
+        return self.vazoes.shape[0]
+
+    def __len__(self):
+        return self.vazoes.shape[0]
+
+    def __contains__(self, composto):
+        return composto in self._indice
+
+    def _coluna(self, composto):
+        try:
+            return self._indice[composto]
+        except KeyError:
+            raise KeyError(
+                f"Composto '{composto}' ausente da corrente "
+                f"({', '.join(self.compostos)})."
+            ) from None
+
+    def __getitem__(self, composto):
+        return self.vazoes[:, self._coluna(composto)]
+
+    def __setitem__(self, composto, valores):
+        self.vazoes[:, self._coluna(composto)] = valores
+
+    def __repr__(self):
+        return (
+            f"CorrenteGas({len(self)} ponto(s), "
+            f"{', '.join(self.compostos)})"
+        )
+
+    def colunas(self, compostos):
+        """
+            Array (N, len(compostos)) com as colunas pedidas, na ordem
+            informada (cópia).
+        """
+        return self.vazoes[:, [self._coluna(c) for c in compostos]]
+
+    def total(self):
+        """
+            Vazão molar total de cada ponto, array (N,).
+        """
+        return self.vazoes.sum(axis=1)
+
+    def fracoes(self):
+        """
+            Frações molares de cada ponto, array (N, n_compostos).
+        """
+        return self.vazoes / self.total()[:, None]
+
+    def copia(self):
+        return CorrenteGas(self.compostos, self.vazoes.copy())
+
+    @classmethod
+    def de_dataframe(cls, dataframe, linha=None):
+        """
+            Converte um DataFrame com os compostos nas colunas: todas as
+            linhas (um ponto por linha) ou apenas a linha de rótulo
+            informado, por exemplo LINHA_VAZAO.
+        """
+        if linha is not None:
+            dataframe = dataframe.loc[[linha]]
+        return cls(dataframe.columns, dataframe.to_numpy(dtype=float))
+
+    def para_dataframe(self, indice=None):
+        """
+            Converte para DataFrame com os compostos nas colunas. Por
+            padrão, uma corrente de um único ponto recebe o rótulo
+            LINHA_VAZAO, como nos DataFrames do pacote.
+        """
+        if indice is None and len(self) == 1:
+            indice = [LINHA_VAZAO]
+        return pd.DataFrame(
+            self.vazoes.copy(), index=indice, columns=list(self.compostos)
+        )
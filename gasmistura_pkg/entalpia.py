@@ -0,0 +1,377 @@
+"""
+    Backends de entalpia sensível molar h(T) - h(T_ref) para os compostos
+    envolvidos no cálculo da temperatura adiabática de chama.
+
+    Três implementações com a mesma interface estão disponíveis:
+    · "coolprop" - consulta direta ao PropsSI, memorizando apenas os valores
+    no estado de referência;
+    · "tabela" - tabela densa (passo de 1 K entre 250 e 3500 K) gerada uma
+    única vez com o PropsSI e interpolada linearmente;
+    · "nasa7" - polinômios NASA de 7 coeficientes ajustados aos valores do
+    PropsSI em dois intervalos de temperatura, contínuos na transição.
+
+    Todas usam a entalpia de gás ideal do CoolProp, coerente com as
+    entalpias de formação da fase gasosa de termoquimica.py: a H2O e o SO2
+    permanecem vapor abaixo da temperatura de saturação, sem o calor
+    latente que a referência de fluido real incluiria.
+
+    Todas avaliam os compostos simultaneamente com NumPy: para uma entrada de
+    temperaturas de forma (...), o retorno tem forma (..., n_compostos).
+"""
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+from CoolProp.CoolProp import PropsSI
+
+from .instrumentacao import conta
+
+R_UNIVERSAL = 8.314462618  # J/mol.K
+
+# Entalpia e cp molares de gás ideal no PropsSI
+H_GAS_IDEAL = "Hmolar_idealgas"
+CP_GAS_IDEAL = "Cp0molar"
+
+
+@lru_cache(maxsize=None)
+def _propssi_vetor(propriedade, composto, press, temps):
+    """
+        Avalia o PropsSI para uma tupla de temperaturas. Estados em que o
+        CoolProp não converge retornam NaN.
+    """
+    conta("propssi")
+    valores = np.asarray(
+        PropsSI(propriedade, 'T', np.array(temps), 'P', press, composto),
+        dtype=float
+    )
+    valores[~np.isfinite(valores)] = np.nan
+    return valores
+
+
+def _preenche_lacunas(temps, valores):
+    """
+        Substitui NaNs por interpolação linear entre os pontos válidos e,
+        além das extremidades, por extrapolação linear com a inclinação
+        dos dois pontos válidos mais próximos (a H2O, por exemplo, não é
+        definida pelo CoolProp abaixo do ponto triplo).
+    """
+    validos = np.isfinite(valores)
+    if validos.sum() < 2:
+        raise ValueError("Estados válidos insuficientes obtidos do CoolProp.")
+    t, v = temps[validos], valores[validos]
+    saida = np.interp(temps, t, v)
+    abaixo, acima = temps < t[0], temps > t[-1]
+    saida[abaixo] = v[0] + (temps[abaixo] - t[0]) *\
+        (v[1] - v[0]) / (t[1] - t[0])
+    saida[acima] = v[-1] + (temps[acima] - t[-1]) *\
+        (v[-1] - v[-2]) / (t[-1] - t[-2])
+    return saida
+
+
+class BackendCoolProp:
+    """
+        Backend de referência: consulta o PropsSI a cada avaliação.
+        Os valores no estado de referência são calculados uma única vez.
+    """
+
+    tipo = "coolprop"
+
+    def __init__(self, compostos, press=101325, temp_ref=298):
+        self.compostos = tuple(compostos)
+        self.press = press
+        self.temp_ref = temp_ref
+        conta("propssi", len(self.compostos))
+        self._h_ref = np.array(
+            [PropsSI(H_GAS_IDEAL, 'T', temp_ref, 'P', press, c)
+                for c in self.compostos]
+        )
+
+    def _avalia(self, propriedade, temp):
+        # Estados em que o CoolProp não converge retornam NaN
+        temp = np.asarray(temp, dtype=float)
+        saida = np.full(temp.shape + (len(self.compostos),), np.nan)
+        conta("propssi", len(self.compostos))
+        for j, c in enumerate(self.compostos):
+            try:
+                saida[..., j] = PropsSI(
+                    propriedade, 'T', temp, 'P', self.press, c
+                )
+            except ValueError:
+                pass
+        saida[~np.isfinite(saida)] = np.nan
+        return saida
+
+    def h_sensivel(self, temp):
+        return self._avalia(H_GAS_IDEAL, temp) - self._h_ref
+
+    def cp(self, temp):
+        return self._avalia(CP_GAS_IDEAL, temp)
+
+    def dcp(self, temp, dt=0.5):
+        temp = np.asarray(temp, dtype=float)
+        return (self.cp(temp + dt) - self.cp(temp - dt)) / (2 * dt)
+
+
+@lru_cache(maxsize=None)
+def _tabela_especie(composto, press, temp_min, temp_max, passo):
+    """
+        Tabela de entalpia molar absoluta de um composto na malha uniforme
+        [temp_min, temp_max] com o passo indicado.
+    """
+    temps = np.arange(temp_min, temp_max + passo / 2, passo)
+    h = _propssi_vetor(H_GAS_IDEAL, composto, press, tuple(temps))
+    return _preenche_lacunas(temps, h)
+
+
+class BackendTabela:
+    """
+        Backend tabelado: h(T) em malha uniforme, interpolado linearmente.
+        cp e dcp/dT são obtidos por diferenças centradas da própria tabela.
+    """
+
+    tipo = "tabela"
+
+    def __init__(
+        self, compostos, press=101325, temp_ref=298,
+        temp_min=250., temp_max=3500., passo=1.
+    ):
+        self.compostos = tuple(compostos)
+        self.press = press
+        self.temp_ref = temp_ref
+        self.temp_min = temp_min
+        self.passo = passo
+
+        h = np.column_stack(
+            [_tabela_especie(c, press, temp_min, temp_max, passo)
+                for c in self.compostos]
+        )
+        self._n = h.shape[0]
+        self._h = h - self._interpola(h, temp_ref)
+        self._cp = np.gradient(self._h, passo, axis=0)
+        self._dcp = np.gradient(self._cp, passo, axis=0)
+
+    def _interpola(self, tabela, temp):
+        temp = np.asarray(temp, dtype=float)
+        pos = (temp - self.temp_min) / self.passo
+        i = np.clip(np.floor(pos).astype(int), 0, self._n - 2)
+        frac = (pos - i)[..., None]
+        return tabela[i] * (1 - frac) + tabela[i + 1] * frac
+
+    def h_sensivel(self, temp):
+        return self._interpola(self._h, temp)
+
+    def cp(self, temp):
+        return self._interpola(self._cp, temp)
+
+    def dcp(self, temp):
+        return self._interpola(self._dcp, temp)
+
+
+class BackendNasa7:
+    """
+        Backend polinomial NASA-7. Para cada composto, os coeficientes
+        a1...a7 de cada intervalo ([temp_min, temp_medio] e
+        [temp_medio, temp_max]) definem:
+
+            cp/R = a1 + a2 T + a3 T² + a4 T³ + a5 T⁴
+            h/R  = a1 T + a2 T²/2 + a3 T³/3 + a4 T⁴/4 + a5 T⁵/5 + a6
+
+        Parâmetros:
+        · compostos - sequência com os nomes dos compostos;
+        · coefs - array (n_compostos, 2, 7) com os coeficientes do intervalo
+        inferior e superior;
+        · temp_medio (opcional) - temperatura de transição entre intervalos;
+        · temp_ref (opcional) - temperatura do estado de referência;
+        · press (opcional) - pressão em Pa a que os coeficientes se referem.
+    """
+
+    tipo = "nasa7"
+
+    def __init__(
+        self, compostos, coefs, temp_medio=1000., temp_ref=298, press=101325
+    ):
+        self.compostos = tuple(compostos)
+        self.coefs = np.asarray(coefs, dtype=float)
+        self.press = press
+        self.temp_medio = temp_medio
+        self.temp_ref = temp_ref
+        self._h_ref = self._h_absoluta(np.asarray(temp_ref, dtype=float))
+
+    @classmethod
+    def ajusta(
+        cls, compostos, press=101325, temp_ref=298,
+        temp_min=250., temp_medio=1000., temp_max=3500., n_pontos=200
+    ):
+        """
+            Ajusta, por mínimos quadrados, os polinômios NASA-7 aos valores
+            de entalpia de gás ideal do PropsSI, com continuidade de h e de
+            cp em temp_medio. Estados não definidos pelo CoolProp (H2O
+            abaixo do ponto triplo) ficam fora do ajuste e são
+            extrapolados pelo polinômio. O coeficiente a7 (entropia) não é
+            ajustado e permanece nulo.
+        """
+        coefs = np.zeros((len(compostos), 2, 7))
+        # Ajuste em T/1000 para um sistema bem condicionado
+        escala = 1e3**np.arange(1, 6)
+        t_m = temp_medio / 1e3
+
+        def base_h(t):
+            return np.column_stack(
+                [t, t**2 / 2, t**3 / 3, t**4 / 4, t**5 / 5, np.ones_like(t)]
+            )
+
+        def base_cp(t):
+            return np.array([1., t, t**2, t**3, t**4, 0.])
+
+        for j, c in enumerate(compostos):
+            # Mínimos quadrados dos dois intervalos com as restrições de
+            # continuidade (sistema KKT)
+            blocos, alvos = [], []
+            for k, (t0, t1) in enumerate([(temp_min, temp_medio),
+                    (temp_medio, temp_max)]):
+                temps = np.linspace(t0, t1, n_pontos)
+                h = _propssi_vetor(H_GAS_IDEAL, c, press, tuple(temps))
+                validos = np.isfinite(h)
+                bloco = np.zeros((validos.sum(), 12))
+                bloco[:, 6 * k:6 * k + 6] = base_h(temps[validos] / 1e3)
+                blocos.append(bloco)
+                alvos.append(h[validos] / R_UNIVERSAL)
+            a = np.vstack(blocos)
+            b = np.concatenate(alvos)
+            restricoes = np.array([
+                np.concatenate([base_h(np.array([t_m]))[0],
+                    -base_h(np.array([t_m]))[0]]),
+                np.concatenate([base_cp(t_m), -base_cp(t_m)]),
+            ])
+            kkt = np.block([
+                [a.T @ a, restricoes.T],
+                [restricoes, np.zeros((2, 2))],
+            ])
+            solucao = np.linalg.solve(
+                kkt, np.concatenate([a.T @ b, np.zeros(2)])
+            )
+            for k in range(2):
+                c_ajuste = solucao[6 * k:6 * k + 6]
+                coefs[j, k, :5] = c_ajuste[:5] / escala
+                coefs[j, k, 5] = c_ajuste[5]
+        return cls(compostos, coefs, temp_medio, temp_ref, press)
+
+    def _seleciona(self, temp):
+        # a: (..., n_compostos, 7)
+        superior = (temp >= self.temp_medio)[..., None, None]
+        return np.where(superior, self.coefs[:, 1, :], self.coefs[:, 0, :])
+
+    def _h_absoluta(self, temp):
+        a = self._seleciona(temp)
+        t = temp[..., None]
+        return R_UNIVERSAL * (
+            t * (a[..., 0] + t * (a[..., 1] / 2 + t * (a[..., 2] / 3 +
+                t * (a[..., 3] / 4 + t * a[..., 4] / 5)))) + a[..., 5]
+        )
+
+    def h_sensivel(self, temp):
+        return self._h_absoluta(np.asarray(temp, dtype=float)) - self._h_ref
+
+    def cp(self, temp):
+        temp = np.asarray(temp, dtype=float)
+        a = self._seleciona(temp)
+        t = temp[..., None]
+        return R_UNIVERSAL * (
+            a[..., 0] + t * (a[..., 1] + t * (a[..., 2] +
+                t * (a[..., 3] + t * a[..., 4])))
+        )
+
+    def dcp(self, temp):
+        temp = np.asarray(temp, dtype=float)
+        a = self._seleciona(temp)
+        t = temp[..., None]
+        return R_UNIVERSAL * (
+            a[..., 1] + t * (2 * a[..., 2] + t * (3 * a[..., 3] +
+                t * 4 * a[..., 4]))
+        )
+
+
+BACKENDS = {
+    "coolprop": BackendCoolProp,
+    "tabela": BackendTabela,
+    "nasa7": BackendNasa7.ajusta,
+}
+
+
+@lru_cache(maxsize=32)
+def cria_backend(tipo, compostos, press=101325, temp_ref=298):
+    """
+        Constrói (uma única vez por processo) o backend de entalpia do tipo
+        indicado para a tupla de compostos.
+
+        Parâmetros:
+        · tipo - "coolprop", "tabela" ou "nasa7";
+        · compostos - tupla com os nomes dos compostos (CoolProp);
+        · press (opcional) - pressão em Pa;
+        · temp_ref (opcional) - temperatura do estado de referência em K.
+    """
+    try:
+        construtor = BACKENDS[tipo.lower()]
+    except KeyError:
+        raise AttributeError(
+            f"Backend de entalpia '{tipo}' desconhecido. Opções: "
+            f"{', '.join(BACKENDS)}."
+        ) from None
+    return construtor(tuple(compostos), press=press, temp_ref=temp_ref)
+
+
+def valida_backend(backend, temps=None):
+    """
+        Compara o backend com o PropsSI (gás ideal) e reporta o desvio
+        máximo da entalpia sensível de cada composto.
+
+        Parâmetros:
+        · backend - instância de um dos backends deste módulo;
+        · temps (opcional) - temperaturas de verificação em K, por padrão
+        500 pontos entre 250 e 3500 K fora da malha da tabela.
+
+        Retornos:
+        · DataFrame indexado pelos compostos com o desvio absoluto máximo
+        (J/mol), o desvio relativo máximo e a temperatura onde ocorreu.
+        Estados não suportados pelo CoolProp são ignorados.
+
+        Um cp não positivo em alguma temperatura (h não crescente) resulta
+        em ValueError.
+    """
+    if temps is None:
+        temps = np.linspace(250.3, 3499.7, 500)
+    temps = np.asarray(temps, dtype=float)
+
+    cp = backend.cp(temps)
+    invalidos = [
+        f"{c} ({temps[np.argmin(cp[:, j])]:.1f} K)"
+            for j, c in enumerate(backend.compostos) if cp[:, j].min() <= 0
+    ]
+    if invalidos:
+        raise ValueError(
+            f"cp não positivo no backend {backend.tipo}: "
+            f"{', '.join(invalidos)}."
+        )
+
+    h_backend = backend.h_sensivel(temps)
+    linhas = []
+    for j, c in enumerate(backend.compostos):
+        conta("propssi")
+        h_ref = PropsSI(
+            H_GAS_IDEAL, 'T', backend.temp_ref, 'P', backend.press, c
+        )
+        h_exato = _propssi_vetor(
+            H_GAS_IDEAL, c, backend.press, tuple(temps)
+        ) - h_ref
+        desvio = np.abs(h_backend[:, j] - h_exato)
+        relativo = desvio / np.maximum(np.abs(h_exato), 1.0)
+        i = np.nanargmax(desvio)
+        linhas.append(
+            [np.nanmax(desvio), np.nanmax(relativo), temps[i]]
+        )
+
+    return pd.DataFrame(
+        linhas,
+        index=list(backend.compostos),
+        columns=["desvio_max", "desvio_rel_max", "temp_desvio_max"]
+    )
@@ -0,0 +1,326 @@
+"""
+    Equilíbrio químico adiabático a pressão constante (HP) sem o Cantera,
+    vetorizado sobre lotes de pontos de operação.
+
+    A temperatura adiabática de `temp_adiabatica` supõe combustão completa
+    e superestima a temperatura quando há dissociação. Aqui os produtos são
+    as espécies gasosas ideais CO, CO2, H2, H2O, O2, N2, OH, H, O e NO, cuja
+    composição minimiza a energia de Gibbs sob o balanço de elementos (C,
+    H, O, N) e de entalpia. O sistema é resolvido pelo método dos
+    potenciais de elementos (Gordon e McBride, NASA RP-1311, 1994): a cada
+    iteração de Newton é resolvido um sistema linear de ordem
+    n_elementos + 2 por ponto, empilhado em um único np.linalg.solve.
+
+    As propriedades termodinâmicas vêm dos polinômios NASA-7 do GRI-Mech
+    3.0 (dados/nasa7_gri30.npz), que podem ser extraídos novamente do
+    Cantera com:
+
+        python -m gasmistura_pkg.equilibrio --atualiza
+"""
+import argparse
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+
+from .estequiometria import ELEMENTOS
+from .estequiometria import matriz_elementar
+from .instrumentacao import metricas_ativas
+
+CAMINHO_NASA7 = Path(__file__).parent / "dados" / "nasa7_gri30.npz"
+
+ESPECIES = ("CO", "CO2", "H2", "H2O", "O2", "N2", "OH", "H", "O", "NO")
+ELEMENTOS_EQUILIBRIO = ("C", "H", "O", "N")
+
+# Espécies extraídas do mecanismo: produtos e combustíveis usuais
+_ESPECIES_BANCO = ESPECIES + (
+    "CH4", "C2H6", "C2H4", "C2H2", "C3H8", "N2O", "NO2", "NH3", "HCN"
+)
+
+P_REF = 101325.0  # Pa - pressão de referência dos polinômios
+
+# Fração molar abaixo da qual uma espécie é considerada minoritária no
+# controle do passo (NASA RP-1311, eq. 3.1 e 3.2)
+_FRACAO_MINORITARIA = 1e-8
+_LN_FRACAO_MIN = -9.2103404
+
+
+@lru_cache(maxsize=None)
+def carrega_nasa7(caminho=CAMINHO_NASA7):
+    """
+        Lê o banco de polinômios NASA-7.
+
+        Retornos:
+        · dict - índice composto -> array (2, 7) com os coeficientes do
+        intervalo inferior e superior;
+        · float - temperatura de transição entre os intervalos em K;
+        · str - versão do banco.
+    """
+    with np.load(caminho, allow_pickle=False) as arq:
+        compostos = arq["compostos"].tolist()
+        coefs = arq["coefs"]
+        temp_medio = float(arq["temp_medio"])
+        versao = str(arq["versao"])
+    return dict(zip(compostos, coefs)), temp_medio, versao
+
+
+def _coeficientes(compostos, caminho=CAMINHO_NASA7):
+    indice, temp_medio, _ = carrega_nasa7(caminho)
+    faltantes = [c for c in compostos if c not in indice]
+    if faltantes:
+        raise KeyError(
+            f"Polinômios NASA-7 ausentes do banco {caminho}: "
+            f"{', '.join(faltantes)}."
+        )
+    return np.array([indice[c] for c in compostos]), temp_medio
+
+
+def _termo(coefs, temp_medio, temp):
+    """
+        Propriedades adimensionais no estado padrão para temperaturas (N,).
+
+        Retornos:
+        · h/RT, s/R e cp/R, arrays (N, n_compostos).
+    """
+    t = temp[:, None]
+    um, zero = np.ones_like(t), np.zeros_like(t)
+    potencias = t ** np.arange(5)
+    base = np.stack([
+        np.hstack([potencias, zero, zero]),
+        np.hstack([potencias / np.arange(1, 6), 1 / t, zero]),
+        np.hstack([np.log(t), potencias[:, 1:] / np.arange(1, 5), zero, um]),
+    ])
+    # Ambos os intervalos de uma vez: (3, N, 7) @ (7, 2 * n_compostos)
+    valores = base @ coefs.reshape(-1, 7).T
+    alto = temp >= temp_medio
+    cp, h, s = np.where(alto[:, None], valores[..., 1::2], valores[..., ::2])
+    return h, s, cp
+
+
+def _matriz_elementos(compostos):
+    """
+        Matriz (n_compostos, 4) restrita aos elementos C, H, O e N.
+    """
+    matriz = matriz_elementar(compostos)
+    colunas = [ELEMENTOS.index(e) for e in ELEMENTOS_EQUILIBRIO]
+    outras = np.delete(matriz, colunas, axis=1)
+    if outras.any():
+        raise ValueError(
+            "O equilíbrio nativo admite apenas compostos de "
+            f"{', '.join(ELEMENTOS_EQUILIBRIO)}: {', '.join(compostos)}."
+        )
+    return matriz[:, colunas]
+
+
+def equilibrio_hp(
+    n_reagentes,
+    reagentes,
+    temp_reagentes = 298.15,
+    press = 101325.0,
+    especies = ESPECIES,
+    temp_inicial = 2000.0,
+    tol = 5e-6,
+    nmax_iter = 100,
+    caminho = CAMINHO_NASA7,
+):
+    """
+        Temperatura e composição de equilíbrio adiabático a pressão
+        constante de N pontos de operação.
+
+        Parâmetros:
+        · n_reagentes - array (n_reagentes,) ou (N, n_reagentes) com as
+        vazões molares (ou mols) dos reagentes de cada ponto;
+        · reagentes - sequência com as fórmulas químicas das colunas de
+        n_reagentes (compostos de C, H, O e N presentes no banco);
+        · [temp_reagentes] opcional - float ou array (N,) com a temperatura
+        dos reagentes em K;
+        · [press] opcional - float ou array (N,) com a pressão em Pa;
+        · [especies] opcional - espécies dos produtos;
+        · [temp_inicial] opcional - estimativa inicial da temperatura em K;
+        · [tol] opcional - tolerância relativa da variação dos mols (a
+        variação de ln T é limitada a 1e-4);
+        · [nmax_iter] opcional - número máximo de iterações;
+        · [caminho] opcional - banco de polinômios NASA-7.
+
+        Espécies que contêm elementos ausentes dos reagentes de um ponto
+        são excluídas desse ponto.
+
+        Retornos:
+        · array (N,) - temperatura de equilíbrio em K;
+        · array (N, n_especies) - mols (ou vazões molares) de equilíbrio;
+        · array (N,) de booleanos - máscara de convergência por ponto;
+        · dict - número de iterações.
+    """
+    n_reagentes = np.atleast_2d(np.asarray(n_reagentes, dtype=float))
+    n_pontos = len(n_reagentes)
+    especies = tuple(especies)
+    n_elem = len(ELEMENTOS_EQUILIBRIO)
+
+    coefs_r, medio_r = _coeficientes(tuple(reagentes), caminho)
+    coefs, medio = _coeficientes(especies, caminho)
+    a_r = _matriz_elementos(tuple(reagentes))
+    a = _matriz_elementos(especies)
+
+    # Base: um mol de reagentes por ponto
+    escala = n_reagentes.sum(axis=1)
+    x_r = n_reagentes / escala[:, None]
+    b0 = x_r @ a_r
+    temp_r = np.broadcast_to(
+        np.asarray(temp_reagentes, dtype=float), (n_pontos,)
+    )
+    h_r, _, _ = _termo(coefs_r, medio_r, temp_r)
+    h0 = np.einsum("ij,ij->i", x_r, h_r) * temp_r  # H/R em K
+    ln_p = np.log(
+        np.broadcast_to(np.asarray(press, dtype=float), (n_pontos,)) / P_REF
+    )
+
+    presentes = b0 > 1e-12 * b0.max(axis=1, keepdims=True)
+    ativas = ~((a[None, :, :] > 0) & ~presentes[:, None, :]).any(axis=2)
+
+    n_j = np.where(ativas, 1 / ativas.sum(axis=1, keepdims=True), 0.)
+    n_tot = np.full(n_pontos, 0.1 * len(especies))
+    temp = np.full(n_pontos, float(temp_inicial))
+    convergiu = np.zeros(n_pontos, dtype=bool)
+    pendentes = np.arange(n_pontos)
+    identidade = np.eye(n_elem)
+
+    metricas = metricas_ativas()
+    n_iter = 0
+    while pendentes.size and n_iter < nmax_iter:
+        n_iter += 1
+        p = pendentes
+        nj, at, t = n_j[p], ativas[p], temp[p]
+        h, s, cp = _termo(coefs, medio, t)
+        with np.errstate(divide="ignore"):
+            ln_x = np.where(at, np.log(nj / n_tot[p, None]), 0.)
+        mu = np.where(at, h - s + ln_x + ln_p[p, None], 0.)
+
+        # Sistema de Newton (RP-1311, eq. 2.24, 2.26 e 2.27 para HP)
+        b = nj @ a
+        nh = nj * h
+        m = np.zeros((p.size, n_elem + 2, n_elem + 2))
+        m[:, :n_elem, :n_elem] = np.einsum("ji,nj,jk->nik", a, nj, a)
+        m[:, :n_elem, n_elem] = b
+        m[:, :n_elem, n_elem + 1] = nh @ a
+        m[:, n_elem, :n_elem] = b
+        m[:, n_elem, n_elem] = nj.sum(axis=1) - n_tot[p]
+        m[:, n_elem, n_elem + 1] = nh.sum(axis=1)
+        m[:, n_elem + 1, :n_elem] = nh @ a
+        m[:, n_elem + 1, n_elem] = nh.sum(axis=1)
+        m[:, n_elem + 1, n_elem + 1] = (nj * cp).sum(axis=1) +\
+            (nh * h).sum(axis=1)
+
+        rhs = np.empty((p.size, n_elem + 2))
+        rhs[:, :n_elem] = b0[p] - b + (nj * mu) @ a
+        rhs[:, n_elem] = n_tot[p] - nj.sum(axis=1) + (nj * mu).sum(axis=1)
+        residuo = h0[p] / t - nh.sum(axis=1)
+        rhs[:, n_elem + 1] = residuo + (nh * mu).sum(axis=1)
+        if metricas is not None:
+            metricas.contadores["avaliacoes_residuo"] += p.size
+            if metricas.rastreio is not None:
+                metricas.rastreio("equilibrio_hp", n_iter, t, residuo)
+
+        # Elementos ausentes: equação trivial π = 0
+        ausentes = ~presentes[p]
+        m[:, :n_elem, :n_elem] += ausentes[:, :, None] * identidade
+        rhs[:, :n_elem] *= ~ausentes
+
+        x = np.linalg.solve(m, rhs[..., None])[..., 0]
+        pi, d_ln_n, d_ln_t = x[:, :n_elem], x[:, n_elem], x[:, n_elem + 1]
+        d_ln_nj = -mu + h * d_ln_t[:, None] + pi @ a.T + d_ln_n[:, None]
+        d_ln_nj = np.where(at, d_ln_nj, 0.)
+
+        # Controle do passo (RP-1311, eq. 3.1 a 3.3)
+        fracao = nj / n_tot[p, None]
+        maiores = at & (fracao > _FRACAO_MINORITARIA)
+        maior_passo = np.maximum.reduce([
+            5 * np.abs(d_ln_t),
+            5 * np.abs(d_ln_n),
+            np.where(maiores, np.abs(d_ln_nj), 0.).max(axis=1),
+        ])
+        with np.errstate(divide="ignore", invalid="ignore"):
+            lam1 = np.where(maior_passo > 2, 2 / maior_passo, 1.)
+            menores = at & ~maiores & (d_ln_nj >= 0)
+            lam2 = np.abs(
+                (-ln_x - _LN_FRACAO_MIN) / (d_ln_nj - d_ln_n[:, None])
+            )
+            lam2 = np.where(menores & np.isfinite(lam2), lam2, np.inf)
+        lam = np.minimum(np.minimum(lam1, lam2.min(axis=1)), 1.)
+
+        with np.errstate(over="ignore", under="ignore"):
+            n_j[p] = np.where(
+                at, nj * np.exp(np.minimum(lam[:, None] * d_ln_nj, 50)), 0.
+            )
+        n_tot[p] *= np.exp(lam * d_ln_n)
+        temp[p] = np.clip(t * np.exp(lam * d_ln_t), 200., 6000.)
+
+        soma = n_j[p].sum(axis=1)
+        fim = (np.abs(nj * d_ln_nj).max(axis=1) / soma < tol) &\
+            (np.abs(d_ln_t) < 1e-4) & (np.abs(d_ln_n) < tol)
+        convergiu[p[fim]] = True
+        pendentes = p[~fim]
+
+    if metricas is not None:
+        metricas.contadores["iteracoes"] += n_iter
+    return temp, n_j * escala[:, None], convergiu, {"n_iter": n_iter}
+
+
+def atualiza_nasa7(
+    mecanismo="gri30.yaml", destino=CAMINHO_NASA7, compostos=_ESPECIES_BANCO
+):
+    """
+        Extrai os polinômios NASA-7 de um mecanismo do Cantera e grava o
+        banco do pacote (requer cantera).
+
+        Retornos:
+        · int - número de compostos gravados.
+    """
+    import cantera as ct
+
+    gas = ct.Solution(mecanismo)
+    coefs = np.zeros((len(compostos), 2, 7))
+    medios = set()
+    for j, c in enumerate(compostos):
+        # Nomes do mecanismo em maiúsculas (ex.: "AR")
+        termo = gas.species(c.upper()).thermo
+        if termo.n_coeffs != 15:
+            raise ValueError(
+                f"'{c}' não usa polinômios NASA-7 em {mecanismo}."
+            )
+        medios.add(float(termo.coeffs[0]))
+        coefs[j, 1] = termo.coeffs[1:8]
+        coefs[j, 0] = termo.coeffs[8:15]
+    if len(medios) != 1:
+        raise ValueError("Temperaturas de transição distintas entre espécies.")
+
+    destino = Path(destino)
+    destino.parent.mkdir(parents=True, exist_ok=True)
+    np.savez(
+        destino,
+        compostos=np.asarray(compostos, dtype=str),
+        coefs=coefs,
+        temp_medio=np.asarray(medios.pop()),
+        versao=np.asarray(
+            f"{Path(mecanismo).name} (Cantera {ct.__version__})"
+        ),
+    )
+    carrega_nasa7.cache_clear()
+    return len(compostos)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Banco de polinômios NASA-7 do equilíbrio nativo."
+    )
+    parser.add_argument("--atualiza", action="store_true",
+        help="extrai os polinômios do mecanismo (requer cantera)")
+    parser.add_argument("--mecanismo", default="gri30.yaml")
+    parser.add_argument("--destino", default=CAMINHO_NASA7)
+    args = parser.parse_args()
+
+    if args.atualiza:
+        n = atualiza_nasa7(args.mecanismo, args.destino)
+        print(f"{n} compostos gravados em {args.destino}.")
+    else:
+        _, temp_medio, versao = carrega_nasa7(args.destino)
+        print(f"Banco {args.destino}: {versao}, transição a {temp_medio} K.")
@@ -0,0 +1,206 @@
+"""
+    Temperatura adiabática de chama e composição de equilíbrio de uma
+    mistura combustível/ar em função da razão de equivalência, incluindo a
+    formação de carbono sólido (versão em biblioteca de
+    `arquivo/teste.py`).
+
+    Um único objeto ct.Mixture é reaproveitado ao longo da varredura e cada
+    ponto parte, quando possível, do equilíbrio do ponto anterior. A faixa
+    de razões de equivalência pode ser dividida em partes contíguas
+    calculadas em processos distintos.
+
+    Uso pela linha de comando:
+
+        python -m gasmistura_pkg.equilibrio_cantera [--plot]
+
+    Requer: cantera >= 2.5.0
+"""
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+import cantera as ct
+import numpy as np
+
+from .mecanismos import caminho_mecanismo
+
+
+def _entalpia(mix):
+    return sum(
+        mix.phase_moles(i) * mix.phase(i).enthalpy_mole
+            for i in range(mix.n_phases)
+    )
+
+
+def _cp(mix):
+    return sum(
+        mix.phase_moles(i) * mix.phase(i).cp_mole
+            for i in range(mix.n_phases)
+    )
+
+
+def _estado_inicial(mix, n_equilibrio, delta_reagentes, temp_anterior, h0):
+    """
+        Ajusta a mistura para partir do equilíbrio anterior, somando a
+        variação dos reagentes (o que preserva o balanço de elementos) e
+        corrigindo a temperatura para manter a entalpia dos reagentes h0.
+        Retorna False quando a composição resultante tem mols negativos.
+    """
+    inicial = n_equilibrio + delta_reagentes
+    if inicial.min() < -1e-14:
+        return False
+
+    mix.species_moles = np.maximum(inicial, 0)
+    temp = temp_anterior
+    for _ in range(20):
+        mix.T = temp
+        passo = (h0 - _entalpia(mix)) / _cp(mix)
+        temp += passo
+        if abs(passo) < 1e-6:
+            break
+    mix.T = temp
+    return True
+
+
+def _varre_parte(
+    phi, combustivel, oxidante, temp, press, mecanismo, fase_solida,
+    solver, max_steps
+):
+    """
+        Calcula uma parte contígua da varredura (executado nos processos
+        filhos, que constroem seus próprios objetos do Cantera).
+    """
+    gas = ct.Solution(caminho_mecanismo(mecanismo))
+    fases = [(gas, 1.0)]
+    if fase_solida is not None:
+        fases.append((ct.Solution(fase_solida), 0.0))
+    mix = ct.Mixture(fases)
+    opcoes = {"solver": solver, "max_steps": max_steps}
+
+    tad = np.zeros(len(phi))
+    moles = np.zeros((len(phi), mix.n_species))
+    reagentes_anterior = None
+    for i, p in enumerate(phi):
+        gas.TP = temp, press
+        gas.set_equivalence_ratio(p, combustivel, oxidante)
+        reagentes = np.zeros(mix.n_species)
+        reagentes[:gas.n_species] = gas.X
+
+        mix.species_moles = reagentes
+        mix.T = temp
+        mix.P = press
+        continua = False
+        if reagentes_anterior is not None:
+            continua = _estado_inicial(
+                mix, moles[i - 1], reagentes - reagentes_anterior,
+                tad[i - 1], _entalpia(mix)
+            )
+        if solver == "vcs":
+            opcoes["estimate_equil"] = 0 if continua else -1
+
+        mix.equilibrate('HP', **opcoes)
+        tad[i] = mix.T
+        moles[i] = mix.species_moles
+        reagentes_anterior = reagentes
+
+    return tad, moles, mix.species_names
+
+
+def varre_equilibrio(
+    phi,
+    combustivel = "CH4",
+    oxidante = "O2:1.0, N2:3.76",
+    temp = 300.0,
+    press = 101325.0,
+    mecanismo = "gri30.yaml",
+    fase_solida = "graphite.yaml",
+    solver = "vcs",
+    max_steps = 1000,
+    n_processos = 0,
+    n_partes = None,
+):
+    """
+        Equilíbrio adiabático a pressão constante (HP) para cada razão de
+        equivalência.
+
+        Parâmetros:
+        · phi - array com as razões de equivalência;
+        · [combustivel] opcional - composição do combustível;
+        · [oxidante] opcional - composição do oxidante;
+        · [temp] opcional - temperatura inicial da mistura em K;
+        · [press] opcional - pressão em Pa;
+        · [mecanismo] opcional - mecanismo da fase gasosa, arquivo ou nome
+        abreviado (ver mecanismos.py);
+        · [fase_solida] opcional - fase de carbono sólido ou None;
+        · [solver] opcional - "vcs" ou "gibbs" (ver ct.Mixture.equilibrate);
+        · [max_steps] opcional - número máximo de passos do solver;
+        · [n_processos] opcional - número de processos; 0 executa no
+        processo corrente;
+        · [n_partes] opcional - número de partes contíguas da faixa de phi,
+        por padrão igual ao número de processos.
+
+        Retornos:
+        · array estruturado com os campos "phi", "T" (K) e os mols de
+        equilíbrio de cada espécie, uma linha por razão de equivalência.
+    """
+    phi = np.asarray(phi, dtype=float)
+    argumentos = (
+        combustivel, oxidante, temp, press, mecanismo, fase_solida, solver,
+        max_steps
+    )
+
+    if n_processos == 0:
+        partes = [_varre_parte(phi, *argumentos)]
+    else:
+        fatias = np.array_split(phi, n_partes or n_processos)
+        with ProcessPoolExecutor(max_workers=n_processos) as pool:
+            futuros = [
+                pool.submit(_varre_parte, f, *argumentos) for f in fatias
+            ]
+            partes = [f.result() for f in futuros]
+
+    nomes = partes[0][2]
+    resultado = np.zeros(
+        len(phi), dtype=[("phi", float), ("T", float)] +\
+            [(n, float) for n in nomes]
+    )
+    resultado["phi"] = phi
+    resultado["T"] = np.concatenate([p[0] for p in partes])
+    moles = np.concatenate([p[1] for p in partes])
+    for j, n in enumerate(nomes):
+        resultado[n] = moles[:, j]
+    return resultado
+
+
+def salva_equilibrio(resultado, destino):
+    """
+        Grava o resultado de varre_equilibrio em formato colunar (.npz, um
+        array por campo) em uma única operação.
+    """
+    np.savez(destino, **{n: resultado[n] for n in resultado.dtype.names})
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Temperatura adiabática de equilíbrio em função de phi."
+    )
+    parser.add_argument("--npontos", type=int, default=50)
+    parser.add_argument("--processos", type=int, default=0)
+    parser.add_argument("--destino", default="adiabatic.npz")
+    parser.add_argument("--mecanismo", default="gri30.yaml",
+        help='arquivo ou nome abreviado, por exemplo "reduzido"')
+    parser.add_argument("--plot", action="store_true")
+    args = parser.parse_args()
+
+    phi = np.linspace(0.3, 3.5, args.npontos)
+    resultado = varre_equilibrio(
+        phi, mecanismo=args.mecanismo, n_processos=args.processos
+    )
+    salva_equilibrio(resultado, args.destino)
+    print('Output written to {0}'.format(args.destino))
+
+    if args.plot:
+        import matplotlib.pyplot as plt
+        plt.plot(resultado["phi"], resultado["T"])
+        plt.xlabel('Equivalence ratio')
+        plt.ylabel('Adiabatic flame temperature [K]')
+        plt.show()
@@ -0,0 +1,129 @@
+"""
+    Balanço estequiométrico da combustão completa baseado na matriz de
+    composição elementar dos compostos.
+
+    Cada composto é decomposto nos elementos C, H, O, N, S e Ar a partir da
+    sua fórmula química, de modo que qualquer lista de compostos (C2H6, H2S,
+    ...) pode ser balanceada sem alteração de código. Os cálculos aceitam
+    lotes de composições em arrays (N, n_compostos) e se reduzem a
+    multiplicações de matrizes.
+"""
+import re
+from functools import lru_cache
+
+import numpy as np
+
+ELEMENTOS = ("C", "H", "O", "N", "S", "Ar")
+
+# Produtos da combustão completa, na ordem das colunas retornadas
+PRODUTOS = ("CO2", "H2O", "N2", "O2", "SO2", "Ar")
+
+# Mols de O2 consumidos por mol de cada elemento na combustão completa
+_DEMANDA_O2 = np.array([1., 1/4, -1/2, 0., 1., 0.])
+
+# Mols de cada produto por mol de elemento (linhas: ELEMENTOS)
+_PRODUTOS_ELEMENTOS = np.array([
+    #CO2  H2O   N2    O2    SO2  Ar
+    [1.,  0.,   0.,  -1.,   0.,  0.],  # C
+    [0.,  1/2,  0.,  -1/4,  0.,  0.],  # H
+    [0.,  0.,   0.,   1/2,  0.,  0.],  # O
+    [0.,  0.,   1/2,  0.,   0.,  0.],  # N
+    [0.,  0.,   0.,  -1.,   1.,  0.],  # S
+    [0.,  0.,   0.,   0.,   0.,  1.],  # Ar
+])
+
+_PADRAO_FORMULA = re.compile(r"([A-Z][a-z]?)(\d*)")
+
+
+@lru_cache(maxsize=None)
+def composicao_elementar(formula):
+    """
+        Decompõe uma fórmula química (ex.: "C2H6") em um dicionário
+        elemento -> número de átomos.
+    """
+    if "".join(m.group(0) for m in _PADRAO_FORMULA.finditer(formula)) \
+            != formula:
+        raise ValueError(f"Fórmula química '{formula}' não reconhecida.")
+
+    atomos = {}
+    for elemento, n in _PADRAO_FORMULA.findall(formula):
+        if elemento not in ELEMENTOS:
+            raise ValueError(
+                f"Elemento '{elemento}' de '{formula}' não suportado. "
+                f"Elementos disponíveis: {', '.join(ELEMENTOS)}."
+            )
+        atomos[elemento] = atomos.get(elemento, 0) + int(n or 1)
+    return atomos
+
+
+@lru_cache(maxsize=None)
+def _matriz_elementar(compostos):
+    matriz = np.zeros((len(compostos), len(ELEMENTOS)))
+    for i, c in enumerate(compostos):
+        for elemento, n in composicao_elementar(c).items():
+            matriz[i, ELEMENTOS.index(elemento)] = n
+    matriz.flags.writeable = False
+    return matriz
+
+
+def matriz_elementar(compostos):
+    """
+        Retorna a matriz (n_compostos, n_elementos) com o número de átomos
+        de cada elemento (colunas na ordem de ELEMENTOS) por composto.
+    """
+    return _matriz_elementar(tuple(compostos))
+
+
+def o2_teorico(vazoes, compostos):
+    """
+        Calcula a quantidade de O2 necessária para a combustão completa.
+
+        Parâmetros:
+        · vazoes - array (n_compostos,) ou (N, n_compostos) com as vazões
+        molares (ou frações) dos compostos;
+        · compostos - sequência com as fórmulas químicas das colunas.
+
+        Retornos:
+        · float ou array (N,) com a vazão molar de O2 teórico. O oxigênio
+        já presente nos compostos é descontado.
+    """
+    return np.asarray(vazoes, dtype=float) @ (
+        matriz_elementar(compostos) @ _DEMANDA_O2
+    )
+
+
+def produtos_combustao(vazoes, compostos, o2_ar=None, razao_n2_o2=3.72):
+    """
+        Calcula os produtos da combustão completa de um lote de composições.
+
+        Parâmetros:
+        · vazoes - array (n_compostos,) ou (N, n_compostos) com as vazões
+        molares dos compostos combustíveis e inertes;
+        · compostos - sequência com as fórmulas químicas das colunas;
+        · [o2_ar] opcional - float ou array (N,) com o O2 fornecido pelo
+        ar de combustão. Quando omitido, o ar teórico é utilizado;
+        · [razao_n2_o2] opcional - mols de N2 por mol de O2 no ar.
+
+        Retornos:
+        · array (n_produtos,) ou (N, n_produtos) com as vazões molares dos
+        produtos na ordem de PRODUTOS. O O2 em excesso aparece na coluna
+        "O2" e uma deficiência de ar resulta em O2 negativo;
+        · float ou array (N,) com o O2 fornecido pelo ar.
+    """
+    vazoes = np.asarray(vazoes, dtype=float)
+    elementos = vazoes @ matriz_elementar(compostos)
+    teorico = o2_ar is None
+    if teorico:
+        o2_ar = elementos @ _DEMANDA_O2
+    o2_ar = np.asarray(o2_ar, dtype=float)
+
+    # O ar fornece 2 átomos de O e 2·razao_n2_o2 átomos de N por mol de O2
+    elementos = elementos.copy()
+    elementos[..., ELEMENTOS.index("O")] += 2 * o2_ar
+    elementos[..., ELEMENTOS.index("N")] += 2 * razao_n2_o2 * o2_ar
+
+    produtos = elementos @ _PRODUTOS_ELEMENTOS
+    if teorico:
+        produtos[..., PRODUTOS.index("O2")] = 0.
+
+    return produtos, o2_ar
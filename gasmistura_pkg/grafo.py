@@ -0,0 +1,263 @@
+"""
+    Cadeia de cálculo (ver processo.py) como grafo de nós memorizados.
+
+    Cada nó corresponde a uma etapa da cadeia:
+
+        mistura     -> mma, z_m, fmol          (mm_aparente_mistura)
+        vazoes      -> vaz_mass, vaz_mol, vazoes (corr_vazao_normal)
+        ar_teorico  -> prod_teo, o2_teo        (balanço com ar teórico)
+        produtos    -> o2_ar, produtos         (O2 livre e balanço final)
+        tad         -> tad, convergiu          (temperatura adiabática)
+
+    A chave de uma entrada é o hash do seu conteúdo e a chave de um nó é o
+    hash do seu nome e do conteúdo dos resultados das suas dependências.
+    Ao alterar uma entrada (por exemplo, o fator de O2 livre), somente os
+    nós a jusante dela são reavaliados; os demais são lidos do cache, um
+    CacheLRU de tamanho configurável compartilhado pelos nós. Um nó
+    reavaliado com o mesmo resultado (por exemplo, uma entrada informada
+    como escalar e depois como array de um ponto) não invalida os nós a
+    jusante.
+"""
+import hashlib
+
+import numpy as np
+
+from .processo import etapa_ar_teorico
+from .processo import etapa_mistura
+from .processo import etapa_produtos
+from .processo import etapa_tad
+from .processo import etapa_vazoes
+from .processo import monta_resultado
+from .processo import normaliza_entradas
+from .propriedades import CacheLRU
+
+# nó -> (saídas, dependências na ordem dos argumentos da etapa, etapa)
+NOS = {
+    "mistura": (
+        ("mma", "z_m", "fmol"),
+        ("compostos", "fracao", "t_fracao", "mmolar"),
+        etapa_mistura,
+    ),
+    "vazoes": (
+        ("vaz_mass", "vaz_mol", "vazoes"),
+        ("mma", "z_m", "fmol", "vazao_nm3h", "temp_entrada"),
+        etapa_vazoes,
+    ),
+    "ar_teorico": (
+        ("prod_teo", "o2_teo"),
+        ("compostos", "vazoes", "razao_n2_o2"),
+        etapa_ar_teorico,
+    ),
+    "produtos": (
+        ("o2_ar", "produtos"),
+        ("compostos", "vazoes", "prod_teo", "o2_teo", "fator_o2",
+            "razao_n2_o2"),
+        etapa_produtos,
+    ),
+    "tad": (
+        ("tad", "convergiu"),
+        ("compostos", "vazoes", "o2_ar", "produtos", "temp_entrada",
+            "razao_n2_o2", "backend"),
+        etapa_tad,
+    ),
+}
+
+ENTRADAS_PONTOS = ("fracao", "vazao_nm3h", "temp_entrada", "fator_o2")
+ENTRADAS = ENTRADAS_PONTOS + (
+    "compostos", "t_fracao", "mmolar", "razao_n2_o2", "backend"
+)
+
+_ORIGEM = {
+    saida: no for no, (saidas, _, _) in NOS.items() for saida in saidas
+}
+
+
+def _hash(*partes):
+    h = hashlib.blake2b(digest_size=16)
+    for parte in partes:
+        if isinstance(parte, np.ndarray):
+            h.update(f"{parte.dtype}{parte.shape}".encode())
+            h.update(np.ascontiguousarray(parte).tobytes())
+        else:
+            h.update(repr(parte).encode())
+        h.update(b"|")
+    return h.hexdigest()
+
+
+def _somente_leitura(valor):
+    if isinstance(valor, np.ndarray):
+        valor.flags.writeable = False
+    return valor
+
+
+class GrafoProcesso:
+    """
+        Cadeia de cálculo memorizada por nó.
+
+        Parâmetros:
+        · compostos - sequência com as fórmulas químicas do gás combustível;
+        · [t_fracao] opcional - "fmol" ou "fmass" (ver mm_aparente_mistura);
+        · [mmolar] opcional - massas molares em g/mol ou None (CoolProp);
+        · [razao_n2_o2] opcional - mols de N2 por mol de O2 no ar;
+        · [backend] opcional - backend de entalpia (ver entalpia.py);
+        · [tamanho_cache] opcional - número máximo de resultados de nós
+        mantidos no cache.
+
+        As entradas por ponto (fracao, vazao_nm3h, temp_entrada e
+        fator_o2, como em calcula_processo) são informadas por `define`.
+        Os arrays retornados são compartilhados com o cache e, portanto,
+        somente leitura.
+    """
+
+    def __init__(
+        self,
+        compostos,
+        t_fracao = "fmol",
+        mmolar = None,
+        razao_n2_o2 = 3.72,
+        backend = "tabela",
+        tamanho_cache = 128,
+    ):
+        self._cache = CacheLRU(tamanho_cache)
+        self._brutas = {}
+        self._valores = {}
+        self._chaves = {}
+        self._estatisticas = {no: {"acertos": 0, "faltas": 0} for no in NOS}
+        self.ultima_execucao = {}
+        self._atuais = {}
+        self.define(
+            compostos=tuple(compostos),
+            t_fracao=t_fracao,
+            mmolar=None if mmolar is None else tuple(mmolar),
+            razao_n2_o2=razao_n2_o2,
+            backend=backend,
+        )
+
+    def define(self, **entradas):
+        """
+            Define ou altera entradas do grafo (ver ENTRADAS). Apenas as
+            entradas informadas são substituídas.
+        """
+        desconhecidas = set(entradas) - set(ENTRADAS)
+        if desconhecidas:
+            raise KeyError(
+                "Entradas desconhecidas do grafo: "
+                f"{', '.join(sorted(desconhecidas))}."
+            )
+        if "compostos" in entradas:
+            entradas["compostos"] = tuple(entradas["compostos"])
+        self._brutas.update(entradas)
+
+        for nome in set(entradas) - set(ENTRADAS_PONTOS):
+            self._valores[nome] = entradas[nome]
+            self._chaves[nome] = _hash(nome, entradas[nome])
+
+        # As entradas por ponto são ajustadas ao número comum de pontos;
+        # a chave de cada uma depende apenas do seu conteúdo e de N
+        if all(e in self._brutas for e in ENTRADAS_PONTOS):
+            ajustadas = normaliza_entradas(
+                *(self._brutas[e] for e in ENTRADAS_PONTOS)
+            )
+            n_pontos = len(ajustadas[0])
+            for nome, valor in zip(ENTRADAS_PONTOS, ajustadas):
+                self._valores[nome] = valor
+                self._chaves[nome] = _hash(
+                    nome, np.asarray(self._brutas[nome], dtype=float),
+                    n_pontos
+                )
+
+    def _chave(self, nome):
+        """
+            Chave de uma entrada ou hash do conteúdo de uma saída de nó (o
+            nó de origem é avaliado, se necessário).
+        """
+        if nome in self._chaves:
+            return self._chaves[nome]
+        if nome in _ORIGEM:
+            no = _ORIGEM[nome]
+            self._avalia(no)
+            return self._atuais[no][2][nome]
+        raise KeyError(
+            f"Entrada '{nome}' não definida; use GrafoProcesso.define."
+        )
+
+    def _avalia(self, no):
+        saidas, dependencias, funcao = NOS[no]
+        chave = _hash(no, *(self._chave(d) for d in dependencias))
+        atual = self._atuais.get(no)
+        if atual is not None and atual[0] == chave:
+            return atual[1]
+
+        memorizado = self._cache.busca(chave)
+        if memorizado is None:
+            self._estatisticas[no]["faltas"] += 1
+            self.ultima_execucao[no] = "calculado"
+            argumentos = [self.valor(d) for d in dependencias]
+            resultado = tuple(
+                _somente_leitura(v) for v in funcao(*argumentos)
+            )
+            hashes = tuple(_hash(s, v) for s, v in zip(saidas, resultado))
+            self._cache.insere(chave, (resultado, hashes))
+        else:
+            resultado, hashes = memorizado
+            self._estatisticas[no]["acertos"] += 1
+            self.ultima_execucao[no] = "cache"
+        self._atuais[no] = (
+            chave, dict(zip(saidas, resultado)), dict(zip(saidas, hashes))
+        )
+        return self._atuais[no][1]
+
+    def valor(self, nome):
+        """
+            Valor de uma entrada ou de uma saída de nó, calculando apenas
+            os nós necessários.
+        """
+        if nome in self._valores:
+            return self._valores[nome]
+        if nome not in _ORIGEM:
+            raise KeyError(
+                f"Valor '{nome}' desconhecido ou entrada não definida."
+            )
+        return self._avalia(_ORIGEM[nome])[nome]
+
+    def calcula(self):
+        """
+            Avalia o grafo completo.
+
+            Retornos:
+            · dict no formato de calcula_processo.
+        """
+        self.ultima_execucao = {}
+        self._atuais = {}
+        v = self.valor
+        return monta_resultado(
+            v("mma"), v("z_m"), v("vaz_mass"), v("vaz_mol"), v("o2_teo"),
+            v("o2_ar"), v("produtos"), v("tad"), v("convergiu")
+        )
+
+    def info(self):
+        """
+            Estatísticas do cache.
+
+            Retornos:
+            · dict com os acertos e faltas de cada nó ("nos"), o estado de
+            cada nó na última chamada de `calcula` ("ultima_execucao") e as
+            estatísticas globais do cache ("cache").
+        """
+        return {
+            "nos": {no: dict(e) for no, e in self._estatisticas.items()},
+            "ultima_execucao": dict(self.ultima_execucao),
+            "cache": self._cache.info(),
+        }
+
+    def redimensiona_cache(self, tamanho_cache):
+        """
+            Altera o número máximo de resultados mantidos no cache.
+        """
+        self._cache.redimensiona(tamanho_cache)
+
+    def limpa_cache(self):
+        self._cache.limpa()
+        self._atuais = {}
+        for estatistica in self._estatisticas.values():
+            estatistica.update(acertos=0, faltas=0)
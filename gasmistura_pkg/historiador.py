@@ -0,0 +1,196 @@
+"""
+    Processamento em fluxo de exportações do historiador da planta.
+
+    O arquivo CSV (vazão de gás de alto-forno em Nm³/h, temperatura de
+    entrada e composição do cromatógrafo) é lido em blocos por uma thread
+    leitora, enquanto a thread principal calcula cada bloco de forma
+    vetorizada (ver processo.py) e acrescenta o resultado ao arquivo de
+    saída. A fila entre as duas etapas é limitada, de modo que o uso de
+    memória não depende do tamanho do arquivo. Se o cálculo ou a gravação
+    falhar, a thread leitora é sinalizada e encerrada antes de o erro ser
+    propagado.
+"""
+import queue
+import threading
+
+import numpy as np
+import pandas as pd
+
+from .instrumentacao import etapa
+from .processo import calcula_processo
+
+_FIM = object()
+
+# Intervalo (s) entre as verificações do sinal de parada pela leitora
+_ESPERA_FILA = 0.1
+
+
+def _enfileira(fila, item, parar):
+    """
+        Enfileira o item, desistindo se a parada for sinalizada.
+
+        Retornos:
+        · bool - True se o item foi enfileirado.
+    """
+    while not parar.is_set():
+        try:
+            fila.put(item, timeout=_ESPERA_FILA)
+            return True
+        except queue.Full:
+            pass
+    return False
+
+
+def _leitor(origem, tamanho_bloco, colunas, fila, parar):
+    """
+        Lê o CSV em blocos e os enfileira; erros são repassados pela fila.
+        Encerra sem ler o restante quando a parada é sinalizada.
+    """
+    try:
+        for bloco in pd.read_csv(
+            origem, chunksize=tamanho_bloco, usecols=colunas
+        ):
+            if not _enfileira(fila, bloco, parar):
+                return
+    except Exception as erro:
+        _enfileira(fila, erro, parar)
+    _enfileira(fila, _FIM, parar)
+
+
+def processa_historico(
+    origem,
+    destino,
+    compostos,
+    coluna_vazao,
+    coluna_temp,
+    colunas_composicao = None,
+    coluna_tempo = None,
+    fator_o2 = 0.1908,
+    temp_celsius = True,
+    escala_composicao = 0.01,
+    tamanho_bloco = 100000,
+    n_fila = 2,
+    formato = "%.8g",
+    **kwargs_processo
+):
+    """
+        Calcula a série temporal da temperatura adiabática de chama a partir
+        de uma exportação do historiador.
+
+        Parâmetros:
+        · origem - caminho (ou buffer) do CSV de entrada;
+        · destino - caminho do CSV de saída, sobrescrito;
+        · compostos - fórmulas químicas dos compostos do gás;
+        · coluna_vazao - coluna com a vazão de gás em Nm³/h;
+        · coluna_temp - coluna com a temperatura de entrada do gás;
+        · [colunas_composicao] opcional - colunas da composição, na ordem
+        de `compostos`; por padrão os próprios nomes dos compostos;
+        · [coluna_tempo] opcional - coluna de data/hora copiada à saída;
+        · [fator_o2] opcional - O2 livre sobre os gases de combustão secos,
+        float ou nome de uma coluna do arquivo;
+        · [temp_celsius] opcional - True se a temperatura estiver em °C;
+        · [escala_composicao] opcional - fator que converte a composição
+        em frações (0,01 para porcentagens);
+        · [tamanho_bloco] opcional - número de linhas por bloco;
+        · [n_fila] opcional - número máximo de blocos lidos à espera do
+        cálculo;
+        · [formato] opcional - formato dos números na saída (a conversão 
+        para texto domina o custo da gravação);
+        · demais parâmetros nomeados são repassados a calcula_processo.
+
+        Linhas com valores ausentes são gravadas com temperatura adiabática
+        NaN e convergiu=False.
+
+        Retornos:
+        · dict com o número de linhas, de blocos e de pontos sem
+        convergência.
+    """
+    if colunas_composicao is None:
+        colunas_composicao = list(compostos)
+    coluna_o2 = fator_o2 if isinstance(fator_o2, str) else None
+    colunas = [coluna_vazao, coluna_temp] + list(colunas_composicao)
+    for extra in (coluna_tempo, coluna_o2):
+        if extra is not None:
+            colunas.append(extra)
+
+    fila = queue.Queue(maxsize=n_fila)
+    parar = threading.Event()
+    leitor = threading.Thread(
+        target=_leitor,
+        args=(origem, tamanho_bloco, colunas, fila, parar),
+        name="historiador-leitor",
+        daemon=True,
+    )
+    leitor.start()
+
+    resumo = {"n_linhas": 0, "n_blocos": 0, "n_nao_convergidos": 0}
+    cabecalho = True
+    try:
+        while True:
+            bloco = fila.get()
+            if bloco is _FIM:
+                break
+            if isinstance(bloco, Exception):
+                raise bloco
+
+            saida = _calcula_bloco(
+                bloco, compostos, coluna_vazao, coluna_temp,
+                colunas_composicao, coluna_tempo, coluna_o2 or fator_o2,
+                temp_celsius, escala_composicao, kwargs_processo
+            )
+            with etapa("gravacao"):
+                saida.to_csv(
+                    destino, mode="w" if cabecalho else "a",
+                    header=cabecalho, index=False, float_format=formato
+                )
+            cabecalho = False
+
+            resumo["n_linhas"] += len(saida)
+            resumo["n_blocos"] += 1
+            resumo["n_nao_convergidos"] += int((~saida["convergiu"]).sum())
+    finally:
+        parar.set()
+        leitor.join()
+    return resumo
+
+
+def _calcula_bloco(
+    bloco, compostos, coluna_vazao, coluna_temp, colunas_composicao,
+    coluna_tempo, fator_o2, temp_celsius, escala_composicao, kwargs_processo
+):
+    """
+        Calcula um bloco do historiador e monta o DataFrame de saída.
+    """
+    vazao = bloco[coluna_vazao].to_numpy(dtype=float)
+    temp = bloco[coluna_temp].to_numpy(dtype=float)
+    if temp_celsius:
+        temp = temp + 273.15
+    fracao = bloco[colunas_composicao].to_numpy(dtype=float) *\
+        escala_composicao
+    if isinstance(fator_o2, str):
+        fator_o2 = bloco[fator_o2].to_numpy(dtype=float)
+    fator_o2 = np.broadcast_to(np.asarray(fator_o2, dtype=float), vazao.shape)
+
+    validos = np.isfinite(vazao) & np.isfinite(temp) &\
+        np.isfinite(fracao).all(axis=1) & np.isfinite(fator_o2)
+
+    saida = pd.DataFrame(index=bloco.index)
+    if coluna_tempo is not None:
+        saida[coluna_tempo] = bloco[coluna_tempo]
+    saida["vazao_nm3h"] = vazao
+    saida["temp_entrada"] = temp
+
+    resultado = calcula_processo(
+        compostos,
+        fracao[validos],
+        vazao[validos],
+        temp[validos],
+        fator_o2[validos],
+        **kwargs_processo
+    )
+    for chave, valores in resultado.items():
+        coluna = np.full(len(bloco), False if chave == "convergiu" else np.nan)
+        coluna[validos] = valores
+        saida[chave] = coluna
+
+    return saida
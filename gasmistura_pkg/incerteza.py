@@ -0,0 +1,282 @@
+"""
+    Propagação de incertezas da composição, da vazão e da temperatura de
+    entrada do gás até a temperatura adiabática da chama.
+
+    As entradas são amostradas por quase-Monte Carlo (sequência de Sobol
+    embaralhada, scipy.stats.qmc): cada fração do cromatógrafo recebe uma
+    perturbação independente e a composição é renormalizada; a vazão e a
+    temperatura de entrada recebem as perturbações do medidor e do
+    termopar. As amostras percorrem a cadeia vetorizada de `processo.py`
+    em lotes, opcionalmente distribuídos em processos, de modo que 10⁵
+    amostras custam alguns segundos.
+
+    As contribuições de cada fator para a variância da temperatura
+    adiabática são os índices de Sobol de primeira ordem, estimados a
+    partir das próprias amostras (variância das médias condicionais em
+    classes de cada fator), sem avaliações adicionais.
+
+    Uso pela linha de comando (gás de `composicao.json`, % em massa):
+
+        python -m gasmistura_pkg.incerteza --incerteza-fracao 0.5 \\
+            --incerteza-vazao 150 --incerteza-temp 2
+"""
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+from scipy.stats import norm
+from scipy.stats import qmc
+
+from .instrumentacao import coleta_metricas
+from .instrumentacao import etapa
+from .instrumentacao import incorpora
+from .processo import calcula_processo
+
+PERCENTIS_PADRAO = (2.5, 5, 25, 50, 75, 95, 97.5)
+
+# Limites das amostras uniformes antes da inversão da normal
+_LIMITE_U = 1e-12
+
+
+def amostras_sobol(n_fatores, n_amostras, distribuicao="normal",
+    semente=None):
+    """
+        Amostras padronizadas (média nula e desvio padrão unitário) de
+        fatores independentes.
+
+        Parâmetros:
+        · n_fatores - número de fatores;
+        · n_amostras - número de amostras, arredondado para a potência de
+        2 seguinte (exigência das propriedades de equilíbrio da sequência
+        de Sobol);
+        · [distribuicao] opcional - "normal" ou "uniforme";
+        · [semente] opcional - semente do embaralhamento.
+
+        Retornos:
+        · array (2**m, n_fatores).
+    """
+    m = max(int(np.ceil(np.log2(n_amostras))), 0)
+    u = qmc.Sobol(n_fatores, scramble=True, seed=semente).random_base2(m)
+    if distribuicao == "normal":
+        return norm.ppf(np.clip(u, _LIMITE_U, 1 - _LIMITE_U))
+    if distribuicao == "uniforme":
+        return np.sqrt(3) * (2 * u - 1)
+    raise ValueError(
+        f"Distribuição '{distribuicao}' desconhecida (normal, uniforme)."
+    )
+
+
+def efeitos_principais(fatores, resposta, n_classes=None):
+    """
+        Índices de Sobol de primeira ordem estimados a partir de uma única
+        amostra: para cada fator, as amostras são ordenadas e divididas em
+        classes de mesmo tamanho, e o índice é a variância das médias da
+        resposta nas classes dividida pela variância da resposta.
+
+        Parâmetros:
+        · fatores - array (N, n_fatores) das amostras dos fatores;
+        · resposta - array (N,);
+        · [n_classes] opcional - número de classes, por padrão √N.
+
+        Retornos:
+        · array (n_fatores,).
+    """
+    n = len(resposta)
+    n_classes = n_classes or max(int(np.sqrt(n)), 1)
+    variancia = resposta.var()
+    if variancia == 0:
+        return np.zeros(fatores.shape[1])
+    inicios = np.linspace(0, n, n_classes + 1).astype(int)
+    contagens = np.diff(inicios)
+    inicios = inicios[:-1]
+    media = resposta.mean()
+
+    ordenadas = resposta[np.argsort(fatores, axis=0)]
+    medias = np.add.reduceat(ordenadas, inicios, axis=0) /\
+        contagens[:, None]
+    return (contagens[:, None] * (medias - media)**2).sum(axis=0) /\
+        (n * variancia)
+
+
+def _calcula_lote(compostos, fracao, vazao_nm3h, temp_entrada, opcoes):
+    """
+        Calcula um lote de amostras (executado nos processos filhos).
+    """
+    with coleta_metricas() as metricas:
+        resultado = calcula_processo(
+            compostos, fracao, vazao_nm3h, temp_entrada, **opcoes
+        )
+    return resultado["tad"], resultado["convergiu"], metricas.resumo()
+
+
+def propaga_incerteza(
+    compostos,
+    fracao,
+    vazao_nm3h,
+    temp_entrada,
+    incerteza_fracao = 0.,
+    incerteza_vazao = 0.,
+    incerteza_temp = 0.,
+    n_amostras = 2**16,
+    distribuicao = "normal",
+    percentis = PERCENTIS_PADRAO,
+    tamanho_lote = 2**15,
+    n_processos = 0,
+    semente = None,
+    **opcoes,
+):
+    """
+        Propaga as incertezas das entradas de um ponto de operação até a
+        temperatura adiabática da chama.
+
+        Parâmetros:
+        · compostos - sequência com as fórmulas químicas do gás combustível;
+        · fracao - array (n_compostos,) com as frações nominais;
+        · vazao_nm3h - vazão normal nominal em Nm³/h;
+        · temp_entrada - temperatura nominal do gás em K;
+        · [incerteza_fracao] opcional - float ou array (n_compostos,) com o
+        desvio padrão de cada fração, na unidade de fracao; as frações
+        perturbadas negativas são anuladas e a composição é renormalizada
+        para a soma nominal;
+        · [incerteza_vazao] opcional - desvio padrão da vazão em Nm³/h;
+        · [incerteza_temp] opcional - desvio padrão da temperatura em K;
+        · [n_amostras] opcional - número de amostras (ver amostras_sobol);
+        · [distribuicao] opcional - "normal" ou "uniforme" (com o desvio
+        padrão informado);
+        · [percentis] opcional - percentis da temperatura adiabática;
+        · [tamanho_lote] opcional - amostras por chamada da cadeia;
+        · [n_processos] opcional - número de processos; 0 executa no
+        processo corrente, None usa todos os núcleos;
+        · [semente] opcional - semente do embaralhamento de Sobol;
+        · demais - fator_o2, t_fracao, mmolar, razao_n2_o2 e backend de
+        processo.calcula_processo.
+
+        Retornos:
+        · dict com as amostras "tad" (K) e a máscara "convergiu", as
+        entradas amostradas em "entradas" (DataFrame), a "media" e o
+        "desvio" padrão da temperatura adiabática, os "percentis" (Series
+        percentil -> K) e as "contribuicoes" (Series fator -> índice de
+        primeira ordem, em ordem decrescente), calculados sobre as
+        amostras convergidas.
+    """
+    compostos = list(compostos)
+    fracao = np.asarray(fracao, dtype=float)
+    if fracao.shape != (len(compostos),):
+        raise ValueError(
+            f"Frações de forma {fracao.shape} incompatíveis com "
+            f"{len(compostos)} compostos (apenas um ponto de operação)."
+        )
+    desvios = np.concatenate([
+        np.broadcast_to(np.asarray(incerteza_fracao, dtype=float),
+            fracao.shape),
+        [incerteza_vazao, incerteza_temp],
+    ])
+    nomes = compostos + ["vazao_nm3h", "temp_entrada"]
+    nominais = np.concatenate([fracao, [vazao_nm3h, temp_entrada]])
+
+    # Apenas os fatores incertos ocupam dimensões da sequência
+    incertos = np.flatnonzero(desvios > 0)
+    if not len(incertos):
+        raise ValueError("Nenhuma incerteza informada.")
+    with etapa("amostragem"):
+        padronizadas = amostras_sobol(
+            len(incertos), n_amostras, distribuicao, semente
+        )
+        entradas = np.tile(nominais, (len(padronizadas), 1))
+        entradas[:, incertos] += padronizadas * desvios[incertos]
+
+        n_comp = len(compostos)
+        fracoes = np.clip(entradas[:, :n_comp], 0., None)
+        fracoes *= fracao.sum() / fracoes.sum(axis=1, keepdims=True)
+        entradas[:, :n_comp] = fracoes
+
+    lotes = [
+        (compostos, entradas[i:i + tamanho_lote, :n_comp],
+            entradas[i:i + tamanho_lote, n_comp],
+            entradas[i:i + tamanho_lote, n_comp + 1], opcoes)
+        for i in range(0, len(entradas), tamanho_lote)
+    ]
+    # As métricas dos processos filhos são somadas à coleta ativa, se
+    # houver; no processo corrente a coleta aninhada já as repassa
+    if n_processos == 0:
+        calculados = [_calcula_lote(*lote) for lote in lotes]
+    else:
+        with ProcessPoolExecutor(max_workers=n_processos) as pool:
+            calculados = list(pool.map(_calcula_lote, *zip(*lotes)))
+        for *_, resumo in calculados:
+            incorpora(resumo)
+    tad = np.concatenate([c[0] for c in calculados])
+    convergiu = np.concatenate([c[1] for c in calculados])
+
+    with etapa("estatisticas"):
+        validas = tad[convergiu]
+        indices = efeitos_principais(
+            padronizadas[convergiu], validas
+        ) if len(validas) else np.full(len(incertos), np.nan)
+        contribuicoes = pd.Series(
+            indices, index=[nomes[j] for j in incertos]
+        ).sort_values(ascending=False)
+        resultado = {
+            "tad": tad,
+            "convergiu": convergiu,
+            "entradas": pd.DataFrame(entradas, columns=nomes),
+            "media": validas.mean() if len(validas) else np.nan,
+            "desvio": validas.std() if len(validas) else np.nan,
+            "percentis": pd.Series(
+                np.percentile(validas, percentis) if len(validas)
+                    else np.nan,
+                index=list(percentis),
+            ),
+            "contribuicoes": contribuicoes,
+        }
+    return resultado
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Propaga as incertezas do gás de composicao.json até a "
+            "temperatura adiabática da chama."
+    )
+    parser.add_argument("--composicao", default="composicao.json")
+    parser.add_argument("--incerteza-fracao", type=float, nargs="+",
+        default=[0.5], help="desvio padrão de cada fração, em %% em massa "
+            "(um valor para todos ou um por composto)")
+    parser.add_argument("--vazao", type=float, default=16344.,
+        help="vazão normal em Nm³/h")
+    parser.add_argument("--incerteza-vazao", type=float, default=0.)
+    parser.add_argument("--temp", type=float, default=368.15,
+        help="temperatura de entrada em K")
+    parser.add_argument("--incerteza-temp", type=float, default=0.)
+    parser.add_argument("--fator-o2", type=float, default=0.1908)
+    parser.add_argument("-n", "--amostras", type=int, default=2**17)
+    parser.add_argument("--processos", type=int, default=0)
+    parser.add_argument("--semente", type=int, default=None)
+    args = parser.parse_args()
+
+    df_composicao = pd.read_json(args.composicao, orient="split")
+    incerteza_fracao = args.incerteza_fracao
+    resultado = propaga_incerteza(
+        list(df_composicao.columns),
+        df_composicao.loc["% em Massa"].to_numpy(dtype=float),
+        args.vazao,
+        args.temp,
+        incerteza_fracao[0] if len(incerteza_fracao) == 1
+            else incerteza_fracao,
+        args.incerteza_vazao,
+        args.incerteza_temp,
+        n_amostras=args.amostras,
+        n_processos=args.processos,
+        semente=args.semente,
+        fator_o2=args.fator_o2,
+        t_fracao="fmass",
+    )
+    print(
+        f"{len(resultado['tad'])} amostras, "
+        f"{resultado['convergiu'].mean():.2%} convergidas; Tad = "
+        f"{resultado['media']:.1f} ± {resultado['desvio']:.1f} K"
+    )
+    print("\nPercentis (K):")
+    print(resultado["percentis"].round(1).to_string())
+    print("\nContribuições para a variância (índices de primeira ordem):")
+    print(resultado["contribuicoes"].round(3).to_string())
@@ -0,0 +1,226 @@
+"""
+    Instrumentação do cálculo: contadores, cronômetros por etapa e rastreio
+    por iteração.
+
+    A coleta fica desativada por padrão; nesse caso cada ponto
+    instrumentado custa apenas a leitura de uma variável de contexto. Para
+    ativá-la em um trecho de código:
+
+        with coleta_metricas() as metricas:
+            calcula_processo(...)
+        metricas.resumo()
+
+    Contadores registrados pelo pacote:
+    · "propssi" - chamadas ao PropsSI;
+    · "abstractstate" - atualizações de estado do AbstractState;
+    · "avaliacoes_residuo" - avaliações do resíduo de energia, por ponto;
+    · "iteracoes" - iterações dos métodos de busca.
+
+    Os tempos são acumulados por etapa da cadeia de cálculo (ver
+    processo.py). Um callback pode receber o resumo ao final do bloco, para
+    que um driver em lote agregue várias execuções com soma_resumos, e uma
+    função de rastreio opcional é chamada a cada iteração dos métodos de
+    busca. Blocos aninhados repassam suas métricas ao bloco externo.
+
+    As mensagens do pacote são emitidas pelo módulo logging, nos loggers
+    "gasmistura_pkg.*".
+
+    Os dados de cada iteração são acumulados em RegistroIteracoes e
+    gravados uma única vez, ao final, no diretório próprio da execução
+    (ver diretorio_execucao).
+"""
+import contextlib
+import contextvars
+import os
+import time
+import uuid
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+_METRICAS = contextvars.ContextVar("gasmistura_metricas", default=None)
+_NULO = contextlib.nullcontext()
+
+
+class Metricas:
+    """
+        Contadores e tempos acumulados de uma coleta.
+
+        Parâmetros:
+        · [rastreio] opcional - função chamada a cada iteração com
+        (origem, iteracao, temperatura, residuo); nos cálculos em lote
+        temperatura e residuo são os arrays dos pontos ainda ativos.
+    """
+
+    __slots__ = ("contadores", "tempos", "rastreio")
+
+    def __init__(self, rastreio=None):
+        self.contadores = Counter()
+        self.tempos = Counter()
+        self.rastreio = rastreio
+
+    @contextlib.contextmanager
+    def etapa(self, nome):
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.tempos[nome] += time.perf_counter() - inicio
+
+    def incorpora(self, resumo):
+        """
+            Soma às métricas um resumo (por exemplo, de um processo filho).
+        """
+        self.contadores.update(resumo["contadores"])
+        self.tempos.update(resumo["tempos"])
+
+    def resumo(self):
+        """
+            Retornos:
+            · dict com os dicts "contadores" e "tempos" (s), serializável
+            em JSON.
+        """
+        return {
+            "contadores": dict(self.contadores),
+            "tempos": dict(self.tempos),
+        }
+
+
+def metricas_ativas():
+    """
+        Retorna o objeto Metricas da coleta ativa ou None.
+    """
+    return _METRICAS.get()
+
+
+def conta(nome, n=1):
+    """
+        Incrementa um contador da coleta ativa (sem efeito se desativada).
+    """
+    metricas = _METRICAS.get()
+    if metricas is not None:
+        metricas.contadores[nome] += n
+
+
+def etapa(nome):
+    """
+        Gerenciador de contexto que cronometra uma etapa da coleta ativa.
+    """
+    metricas = _METRICAS.get()
+    if metricas is None:
+        return _NULO
+    return metricas.etapa(nome)
+
+
+def incorpora(resumo):
+    """
+        Soma um resumo às métricas da coleta ativa, se houver.
+    """
+    metricas = _METRICAS.get()
+    if metricas is not None:
+        metricas.incorpora(resumo)
+
+
+@contextlib.contextmanager
+def coleta_metricas(callback=None, rastreio=None):
+    """
+        Ativa a coleta de métricas no contexto corrente.
+
+        Parâmetros:
+        · [callback] opcional - função chamada com o resumo das métricas ao
+        final do bloco;
+        · [rastreio] opcional - função de rastreio por iteração (ver
+        Metricas).
+
+        Retornos:
+        · objeto Metricas da coleta.
+    """
+    externa = _METRICAS.get()
+    metricas = Metricas(rastreio)
+    token = _METRICAS.set(metricas)
+    try:
+        yield metricas
+    finally:
+        _METRICAS.reset(token)
+        if externa is not None:
+            externa.incorpora(metricas.resumo())
+        if callback is not None:
+            callback(metricas.resumo())
+
+
+def soma_resumos(resumos):
+    """
+        Agrega uma sequência de resumos de métricas em um único resumo.
+    """
+    total = Metricas()
+    for resumo in resumos:
+        total.incorpora(resumo)
+    return total.resumo()
+
+
+class RegistroIteracoes:
+    """
+        Registro das iterações de um método de busca em um buffer NumPy
+        pré-alocado, cuja capacidade dobra quando esgotada. A memória é
+        linear no número de registros e cada registro custa uma cópia de
+        uma linha.
+
+        Parâmetros:
+        · colunas - sequência com os nomes das colunas;
+        · [capacidade] opcional - número inicial de linhas do buffer.
+    """
+
+    __slots__ = ("colunas", "n", "_dados")
+
+    def __init__(self, colunas, capacidade=1024):
+        self.colunas = tuple(colunas)
+        self.n = 0
+        self._dados = np.empty((max(int(capacidade), 1), len(self.colunas)))
+
+    def __len__(self):
+        return self.n
+
+    def adiciona(self, *valores):
+        """
+            Acrescenta uma linha, com um valor por coluna.
+        """
+        if self.n == len(self._dados):
+            maior = np.empty((2 * len(self._dados), len(self.colunas)))
+            maior[:self.n] = self._dados
+            self._dados = maior
+        self._dados[self.n] = valores
+        self.n += 1
+
+    def dados(self):
+        """
+            Retornos:
+            · dict coluna -> array com os valores registrados (vistas do
+            buffer, sem cópia).
+        """
+        return {
+            c: self._dados[:self.n, j] for j, c in enumerate(self.colunas)
+        }
+
+    def grava(self, destino):
+        """
+            Grava os registros em um arquivo .npz, um array por coluna.
+        """
+        np.savez(destino, **self.dados())
+
+
+def diretorio_execucao(base="execucoes", prefixo="execucao"):
+    """
+        Cria um diretório exclusivo para os arquivos de uma execução, 
+        identificado pela data e hora, pelo processo e por um sufixo
+        aleatório.
+
+        Retornos:
+        · Path do diretório criado.
+    """
+    nome = f"{prefixo}_{datetime.now():%Y%m%d-%H%M%S}_{os.getpid()}_" +\
+        uuid.uuid4().hex[:8]
+    diretorio = Path(base) / nome
+    diretorio.mkdir(parents=True)
+    return diretorio
@@ -0,0 +1,232 @@
+"""
+    Cálculo vetorizado da temperatura adiabática de chama para lotes de
+    pontos de operação (vazões, excessos de ar, temperaturas de entrada).
+"""
+import numpy as np
+
+from .entalpia import cria_backend
+from .estequiometria import PRODUTOS
+from .estequiometria import produtos_combustao
+from .instrumentacao import metricas_ativas
+from .termoquimica import entalpias_formacao
+
+
+def temp_adiabatica_lote(
+    n_reagentes,
+    n_produtos,
+    reagentes,
+    produtos,
+    temp_reagentes = 298,
+    guess = 1000,
+    backend = "tabela",
+    tol = 1e-2,
+    nmax_iter = 50,
+    limites = (250., 3500.),
+    sensibilidades = False,
+):
+    """
+        Determina a temperatura adiabática da chama de N pontos de operação
+        em uma única iteração vetorizada de Newton protegida por bissecção.
+
+        O resíduo de energia de cada ponto é o mesmo de `temp_adiabatica`.
+        Como ele é crescente com T, cada ponto mantém um intervalo [inf, sup]
+        que é estreitado a cada avaliação; passos de Newton que deixam o
+        intervalo são substituídos pelo ponto médio.
+
+        Parâmetros:
+        · n_reagentes - array (N, n_reagentes) com as vazões molares (ou
+        frações) dos reagentes de cada ponto;
+        · n_produtos - array (N, n_produtos) com as vazões molares dos
+        produtos de cada ponto;
+        · reagentes - sequência com as fórmulas químicas das colunas de
+        n_reagentes;
+        · produtos - sequência com as fórmulas químicas das colunas de
+        n_produtos;
+        · [temp_reagentes] opcional - float ou array (N,) com a temperatura
+        dos reagentes em Kelvins;
+        · [guess] opcional - float ou array (N,) com a estimativa inicial;
+        · [backend] opcional - backend de entalpia (ver entalpia.py);
+        · [tol] opcional - tolerância absoluta em Kelvins;
+        · [nmax_iter] opcional - número máximo de iterações;
+        · [limites] opcional - intervalo de busca em Kelvins;
+        · [sensibilidades] opcional - booleano; quando True, as derivadas
+        da temperatura adiabática (ver sensibilidades_tad) são incluídas
+        no dict de retorno, em "sensibilidades".
+
+        Retornos:
+        · array (N,) - temperaturas adiabáticas em Kelvins;
+        · array (N,) de booleanos - máscara de convergência por ponto,
+        False para os pontos sem solução no intervalo de busca;
+        · dict - número de iterações e de avaliações vetorizadas do resíduo.
+    """
+    n_reagentes = np.atleast_2d(np.asarray(n_reagentes, dtype=float))
+    n_produtos = np.atleast_2d(np.asarray(n_produtos, dtype=float))
+    n_pontos = n_produtos.shape[0]
+
+    ent_reag = cria_backend(backend, tuple(reagentes))
+    ent_prod = cria_backend(backend, tuple(produtos))
+    hf_prod = entalpias_formacao(produtos)
+
+    temp_r = np.broadcast_to(
+        np.asarray(temp_reagentes, dtype=float), (n_pontos,)
+    )
+    reag_ental = np.einsum(
+        "ij,ij->i",
+        n_reagentes,
+        entalpias_formacao(reagentes) + ent_reag.h_sensivel(temp_r)
+    )
+
+    def residuo(t, pontos):
+        return np.einsum(
+            "ij,ij->i", n_produtos[pontos], hf_prod + ent_prod.h_sensivel(t)
+        ) - reag_ental[pontos]
+
+    temp = np.broadcast_to(np.asarray(guess, dtype=float), (n_pontos,))
+    temp = np.clip(temp, *limites)
+    inf = np.full(n_pontos, limites[0], dtype=float)
+    sup = np.full(n_pontos, limites[1], dtype=float)
+    convergiu = np.zeros(n_pontos, dtype=bool)
+    todos = np.arange(n_pontos)
+
+    # Pontos sem troca de sinal do resíduo no intervalo de busca não têm
+    # solução: ficam no limite mais próximo e não convergem. Um resíduo
+    # indefinido em um limite (estado não suportado pelo backend) não
+    # exclui o ponto
+    res_inf = residuo(inf, todos)
+    res_sup = residuo(sup, todos)
+    temp = np.where(res_inf > 0, inf, np.where(res_sup < 0, sup, temp))
+    ativos = todos[~((res_inf > 0) | (res_sup < 0))]
+
+    metricas = metricas_ativas()
+    if metricas is not None:
+        metricas.contadores["avaliacoes_residuo"] += 2 * n_pontos
+    n_iter = 0
+    while ativos.size and n_iter < nmax_iter:
+        n_iter += 1
+        t = temp[ativos]
+        res = residuo(t, ativos)
+        d_res = np.einsum("ij,ij->i", n_produtos[ativos], ent_prod.cp(t))
+        if metricas is not None:
+            metricas.contadores["avaliacoes_residuo"] += ativos.size
+            if metricas.rastreio is not None:
+                metricas.rastreio("temp_adiabatica_lote", n_iter, t, res)
+
+        positivo = res > 0
+        sup[ativos] = np.where(positivo, t, sup[ativos])
+        inf[ativos] = np.where(positivo, inf[ativos], t)
+
+        novo = t - res / d_res
+        fora = ~((novo > inf[ativos]) & (novo < sup[ativos]))
+        novo = np.where(fora, (inf[ativos] + sup[ativos]) / 2, novo)
+
+        temp[ativos] = novo
+        fim = (np.abs(novo - t) < tol) | (sup[ativos] - inf[ativos] < tol)
+        convergiu[ativos[fim]] = True
+        ativos = ativos[~fim]
+
+    if metricas is not None:
+        metricas.contadores["iteracoes"] += n_iter
+    info = {"n_iter": n_iter, "n_avaliacoes": n_iter + 2}
+    if sensibilidades:
+        info["sensibilidades"] = sensibilidades_tad(
+            temp, n_reagentes, n_produtos, reagentes, produtos, temp_r,
+            backend
+        )
+    return temp, convergiu, info
+
+
+def sensibilidades_tad(
+    temp,
+    n_reagentes,
+    n_produtos,
+    reagentes,
+    produtos,
+    temp_reagentes = 298,
+    backend = "tabela",
+):
+    """
+        Derivadas da temperatura adiabática em relação às vazões e à
+        temperatura dos reagentes, por diferenciação implícita do resíduo de
+        energia na raiz:
+
+            f(T; n_r, n_p, T_r) = Σ n_p H_p(T) - Σ n_r H_r(T_r) = 0
+            dT/dθ = -(∂f/∂θ) / (∂f/∂T),   ∂f/∂T = Σ n_p cp_p(T)
+
+        em que H = hf + h(T) - h(298). Cada reagente adicional altera os
+        produtos segundo a combustão completa (ver estequiometria.py), de
+        modo que dT/dn_r já inclui a resposta dos produtos. O custo é o de
+        uma avaliação do resíduo, independentemente do número de variáveis.
+
+        Parâmetros:
+        · temp - float ou array (N,) com as temperaturas adiabáticas já
+        determinadas (por exemplo, por temp_adiabatica_lote);
+        · demais - como em temp_adiabatica_lote.
+
+        Retornos:
+        · dict com:
+            "n_reagentes" - array (N, n_reagentes), dT/dn_r em K por
+            unidade de vazão molar de cada reagente. O O2 do ar, com o seu
+            N2, corresponde a dT/dn_O2 + razao_n2_o2 · dT/dn_N2;
+            "n_produtos" - array (N, n_produtos), derivadas parciais dT/dn_p
+            com os reagentes fixos;
+            "temp_reagentes" - array (N,), dT/dT_r (adimensional).
+    """
+    n_reagentes = np.atleast_2d(np.asarray(n_reagentes, dtype=float))
+    n_produtos = np.atleast_2d(np.asarray(n_produtos, dtype=float))
+    n_pontos = n_produtos.shape[0]
+    temp = np.broadcast_to(np.asarray(temp, dtype=float), (n_pontos,))
+    temp_r = np.broadcast_to(
+        np.asarray(temp_reagentes, dtype=float), (n_pontos,)
+    )
+
+    ent_reag = cria_backend(backend, tuple(reagentes))
+    ent_prod = cria_backend(backend, tuple(produtos))
+    h_reag = entalpias_formacao(reagentes) + ent_reag.h_sensivel(temp_r)
+    h_prod = entalpias_formacao(produtos) + ent_prod.h_sensivel(temp)
+    d_res = np.einsum("ij,ij->i", n_produtos, ent_prod.cp(temp))
+
+    # Produtos gerados pelos reagentes e ausentes da lista (por exemplo, o
+    # O2 de uma combustão estequiométrica) entram com vazão nula
+    resposta, extras, resposta_extras = _resposta_produtos(reagentes, produtos)
+    h_resposta = h_prod @ resposta.T
+    if extras:
+        h_resposta += (
+            entalpias_formacao(extras)
+            + cria_backend(backend, tuple(extras)).h_sensivel(temp)
+        ) @ resposta_extras.T
+
+    d_produtos = -h_prod / d_res[:, None]
+    d_reagentes = (h_reag - h_resposta) / d_res[:, None]
+    d_temp_r = np.einsum(
+        "ij,ij->i", n_reagentes, ent_reag.cp(temp_r)
+    ) / d_res
+    return {
+        "n_reagentes": d_reagentes,
+        "n_produtos": d_produtos,
+        "temp_reagentes": d_temp_r,
+    }
+
+
+def _resposta_produtos(reagentes, produtos):
+    """
+        Mols de cada produto da combustão completa de um mol de cada
+        reagente, sem ar adicional.
+
+        Retornos:
+        · array (n_reagentes, n_produtos) - resposta nas colunas de produtos;
+        · list - produtos de PRODUTOS gerados e ausentes de produtos;
+        · array (n_reagentes, n_extras) - resposta nesses produtos.
+    """
+    unitarios, _ = produtos_combustao(
+        np.eye(len(reagentes)), reagentes, np.zeros(len(reagentes)), 0.
+    )
+    resposta = np.column_stack([
+        unitarios[:, PRODUTOS.index(c)] if c in PRODUTOS
+            else np.zeros(len(reagentes))
+        for c in produtos
+    ])
+    extras = [
+        j for j, c in enumerate(PRODUTOS)
+            if c not in produtos and np.any(unitarios[:, j])
+    ]
+    return resposta, [PRODUTOS[j] for j in extras], unitarios[:, extras]
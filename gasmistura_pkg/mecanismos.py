@@ -0,0 +1,148 @@
+"""
+    Mecanismos de cinética das chamas e do equilíbrio do Cantera.
+
+    Além dos mecanismos distribuídos com o Cantera, o pacote inclui um
+    mecanismo reduzido para gás de alto-forno (CO/H2/CH4 diluídos em N2 e
+    CO2), dados/syngas_c1.yaml: o subconjunto C1 do GRI-Mech 3.0, isto é,
+    as espécies com no máximo um átomo de carbono, sem a química de C2 e
+    de NOx (N2 e Ar inertes), e as reações do GRI-Mech 3.0 entre elas,
+    com os mesmos parâmetros de Arrhenius, termodinâmicos e de transporte.
+
+    Os mecanismos podem ser informados pelo nome abreviado (ver
+    MECANISMOS) ou pelo arquivo. O mecanismo reduzido pode ser gerado
+    novamente com:
+
+        python -m gasmistura_pkg.mecanismos --gera
+
+    e comparado ao completo com `python -m gasmistura_pkg.compara_mecanismos`.
+
+    Requer: cantera >= 2.5.0 (apenas para gerar o mecanismo)
+"""
+import argparse
+import hashlib
+from functools import lru_cache
+from pathlib import Path
+
+CAMINHO_REDUZIDO = Path(__file__).parent / "dados" / "syngas_c1.yaml"
+
+MECANISMOS = {
+    "gri30": "gri30.yaml",
+    "reduzido": str(CAMINHO_REDUZIDO),
+}
+
+
+def caminho_mecanismo(mecanismo):
+    """
+        Arquivo de um mecanismo informado pelo nome abreviado (ver
+        MECANISMOS) ou pelo próprio arquivo.
+    """
+    return MECANISMOS.get(mecanismo, mecanismo)
+
+
+def arquivo_mecanismo(mecanismo):
+    """
+        Caminho do arquivo de um mecanismo: o próprio arquivo, se existir,
+        ou o arquivo de mesmo nome nos diretórios de dados do Cantera.
+    """
+    caminho = Path(caminho_mecanismo(mecanismo))
+    if caminho.exists():
+        return caminho.resolve()
+    import cantera as ct
+
+    for diretorio in ct.get_data_directories():
+        candidato = Path(diretorio) / caminho
+        if candidato.exists():
+            return candidato.resolve()
+    raise ValueError(f"Mecanismo '{mecanismo}' não encontrado.")
+
+
+@lru_cache(maxsize=None)
+def _hash_arquivo(caminho, mtime_ns, tamanho):
+    return hashlib.sha256(Path(caminho).read_bytes()).hexdigest()[:24]
+
+
+def assinatura_mecanismo(mecanismo):
+    """
+        Hash do conteúdo do arquivo do mecanismo, para identificar
+        resultados gravados: independe da localização do arquivo e muda
+        quando ele é editado ou gerado novamente.
+    """
+    caminho = arquivo_mecanismo(mecanismo)
+    estado = caminho.stat()
+    return _hash_arquivo(str(caminho), estado.st_mtime_ns, estado.st_size)
+
+
+def gera_mecanismo_reduzido(origem="gri30.yaml", destino=CAMINHO_REDUZIDO):
+    """
+        Extrai o subconjunto C1 sem NOx de um mecanismo e o grava em YAML.
+
+        Parâmetros:
+        · [origem] opcional - mecanismo completo;
+        · [destino] opcional - arquivo YAML gerado.
+
+        Retornos:
+        · tuple - número de espécies e de reações do mecanismo gerado.
+    """
+    import cantera as ct
+
+    completo = ct.Solution(origem)
+    especies = [
+        s for s in completo.species()
+            if set(s.composition) <= {"C", "H", "O", "N", "Ar"}
+            and s.composition.get("C", 0) <= 1
+            and (s.composition.get("N", 0) == 0 or s.name == "N2")
+    ]
+    nomes = {s.name for s in especies}
+
+    reacoes = []
+    for r in completo.reactions():
+        if not set(r.reactants) | set(r.products) <= nomes:
+            continue
+        # Eficiências de terceiro corpo das espécies removidas
+        if r.third_body is not None and r.third_body.efficiencies:
+            r.third_body.efficiencies = {
+                e: v for e, v in r.third_body.efficiencies.items()
+                    if e in nomes
+            }
+        reacoes.append(r)
+
+    reduzido = ct.Solution(
+        thermo="ideal-gas", kinetics="gas",
+        transport_model="mixture-averaged",
+        species=especies, reactions=reacoes, name="syngas_c1",
+    )
+    reduzido.TPX = 300.0, ct.one_atm, "N2:1"
+    reduzido.update_user_header({
+        "description": (
+            f"Subconjunto C1 sem NOx de {Path(origem).name}, gerado por "
+            "gasmistura_pkg.mecanismos (Cantera "
+            f"{ct.__version__})."
+        )
+    })
+    destino = Path(destino)
+    destino.parent.mkdir(parents=True, exist_ok=True)
+    reduzido.write_yaml(str(destino))
+    return reduzido.n_species, reduzido.n_reactions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Mecanismo reduzido CO/H2/CH4 do pacote."
+    )
+    parser.add_argument("--gera", action="store_true",
+        help="extrai o mecanismo reduzido do gri30.yaml (requer cantera)")
+    parser.add_argument("--origem", default="gri30.yaml")
+    parser.add_argument("--destino", default=CAMINHO_REDUZIDO)
+    args = parser.parse_args()
+
+    if args.gera:
+        n_especies, n_reacoes = gera_mecanismo_reduzido(
+            args.origem, args.destino
+        )
+        print(
+            f"{n_especies} espécies e {n_reacoes} reações gravadas em "
+            f"{args.destino}."
+        )
+    else:
+        for nome, arquivo in MECANISMOS.items():
+            print(f"{nome:10s} {arquivo}")
@@ -0,0 +1,583 @@
+import logging
+
+import numpy as np
+from scipy.optimize import root_scalar
+
+from .corrente import LINHA_VAZAO
+from .corrente import CorrenteGas
+from .entalpia import cria_backend
+from .instrumentacao import RegistroIteracoes
+from .instrumentacao import diretorio_execucao
+from .instrumentacao import metricas_ativas
+from .lote import sensibilidades_tad
+from .estequiometria import PRODUTOS
+from .estequiometria import produtos_combustao
+from .propriedades import densidade_molar
+from .propriedades import fator_z
+from .propriedades import massas_molares
+from .termoquimica import entalpias_formacao
+
+logger = logging.getLogger(__name__)
+
+METODOS_INTERVALO = ("bisect", "brentq", "brenth", "ridder", "toms748")
+METODOS_DERIVADA = ("newton", "secant", "halley")
+
+# Condições normais de temperatura e pressão (K, Pa)
+CNTP_PADRAO = (273.153, 101325)
+
+# Coluna padrão do ar de combustão, em mols de O2, em vaz_combustao
+COLUNA_AR = "Ar"
+
+
+def mm_aparente_mistura(
+    compostos, mmolar=None, fracao=None, t_fracao="fmol", CNTP=True,
+    TP=(273.153, 101325)
+):
+    """
+        Calcula a massa molecular aparente, a constante de gás e o fator de 
+        compressibilidade aparente de uma mistura de gases reais, 
+        utilizando a lei de Amagat.
+
+        Recebe uma lista contendo as strings dos gases componentes da mistura, 
+        as massas molares dos componentes em g/mol (ou None para obtê-las do 
+        CoolProp), uma série de frações e uma string contendo o tipo da 
+        descrição estequimétrica:
+        · "fmass" - para fração mássica;
+        · "fmol" - para fração molar.
+
+        As frações podem ser um array (n_compostos,) ou um lote de 
+        composições (N, n_compostos). Alternativamente, uma CorrenteGas 
+        pode ser passada no lugar dos compostos; nesse caso as frações 
+        molares são as da corrente e os resultados são arrays (N,).
+
+        Por padrão a função trabalha nas condições normais de temperatura e 
+        pressão 273,153 K e 101325 N/m². Esta condição pode ser modificada 
+        alterando o parâmetro padrão CNTP para False e declarando, por meio de 
+        uma par ordenado (list, tuple ...) os novos valores de temperatura e 
+        pressão no sistema internacional de unidades. Os valores do par podem
+        ser arrays (N,) de estados.
+
+        As massas molares obtidas do CoolProp e os fatores de 
+        compressibilidade de cada (composto, T, p) são memorizados (ver 
+        propriedades.py).
+
+        Retorna a massa molecular aparente da mistura `mma` em kg/mol, a 
+        constante de gás da mistura `const_r_m` e o fator de 
+        compressibilidade da mistura `z_m`, como floats ou arrays (N,).
+    """
+    if CNTP:
+        TP = CNTP_PADRAO
+
+    if isinstance(compostos, CorrenteGas):
+        fracao, t_fracao = compostos.fracoes(), "fmol"
+        compostos = compostos.compostos
+    elif fracao is None:
+        raise AttributeError(
+            "A função 'mm_aparente_mistura' exige as frações dos compostos ",
+            "ou uma CorrenteGas."
+        )
+
+    if mmolar is None:
+        mmolar = massas_molares(compostos)
+    else:
+        mmolar = np.asarray(mmolar, dtype=float) / 1e3
+    fracao = np.asarray(fracao, dtype=float)
+
+    if t_fracao.lower() == "fmass":
+        # Massa Molar Aparente
+        mols = fracao / mmolar
+        mma = 1 / np.sum(mols, axis=-1)
+        fmol = mols * mma[..., None]
+    elif t_fracao.lower() == "fmol":
+        fmol = fracao
+        mma = fmol @ mmolar
+    else:
+        raise AttributeError(
+            "Erro de parametrização ao tentar calcular a massa molecular ",
+            "aparente da mistura na função 'mm_aparente_mistura'.\n",
+            "Verifique a documentação!"
+        )
+    
+    # Constante de gás da mistura
+    const_r_m = 8.314462618/mma
+
+    # Fator de compressibilidade Z da mistura
+    z_m = np.sum(fmol * fator_z(compostos, TP[0], TP[1]), axis=-1)
+
+    if np.ndim(z_m) == 0:
+        return float(mma), float(const_r_m), float(z_m)
+    return mma, const_r_m, z_m
+
+def corr_vazao_normal(
+    vaz_norm, 
+    fator_z,  
+    mmolar_ap,
+    temp_crr,
+    const_rm = 8.314462618,
+    press_pad = 101325,
+    eos = None,
+    compostos = None,
+    fracoes = None
+):
+    """
+        Corrige vazões normais no SI para valores de vazão em T-p, usando o 
+        fator de compressibilidade como correção para a lei geral dos gases 
+        ideias ou, quando `eos` é informado, a densidade molar da mistura real
+        calculada pela equação de estado correspondente do CoolProp. 
+
+        Parâmetros:
+        · voz_norm - a vazão normal a ser corrigida em unidades SI (float ou 
+        array);
+        · factor_z - o fator de compressibilidade da mistura de gases ou do 
+        gás (ignorado quando `eos` é informado);
+        · mmolar_ap - a massa molar aparente dos componentes da mistura gasosa ou d
+        o gás;
+        · temp_crr - temperatura absoluta no estado de correção (float ou 
+        array);
+        · const_rm (opcional) - a constante de gás para a correção, se não for 
+        for informada o valor para os gases ideiais é empregado 
+        (8,314 462 618 J/mol.K);
+        · press_pad (opcional) - pressão absoluta no estado de correção;
+        · eos (opcional) - equação de estado do CoolProp para a correção de 
+        gás real ("HEOS", "PR", "SRK"...). Os objetos AbstractState são 
+        reaproveitados entre chamadas (ver propriedades.py);
+        · compostos (opcional) - nomes dos compostos da mistura, exigido 
+        quando `eos` é informado;
+        · fracoes (opcional) - frações molares dos compostos, (n_compostos,) 
+        ou (N, n_compostos), exigidas quando `eos` é informado, ou uma 
+        CorrenteGas com a composição do gás (dispensa `compostos`).
+
+        Retornos:
+        Retorna um par de valores (floats ou arrays):
+        1. A vazão mássica em kg/s;
+        2. A vazão molar em mol/s ou, quando `fracoes` é uma CorrenteGas, a
+        CorrenteGas com as vazões molares de cada composto (cujo total é a
+        vazão molar).
+    """
+    corrente = fracoes if isinstance(fracoes, CorrenteGas) else None
+    if corrente is not None:
+        compostos, fracoes = corrente.compostos, corrente.fracoes()
+
+    if eos is None:
+        vaz_mol = (press_pad * vaz_norm)/(fator_z * const_rm * temp_crr)
+    else:
+        if compostos is None or fracoes is None:
+            raise AttributeError(
+                "A correção de gás real na função 'corr_vazao_normal' exige ",
+                "os parâmetros 'compostos' e 'fracoes'."
+            )
+        vaz_mol = np.asarray(vaz_norm) * densidade_molar(
+            compostos, fracoes, temp_crr, press_pad, eos
+        )
+    vaz_mass = vaz_mol * mmolar_ap
+
+    if corrente is not None:
+        vaz_mol = np.broadcast_to(vaz_mol, (len(corrente),))
+        return vaz_mass, CorrenteGas(compostos, fracoes * vaz_mol[:, None])
+    return vaz_mass, vaz_mol
+
+
+def vaz_combustao(dataframe, razao_n2_o2=3.72, coluna_ar=COLUNA_AR):
+    """
+        Realiza o balaço de massa da combustão dos gases de auto-forno.
+
+        O balanço é feito pela matriz de composição elementar dos compostos
+        (ver estequiometria.py), portanto qualquer composto formado por C, H, 
+        O, N, S e Ar (argônio) pode constar no dataframe. Cada linha do 
+        dataframe é balanceada independentemente.
+
+        Parâmetros: 
+        · um dataframe com os dados de vazão dos gases do autoforno, uma 
+        linha por ponto de operação e os compostos nas colunas, ou uma 
+        CorrenteGas equivalente. O ar de combustão pode ser informado na
+        coluna coluna_ar ou "O2" (apenas uma delas), na forma
+        n(O2 + 3.72 N2), ou mesmo omitido, neste último caso, a quantidade
+        de ar teórico é calculada automaticamente. Um ar insuficiente para
+        a combustão completa resulta em ValueError.
+        · [razao_n2_o2] opcional - mols de N2 por mol de O2 no ar.
+        · [coluna_ar] opcional - nome da coluna do ar de combustão, sem
+        distinção de maiúsculas; por padrão "Ar", como nas versões
+        anteriores. Para um gás que contém argônio, informe outro nome
+        (por exemplo "ar_combustao") e a coluna "Ar" passa a ser o argônio.
+
+        Retornos (DataFrames ou, para uma CorrenteGas, CorrenteGas):
+        · uma cópia do dataframe original com o ar de combustão expresso nas
+        colunas "O2" e "N2" (o dataframe passado não é alterado);
+        · um segundo dataframe com os gases de combustão já balanceados em
+        massa. O O2 em excesso e os compostos SO2 e Ar são incluídos apenas 
+        quando presentes.
+    """
+    if isinstance(dataframe, CorrenteGas):
+        return _balanco_combustao(dataframe, razao_n2_o2, coluna_ar)
+
+    reagentes, produtos = _balanco_combustao(
+        CorrenteGas.de_dataframe(dataframe), razao_n2_o2, coluna_ar
+    )
+    return reagentes.para_dataframe(dataframe.index),\
+        produtos.para_dataframe(dataframe.index)
+
+
+def _balanco_combustao(corrente, razao_n2_o2, coluna_ar):
+    compostos = list(corrente.compostos)
+    colunas_ar = [
+        c for c in compostos if c.lower() in (coluna_ar.lower(), "o2")
+    ]
+    if len(colunas_ar) > 1:
+        raise ValueError(
+            f"Ar de combustão informado nas colunas "
+            f"{', '.join(map(repr, colunas_ar))}; informe apenas uma delas."
+        )
+    o2_ar = None
+    if colunas_ar:
+        o2_ar = corrente[colunas_ar[0]].copy()
+        compostos.remove(colunas_ar[0])
+
+    vazoes = corrente.colunas(compostos)
+    produtos, o2_ar = produtos_combustao(
+        vazoes, compostos, o2_ar, razao_n2_o2
+    )
+    deficit = -produtos[:, PRODUTOS.index("O2")]
+    deficientes = np.flatnonzero(deficit > 1e-9 * np.maximum(o2_ar, 1.))
+    if len(deficientes):
+        raise ValueError(
+            f"Ar insuficiente para a combustão completa nas linhas "
+            f"{deficientes.tolist()}: faltam até {deficit.max():.6g} mols "
+            "de O2."
+        )
+
+    reagentes = compostos + ["O2"] + ([] if "N2" in compostos else ["N2"])
+    n_reag = np.zeros((len(corrente), len(reagentes)))
+    n_reag[:, :len(compostos)] = vazoes
+    n_reag[:, len(compostos)] = o2_ar
+    n_reag[:, reagentes.index("N2")] += razao_n2_o2 * o2_ar
+
+    presentes = [
+        j for j, c in enumerate(PRODUTOS)
+            if j < 3 or not np.allclose(produtos[:, j], 0)
+    ]
+    return CorrenteGas(reagentes, n_reag),\
+        CorrenteGas([PRODUTOS[j] for j in presentes], produtos[:, presentes])
+
+def temp_adiabatica(
+    df_reagentes, 
+    df_produtos, 
+    ar_teorico,
+    metodo,
+    guess = 1000, 
+    salva_dados = False,
+    nmax_iter = 1e5,
+    backend = "tabela",
+    temp_reagentes = 298,
+    tol = 1e-2,
+    diretorio_dados = "execucoes",
+    sensibilidades = False):
+    """
+        Determina a temperatura adiabática da chama para um conjunto de 
+        reagentes e produtos. Além disso, emite (logging, nível INFO) um log
+        do estado final alcançado pelo algoritmo característico do método 
+        utilizado; as iterações do método "moran" são emitidas no nível 
+        DEBUG. Se o parâmetro opcional salva_dados for passado como True, um
+        diretório exclusivo da execução é criado com os dados evolutivos do
+        modelo para cada avaliação realizada (dados.npz), assim como um 
+        arquivo de texto plano com o log emitido.
+
+        !!!!!  IMPORTANTE:
+        Na versão atual o cálculo da razão de equivalência está 
+        restrito aos combustíveis CO, H2 e CH4. Nas próximas versões, uma maior
+        disponibilidade combustíveis será implementada. 
+
+        Parâmetros:
+        · df_reagentes - DataFrame com colunas nomeadas segundo a fórmula 
+        química dos compostos presentes no combustível e uma linha contendo 
+        as vazões molares ou frações desses compostos, ou uma CorrenteGas de
+        um ponto.
+        
+        · df_prdutos - DataFrame com colunas nomeadas segundo a fórmula 
+        química dos compostos presentes nos gases de combustão e uma linha 
+        contendo as vazões molares ou frações desses compostos, ou uma 
+        CorrenteGas de um ponto.
+
+        · ar_teorico - Float, quantidade de ar teórico para a combustão 
+        completa dos reagentes presentes em df_reagentes
+
+        · metodo - Strig com o método utilizado para a determinação da
+        temperatura adiabática. 
+
+            i) "moran" - método iterativo brute force proposto por moran e 
+            shapiro.
+            
+            ii) "bisect" - método da bissecção
+            
+            iii)  "brentq"  - método clássico de Brent veja (Brent, R. P., 
+            Algorithms for Minimization Without Derivatives. Englewood Cliffs, 
+            NJ: Prentice-Hall, 1973. Ch. 3-4.)
+            
+            iv) "brenth" - método de Brent com extrapolação hiperbólica veja 
+            (Bus, J. C. P., Dekker, T. J., “Two Efficient Algorithms with 
+            Guaranteed Convergence for Finding a Zero of a Function”, ACM 
+            Transactions on Mathematical Software, Vol. 1, Issue 4, Dec. 1975, 
+            pp. 330-345. Section 3: “Algorithm M”. DOI:10.1145/355656.355659)
+
+            v) "ridder" - método de Ridder
+
+            vi) "toms748" - algorítimo 748 de Alefeld, Potro and Shi veja 
+            (APS1995 Alefeld, G. E. and Potra, F. A. and Shi, Yixun, Algorithm 
+            748: Enclosing Zeros of Continuous Functions, ACM Trans. Math. 
+            Softw. Volume 221(1995) doi = {10.1145/210089.210111})
+
+            vii) "newton" - método de Newton. 
+
+            viii) "secant" - método das secantes.
+
+            ix) "halley" - método de Halley veja (Boyd, J. P. (2013). "Finding 
+            the Zeros of a Univariate Equation: Proxy Rootfinders, Chebyshev 
+            Interpolation, and the Companion Matrix". SIAM Review. 55 (2): 
+            375–396. doi:10.1137/110838297)
+        
+        · [guess] opcional - lista com sugestão de temperatura(s) para início 
+        dos algoritmos. Se apenas um valor for passado, as buscas são realizadas 
+        em torno do valor. Se dois valores forem passados, então entre os 
+        os valores, inclusivamente.
+
+        · [salva_dados] opcional - booleano, False por padrão; quando True,
+        os dados da busca são salvos em um diretório exclusivo da execução.
+        A saber, um arquivo dados.npz com os arrays "avaliacao",
+        "temperaturaK" e "sumentalpia" (valores assumidos pelo algoritmo em
+        cada avaliação do resíduo) e o log temp_adiabatica.log com o estado
+        final do algoritmo.
+
+        · [nmax_iter] opcional - inteiro com o número máximo de iterações 
+        permitidas. 
+
+        · [backend] opcional - string com o backend de entalpia sensível 
+        (ver entalpia.py): "tabela" (padrão), "nasa7" ou "coolprop". 
+
+        · [temp_reagentes] opcional - temperatura dos reagentes em Kelvins.
+
+        · [tol] opcional - tolerância absoluta, em Kelvins, para a 
+        convergência dos métodos de busca (exceto "moran", que usa o 
+        critério de incremento mínimo de 1 K).
+
+        · [diretorio_dados] opcional - diretório base em que é criado o 
+        diretório da execução quando salva_dados é True.
+
+        · [sensibilidades] opcional - booleano; quando True, as derivadas
+        da temperatura adiabática na raiz, obtidas por diferenciação 
+        implícita do resíduo (ver lote.sensibilidades_tad), são incluídas 
+        no resumo: "reagentes" (dict composto -> dT/dn em K por unidade de 
+        vazão molar, com os produtos acompanhando a combustão completa), 
+        "produtos" (dict composto -> derivada parcial) e "temp_reagentes"
+        (dT/dT_r). O efeito do excesso de O2 do ar é dT/dn_O2 + 
+        razao_n2_o2 · dT/dn_N2.
+
+        Todos os métodos buscam o zero do mesmo resíduo de energia:
+            f(T) = Σ n_p [hf_p + h_p(T) - h_p(298)] - 
+                   Σ n_r [hf_r + h_r(T_r) - h_r(298)]
+        Os métodos "newton" e "halley" utilizam f'(T) = Σ n_p cp_p(T) e 
+        f''(T) = Σ n_p dcp_p/dT fornecidos pelo backend de entalpia.
+
+        Retornos:
+        · float - temperatura adiabática da chama em Kelvins. 
+        · float - razão de equivalênicia
+        · dict - resumo da busca: método, número de iterações, número de 
+        avaliações do resíduo, tolerância, convergência, resíduo final,
+        quando salva_dados é True, o diretório da execução ("diretorio") e,
+        quando sensibilidades é True, as derivadas ("sensibilidades").
+
+        Para mais informações consultar:
+        https://rb.gy/fdcsqf
+    """
+
+    def status_log():
+        """
+        Emite o log da execução e, se o salvamento estiver ativado, o 
+        grava.
+        """
+        msg_log = "LOG de EXECUÇÃO:\n" + f"\t Método de busca: {metodo}.\n" +\
+            f"\t Número de iterações: {n_iter}\n" +\
+            f"\t Avaliações do resíduo: {n_aval}\n" +\
+            f"\t Tolerância: {tolerancia}\n" +\
+            f"\t Sucesso?: {sucesso}\n" +\
+            f"\t Melhor resultado (temperatura adiabática): {temp}\n" +\
+            "\t Erro relativo:"+\
+            f"{(prods_ental - reag_ental)/prods_ental}\n"
+        logger.info(msg_log)
+
+        if salva_dados:
+            registros.grava(diretorio / "dados.npz")
+            (diretorio / "temp_adiabatica.log").write_text(msg_log)
+
+    metodo = metodo.lower()
+    if not isinstance(df_reagentes, CorrenteGas):
+        df_reagentes = CorrenteGas.de_dataframe(df_reagentes, LINHA_VAZAO)
+    if not isinstance(df_produtos, CorrenteGas):
+        df_produtos = CorrenteGas.de_dataframe(df_produtos, LINHA_VAZAO)
+    if len(df_reagentes) > 1 or len(df_produtos) > 1:
+        raise ValueError(
+            "temp_adiabatica calcula um único ponto de operação; use "
+            "temp_adiabatica_lote para correntes com vários pontos."
+        )
+    reagentes = list(df_reagentes.compostos)
+    produtos = list(df_produtos.compostos)
+    n_reag = df_reagentes.vazoes[0]
+    n_prod = df_produtos.vazoes[0]
+    o2_reag = n_reag[reagentes.index("O2")] if "O2" in reagentes else 0.
+    if not o2_reag > 0:
+        raise ValueError(
+            "Reagentes sem O2: a razão de equivalência não é definida."
+        )
+
+    # Entalpias de formação do banco local (ver termoquimica.py) e 
+    # entalpias sensíveis h(T) - h(298 K) (ver entalpia.py)
+    ent_reag = cria_backend(backend, tuple(reagentes))
+    ent_prod = cria_backend(backend, tuple(produtos))
+    hf_prod = entalpias_formacao(produtos)
+    reag_ental = n_reag @ (
+        entalpias_formacao(reagentes) + ent_reag.h_sensivel(temp_reagentes)
+    )
+
+    if salva_dados:
+        registros = RegistroIteracoes(
+            ("avaliacao", "temperaturaK", "sumentalpia")
+        )
+        diretorio = diretorio_execucao(diretorio_dados, "temp_adiabatica")
+    n_aval = 0
+    metricas = metricas_ativas()
+    rastreio = metricas.rastreio if metricas is not None else None
+    def residuo(temp):
+        nonlocal n_aval, prods_ental
+        n_aval += 1
+        prods_ental = n_prod @ (hf_prod + ent_prod.h_sensivel(temp))
+        if salva_dados:
+            registros.adiciona(n_aval, temp, prods_ental)
+        if rastreio is not None:
+            rastreio("temp_adiabatica", n_aval, temp, prods_ental - reag_ental)
+        return prods_ental - reag_ental
+
+    def d_residuo(temp):
+        return n_prod @ ent_prod.cp(temp)
+
+    def d2_residuo(temp):
+        return n_prod @ ent_prod.dcp(temp)
+
+    prods_ental = np.nan
+    chute = np.ravel(guess).astype(float)
+    if metodo == "moran":
+        min_del_temp = 1 # K - menor temperatura a ser incrementada na busca
+        del_temp = chute[0]/10   # K - incremento inicial da temperatura
+        temp = chute[0]
+        n_iter = 0
+        sucesso = False
+        depura = logger.isEnabledFor(logging.DEBUG)
+        while n_iter < nmax_iter:
+            n_iter += 1
+            res = residuo(temp)
+            if depura:
+                logger.debug(
+                    "Iterando... temperatura atual: %s; entalpia dos "
+                    "produtos teste: %.2f; entalpia dos reagentes "
+                    "objetivo: %s", temp, prods_ental, reag_ental
+                )
+
+            if round(res, 2) == 0 or del_temp <= min_del_temp:
+                sucesso = True
+                break
+            elif res > 0:
+                temp -= del_temp
+            else:
+                temp += del_temp
+            del_temp *= .9
+        tolerancia = del_temp
+
+    elif metodo in METODOS_INTERVALO + METODOS_DERIVADA:
+        if metodo in METODOS_INTERVALO:
+            kwargs = {"bracket": _intervalo_busca(residuo, chute)}
+        elif metodo == "secant":
+            x1 = chute[1] if chute.size > 1 else 1.1 * chute[0]
+            kwargs = {"x0": chute[0], "x1": x1}
+        else:
+            kwargs = {"x0": chute[0], "fprime": d_residuo}
+            if metodo == "halley":
+                kwargs["fprime2"] = d2_residuo
+
+        sol = root_scalar(
+            residuo, method=metodo, xtol=tol, maxiter=int(nmax_iter), **kwargs
+        )
+        temp = sol.root
+        n_iter = sol.iterations
+        sucesso = sol.converged
+        tolerancia = tol
+        residuo(temp)
+
+    else:
+        raise AttributeError(
+            f"Método '{metodo}' desconhecido na função 'temp_adiabatica'.\n",
+            "Verifique a documentação!"
+        )
+
+    if metricas is not None:
+        metricas.contadores["avaliacoes_residuo"] += n_aval
+        metricas.contadores["iteracoes"] += n_iter
+    status_log()
+    if not sucesso:
+        raise Exception("Número máximo de iterações excedido.")
+
+    # Razão de equivalência: (combustível/O2) / (combustível/O2 teórico)
+    coef_ratio = ar_teorico / o2_reag
+
+    info = {
+        "metodo": metodo,
+        "n_iter": n_iter,
+        "n_avaliacoes": n_aval,
+        "tolerancia": tolerancia,
+        "convergiu": sucesso,
+        "residuo": prods_ental - reag_ental,
+    }
+    if salva_dados:
+        info["diretorio"] = str(diretorio)
+    if sensibilidades:
+        derivadas = sensibilidades_tad(
+            temp, n_reag, n_prod, reagentes, produtos, temp_reagentes, backend
+        )
+        info["sensibilidades"] = {
+            "reagentes": dict(zip(reagentes, derivadas["n_reagentes"][0])),
+            "produtos": dict(zip(produtos, derivadas["n_produtos"][0])),
+            "temp_reagentes": float(derivadas["temp_reagentes"][0]),
+        }
+    return temp, coef_ratio, info
+
+
+def _intervalo_busca(residuo, chute, limites=(250., 3500.)):
+    """
+        Determina um intervalo [inf, sup] em que o resíduo de energia troca 
+        de sinal. Se dois valores forem passados em chute, eles são o 
+        intervalo; com um único valor, o intervalo é expandido em torno dele 
+        com passos crescentes até a troca de sinal ou os limites da tabela.
+
+        Sem troca de sinal até o limite, a temperatura adiabática está fora
+        do intervalo de busca e o erro é um ValueError.
+    """
+    if chute.size > 1:
+        return chute[0], chute[1]
+
+    sentido = -1 if residuo(chute[0]) > 0 else 1
+    limite = limites[0] if sentido < 0 else limites[1]
+    anterior = chute[0]
+    passo = chute[0] / 10
+    while True:
+        atual = anterior + sentido * passo
+        atual = max(atual, limite) if sentido < 0 else min(atual, limite)
+        troca = sentido * residuo(atual) >= 0
+        if troca or atual == limite:
+            break
+        anterior = atual
+        passo *= 2
+
+    if not troca:
+        raise ValueError(
+            "O resíduo de energia não troca de sinal entre "
+            f"{min(chute[0], limite):g} e {max(chute[0], limite):g} K: a "
+            "temperatura adiabática está fora do intervalo de busca "
+            f"{limites}."
+        )
+    return min(anterior, atual), max(anterior, atual)
@@ -0,0 +1,307 @@
+"""
+    Arquivo colunar de perfis de chamas livres, em substituição aos CSVs de
+    `FreeFlame.write_csv` (grid, velocity, T, density e uma coluna X_ por
+    espécie do mecanismo, quase todas nulas).
+
+    Cada perfil é um diretório com:
+    · meta.json - ordem original das colunas, número de pontos, colunas
+    nulas e metadados da chama (mecanismo, estado de entrada, modelo de
+    transporte, ...);
+    · colunas.npy - matriz (n_colunas_gravadas, n_pontos) em que cada
+    coluna do perfil é uma linha contígua, mapeada em memória: somente as
+    páginas das colunas acessadas são lidas do disco; ou, com
+    comprime=True, colunas.npz compactado, menor no disco mas sem
+    mapeamento em memória: cada acesso descompacta a coluna inteira
+    novamente e o perfil não retém as colunas descompactadas.
+
+    As colunas identicamente nulas (frações de espécies ausentes) não são
+    gravadas e são lidas como uma vista de zeros, de modo que o perfil
+    lido é idêntico ao gravado. Assim, plotar T e X_CO de milhares de
+    chamas lê apenas essas duas colunas de cada perfil. Opcionalmente,
+    um limiar descarta também as colunas de módulo desprezível, com
+    perda desses valores.
+
+    Conversão dos CSVs existentes:
+
+        python -m gasmistura_pkg.perfis arquivo/adiabatic_flame_mix.csv \\
+            --destino perfis --meta '{"mecanismo": "gri30.yaml",
+            "transporte": "Mix"}'
+"""
+import argparse
+import json
+import re
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+VERSAO_FORMATO = 1
+LIMIAR_PADRAO = 0.
+
+
+def _chave_npz(coluna):
+    # "X_CH2(S)" -> "X_CH2_S_"
+    return re.sub(r"[^\w.-]", "_", coluna)
+
+
+def grava_perfil(destino, colunas, meta=None, limiar=LIMIAR_PADRAO,
+    comprime=False):
+    """
+        Grava um perfil no formato colunar.
+
+        Parâmetros:
+        · destino - diretório do perfil (criado se necessário);
+        · colunas - dict nome -> array (n_pontos,), na ordem original;
+        · [meta] opcional - dict serializável em JSON com os metadados;
+        · [limiar] opcional - colunas com |valor| <= limiar em todos os
+        pontos não são gravadas e são lidas como zeros; por padrão, apenas
+        as colunas identicamente nulas;
+        · [comprime] opcional - grava as colunas em um .npz compactado
+        (menor, mas sem mapeamento em memória).
+
+        Retornos:
+        · PerfilChama do perfil gravado.
+    """
+    destino = Path(destino)
+    destino.mkdir(parents=True, exist_ok=True)
+    colunas = {
+        nome: np.ascontiguousarray(valores, dtype=float)
+            for nome, valores in colunas.items()
+    }
+    tamanhos = {v.shape for v in colunas.values()}
+    if len(tamanhos) != 1 or len(tamanhos.pop()) != 1:
+        raise ValueError(
+            "As colunas do perfil devem ser arrays 1-D de mesmo tamanho."
+        )
+
+    nulas = [
+        nome for nome, valores in colunas.items()
+            if np.abs(valores).max(initial=0.) <= limiar
+    ]
+    gravadas = [nome for nome in colunas if nome not in nulas]
+    if comprime:
+        chaves = {nome: _chave_npz(nome) for nome in gravadas}
+        if len(set(chaves.values())) != len(chaves):
+            raise ValueError("Nomes de colunas conflitantes no .npz.")
+        np.savez_compressed(
+            destino / "colunas.npz",
+            **{chaves[nome]: colunas[nome] for nome in gravadas}
+        )
+    else:
+        np.save(
+            destino / "colunas.npy",
+            np.stack([colunas[nome] for nome in gravadas])
+            if gravadas else np.empty((0, 0))
+        )
+
+    (destino / "meta.json").write_text(json.dumps({
+        "versao_formato": VERSAO_FORMATO,
+        "n_pontos": len(next(iter(colunas.values()))),
+        "colunas": list(colunas),
+        "gravadas": gravadas,
+        "nulas": nulas,
+        "limiar": limiar,
+        "comprimido": comprime,
+        "meta": meta or {},
+    }, indent=1, ensure_ascii=False))
+    return PerfilChama(destino)
+
+
+def grava_chama(chama, destino, meta=None, limiar=LIMIAR_PADRAO,
+    comprime=False):
+    """
+        Grava o perfil de uma ct.FreeFlame convergida, com as mesmas
+        colunas de `write_csv` e os metadados da chama (mecanismo, estado
+        de entrada, modelo de transporte, velocidade de chama).
+
+        Parâmetros:
+        · chama - ct.FreeFlame convergida;
+        · demais - como em grava_perfil; meta complementa os metadados.
+    """
+    import cantera as ct
+
+    gas = chama.gas
+    colunas = {
+        "grid": chama.grid,
+        "velocity": chama.velocity,
+        "T": chama.T,
+        "density": chama.density,
+    }
+    fracoes = chama.X
+    for j, especie in enumerate(gas.species_names):
+        colunas["X_" + especie] = fracoes[j]
+
+    entrada = chama.inlet.X
+    informacoes = {
+        "mecanismo": gas.source,
+        "temp_entrada": float(chama.inlet.T),
+        "press": float(chama.P),
+        "composicao_entrada": {
+            e: float(x) for e, x in zip(gas.species_names, entrada) if x > 0
+        },
+        "tipo_fracao": "X",
+        "transporte": chama.transport_model,
+        "velocidade_chama": float(chama.velocity[0]),
+        "cantera": ct.__version__,
+    }
+    informacoes.update(meta or {})
+    return grava_perfil(destino, colunas, informacoes, limiar, comprime)
+
+
+def converte_csv(origem, destino=None, meta=None, limiar=LIMIAR_PADRAO,
+    comprime=False):
+    """
+        Converte um CSV de `FreeFlame.write_csv` para o formato colunar.
+
+        Parâmetros:
+        · origem - arquivo CSV;
+        · [destino] opcional - diretório do perfil; por padrão, o caminho
+        do CSV sem a extensão;
+        · demais - como em grava_perfil. Os CSVs não registram o
+        mecanismo nem o estado de entrada, que devem ser informados em
+        meta.
+
+        Retornos:
+        · PerfilChama do perfil gravado.
+    """
+    origem = Path(origem)
+    df = pd.read_csv(origem)
+    informacoes = {"origem": origem.name}
+    informacoes.update(meta or {})
+    return grava_perfil(
+        destino or origem.with_suffix(""),
+        {c: df[c].to_numpy() for c in df.columns},
+        informacoes, limiar, comprime
+    )
+
+
+class PerfilChama:
+    """
+        Leitura preguiçosa de um perfil gravado por grava_perfil.
+
+        As colunas são acessadas por nome (perfil["T"], perfil["X_CO"]) ou
+        por espécie (perfil.especie("CO")) e retornadas como arrays somente
+        leitura sem cópia: vistas do mapeamento em memória, ou uma vista de
+        zeros para as colunas nulas. Nos perfis compactados, cada acesso
+        descompacta a coluna em um novo array, que não é retido pelo
+        perfil: guarde o array retornado para reutilizá-lo.
+
+        Parâmetros:
+        · diretorio - diretório do perfil.
+    """
+
+    def __init__(self, diretorio):
+        self.diretorio = Path(diretorio)
+        dados = json.loads((self.diretorio / "meta.json").read_text())
+        if dados["versao_formato"] > VERSAO_FORMATO:
+            raise ValueError(
+                f"Perfil {self.diretorio} gravado em uma versão mais nova "
+                f"do formato ({dados['versao_formato']})."
+            )
+        self.meta = dados["meta"]
+        self.colunas = dados["colunas"]
+        self.nulas = dados["nulas"]
+        self.n_pontos = dados["n_pontos"]
+        self._indices = {c: j for j, c in enumerate(dados["gravadas"])}
+        self._comprimido = dados["comprimido"]
+        self._dados = None
+        self._cache = {}
+
+    def __len__(self):
+        return self.n_pontos
+
+    def __contains__(self, coluna):
+        return coluna in self.colunas
+
+    def __getitem__(self, coluna):
+        if coluna in self._cache:
+            return self._cache[coluna]
+        if coluna in self._indices:
+            if self._comprimido:
+                if self._dados is None:
+                    self._dados = np.load(self.diretorio / "colunas.npz")
+                valores = self._dados[_chave_npz(coluna)]
+                valores.flags.writeable = False
+                return valores
+            else:
+                if self._dados is None:
+                    self._dados = np.load(
+                        self.diretorio / "colunas.npy", mmap_mode="r"
+                    )
+                valores = self._dados[self._indices[coluna]]
+        elif coluna in self.nulas:
+            valores = np.broadcast_to(np.float64(0.), (self.n_pontos,))
+        else:
+            raise KeyError(
+                f"Coluna '{coluna}' ausente do perfil {self.diretorio}."
+            )
+        self._cache[coluna] = valores
+        return valores
+
+    def especie(self, nome, tipo="X"):
+        """
+            Perfil da fração de uma espécie ("X" molar, "Y" mássica).
+        """
+        return self[f"{tipo}_{nome}"]
+
+    def especies(self, tipo="X", presentes=True):
+        """
+            Espécies do perfil; com presentes=True, apenas as não nulas.
+        """
+        prefixo = tipo + "_"
+        return [
+            c[len(prefixo):] for c in self.colunas
+                if c.startswith(prefixo)
+                and not (presentes and c in self.nulas)
+        ]
+
+    def para_dataframe(self, colunas=None):
+        """
+            DataFrame com as colunas pedidas (todas, por padrão), no leiaute
+            do CSV de origem. Copia os dados.
+        """
+        colunas = self.colunas if colunas is None else colunas
+        return pd.DataFrame({c: np.array(self[c]) for c in colunas})
+
+
+def lista_perfis(base):
+    """
+        Perfis gravados nos subdiretórios de base.
+
+        Retornos:
+        · dict nome do subdiretório -> PerfilChama (somente os metadados
+        são lidos).
+    """
+    return {
+        p.parent.name: PerfilChama(p.parent)
+            for p in sorted(Path(base).glob("*/meta.json"))
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Converte CSVs de FreeFlame.write_csv para o arquivo "
+            "colunar de perfis."
+    )
+    parser.add_argument("origens", nargs="+", type=Path)
+    parser.add_argument("--destino", type=Path, default=None,
+        help="diretório base dos perfis (padrão: ao lado de cada CSV)")
+    parser.add_argument("--meta", type=json.loads, default=None,
+        help="metadados comuns em JSON, por exemplo "
+            '\'{"mecanismo": "gri30.yaml", "transporte": "Mix"}\'')
+    parser.add_argument("--limiar", type=float, default=LIMIAR_PADRAO,
+        help="descarta também as colunas com |valor| <= limiar (com "
+            "perda desses valores; padrão: apenas as nulas)")
+    parser.add_argument("--comprime", action="store_true")
+    args = parser.parse_args()
+
+    for origem in args.origens:
+        destino = None if args.destino is None else args.destino / origem.stem
+        perfil = converte_csv(
+            origem, destino, args.meta, args.limiar, args.comprime
+        )
+        print(
+            f"{origem} -> {perfil.diretorio}: "
+            f"{len(perfil.colunas) - len(perfil.nulas)} de "
+            f"{len(perfil.colunas)} colunas gravadas."
+        )
@@ -0,0 +1,372 @@
+"""
+    Cadeia completa de cálculo, vetorizada sobre lotes de pontos de operação:
+
+        composição -> mm_aparente_mistura -> corr_vazao_normal ->
+        balanço estequiométrico -> temp_adiabatica_lote
+
+    Reproduz as etapas de `Combustão_Cantera.py`, em que o O2 livre é uma
+    fração (`fator_o2`) do volume de gases de combustão secos (CO2 + N2)
+    da combustão com ar teórico.
+"""
+import numpy as np
+
+from .estequiometria import PRODUTOS
+from .estequiometria import produtos_combustao
+from .instrumentacao import etapa
+from .entalpia import cria_backend
+from .lote import sensibilidades_tad
+from .lote import temp_adiabatica_lote
+from .mistura import corr_vazao_normal
+from .mistura import mm_aparente_mistura
+from .propriedades import massas_molares
+from .termoquimica import entalpias_formacao
+
+
+def calcula_processo(
+    compostos,
+    fracao,
+    vazao_nm3h,
+    temp_entrada,
+    fator_o2 = 0.1908,
+    t_fracao = "fmol",
+    mmolar = None,
+    razao_n2_o2 = 3.72,
+    backend = "tabela",
+    sensibilidades = False,
+):
+    """
+        Calcula a temperatura adiabática da chama de N pontos de operação.
+
+        Parâmetros:
+        · compostos - sequência com as fórmulas químicas do gás combustível;
+        · fracao - array (n_compostos,) ou (N, n_compostos) com as frações
+        do gás combustível;
+        · vazao_nm3h - float ou array (N,) com a vazão normal em Nm³/h;
+        · temp_entrada - float ou array (N,) com a temperatura do gás em K;
+        · [fator_o2] opcional - float ou array (N,), O2 livre como fração do
+        volume de gases de combustão secos com ar teórico;
+        · [t_fracao] opcional - "fmol" ou "fmass" (ver mm_aparente_mistura);
+        · [mmolar] opcional - massas molares em g/mol ou None (CoolProp);
+        · [razao_n2_o2] opcional - mols de N2 por mol de O2 no ar;
+        · [backend] opcional - backend de entalpia (ver entalpia.py);
+        · [sensibilidades] opcional - booleano; quando True, inclui as
+        derivadas da temperatura adiabática (ver etapa_sensibilidades).
+
+        Retornos:
+        · dict de arrays (N,) com a massa molar aparente "mma", o fator de
+        compressibilidade "z_m", as vazões "vaz_mass" (kg/s) e "vaz_mol"
+        (mol/s), o O2 "o2_teorico" e "o2_ar", o "excesso_ar" (%), a
+        temperatura adiabática "tad" (K) e a máscara "convergiu", além das
+        vazões molares de cada produto com o prefixo "prod_" e, quando
+        sensibilidades é True, as derivadas com o prefixo "dtad_".
+    """
+    fracao, vazao_nm3h, temp_entrada, fator_o2 = normaliza_entradas(
+        fracao, vazao_nm3h, temp_entrada, fator_o2
+    )
+    with etapa("mm_aparente_mistura"):
+        mma, z_m, fmol = etapa_mistura(compostos, fracao, t_fracao, mmolar)
+    with etapa("corr_vazao_normal"):
+        vaz_mass, vaz_mol, vazoes = etapa_vazoes(
+            mma, z_m, fmol, vazao_nm3h, temp_entrada
+        )
+    with etapa("estequiometria"):
+        prod_teo, o2_teo = etapa_ar_teorico(compostos, vazoes, razao_n2_o2)
+        o2_ar, produtos = etapa_produtos(
+            compostos, vazoes, prod_teo, o2_teo, fator_o2, razao_n2_o2
+        )
+    with etapa("temp_adiabatica_lote"):
+        tad, convergiu = etapa_tad(
+            compostos, vazoes, o2_ar, produtos, temp_entrada, razao_n2_o2,
+            backend
+        )
+    resultado = monta_resultado(
+        mma, z_m, vaz_mass, vaz_mol, o2_teo, o2_ar, produtos, tad, convergiu
+    )
+    if sensibilidades:
+        with etapa("sensibilidades"):
+            resultado.update(etapa_sensibilidades(
+                compostos, vazoes, o2_ar, produtos, tad, temp_entrada,
+                fator_o2, razao_n2_o2, backend
+            ))
+    return resultado
+
+
+def calcula_fator_o2(
+    compostos,
+    fracao,
+    vazao_nm3h,
+    temp_entrada,
+    tad_alvo,
+    t_fracao = "fmol",
+    mmolar = None,
+    razao_n2_o2 = 3.72,
+    backend = "tabela",
+):
+    """
+        Problema inverso de calcula_processo: determina o ar de combustão
+        que leva cada um de N pontos de operação a uma temperatura
+        adiabática alvo.
+
+        Com a combustão completa e o ar à temperatura de entrada, o resíduo
+        de energia avaliado na temperatura alvo é linear no O2 do ar, de
+        modo que o O2 necessário é obtido diretamente, sem busca
+        iterativa (ver etapa_o2_alvo).
+
+        Parâmetros:
+        · tad_alvo - float ou array (N,) com a temperatura adiabática alvo
+        em K;
+        · demais - como em calcula_processo.
+
+        Retornos:
+        · dict no formato de calcula_processo, com "tad" igual ao alvo,
+        acrescido do "fator_o2" correspondente. A máscara "convergiu" é
+        falsa nos pontos sem solução com ar em excesso ou teórico (alvo
+        acima da temperatura da combustão estequiométrica ou abaixo da
+        temperatura de entrada).
+    """
+    fracao, vazao_nm3h, temp_entrada, tad_alvo = normaliza_entradas(
+        fracao, vazao_nm3h, temp_entrada, tad_alvo
+    )
+    with etapa("mm_aparente_mistura"):
+        mma, z_m, fmol = etapa_mistura(compostos, fracao, t_fracao, mmolar)
+    with etapa("corr_vazao_normal"):
+        vaz_mass, vaz_mol, vazoes = etapa_vazoes(
+            mma, z_m, fmol, vazao_nm3h, temp_entrada
+        )
+    with etapa("estequiometria"):
+        prod_teo, o2_teo = etapa_ar_teorico(compostos, vazoes, razao_n2_o2)
+    with etapa("o2_alvo"):
+        o2_ar = etapa_o2_alvo(
+            compostos, vazoes, tad_alvo, temp_entrada, razao_n2_o2, backend
+        )
+    with etapa("estequiometria"):
+        produtos, _ = produtos_combustao(
+            vazoes, compostos, o2_ar, razao_n2_o2
+        )
+    secos = prod_teo[:, PRODUTOS.index("CO2")] +\
+        prod_teo[:, PRODUTOS.index("N2")]
+    viavel = (o2_ar >= o2_teo * (1 - 1e-12)) & (tad_alvo > temp_entrada)
+
+    resultado = monta_resultado(
+        mma, z_m, vaz_mass, vaz_mol, o2_teo, o2_ar, produtos,
+        np.array(tad_alvo), viavel
+    )
+    resultado["fator_o2"] = (o2_ar - o2_teo) / secos
+    return resultado
+
+
+# Etapas da cadeia, compartilhadas com o grafo memorizado (ver grafo.py).
+# Todas recebem arrays já ajustados ao número de pontos N.
+
+def normaliza_entradas(fracao, vazao_nm3h, temp_entrada, fator_o2):
+    """
+        Ajusta as entradas ao número comum de pontos N.
+
+        Retornos:
+        · fracao (N, n_compostos) e vazao_nm3h, temp_entrada e fator_o2
+        (N,), como vistas somente leitura.
+    """
+    fracao = np.atleast_2d(np.asarray(fracao, dtype=float))
+    vazao_nm3h, temp_entrada, fator_o2 = np.broadcast_arrays(
+        np.atleast_1d(np.asarray(vazao_nm3h, dtype=float)),
+        np.atleast_1d(np.asarray(temp_entrada, dtype=float)),
+        np.atleast_1d(np.asarray(fator_o2, dtype=float)),
+    )
+    n_pontos = max(len(vazao_nm3h), len(fracao))
+    vazao_nm3h, temp_entrada, fator_o2 = (
+        np.broadcast_to(v, (n_pontos,))
+            for v in (vazao_nm3h, temp_entrada, fator_o2)
+    )
+    fracao = np.broadcast_to(fracao, (n_pontos, fracao.shape[-1]))
+    return fracao, vazao_nm3h, temp_entrada, fator_o2
+
+
+def etapa_mistura(compostos, fracao, t_fracao, mmolar):
+    """
+        Massa molar aparente, fator de compressibilidade e frações molares.
+    """
+    n_pontos = len(fracao)
+    mma, _, z_m = mm_aparente_mistura(compostos, mmolar, fracao, t_fracao)
+    mma = np.broadcast_to(mma, (n_pontos,))
+    z_m = np.broadcast_to(z_m, (n_pontos,))
+
+    if t_fracao.lower() == "fmass":
+        fmol = fracao * mma[:, None] / (
+            np.asarray(mmolar, dtype=float) / 1e3 if mmolar is not None
+            else massas_molares(compostos)
+        )
+    else:
+        fmol = fracao
+    return mma, z_m, fmol
+
+
+def etapa_vazoes(mma, z_m, fmol, vazao_nm3h, temp_entrada):
+    """
+        Vazões mássica e molar corrigidas e vazões molares por composto.
+    """
+    vaz_mass, vaz_mol = corr_vazao_normal(
+        vazao_nm3h / 3600, z_m, mma, temp_entrada
+    )
+    return vaz_mass, vaz_mol, fmol * vaz_mol[:, None]
+
+
+def etapa_ar_teorico(compostos, vazoes, razao_n2_o2):
+    """
+        Produtos da combustão com ar teórico e O2 teórico.
+    """
+    return produtos_combustao(vazoes, compostos, razao_n2_o2=razao_n2_o2)
+
+
+def etapa_produtos(compostos, vazoes, prod_teo, o2_teo, fator_o2, 
+    razao_n2_o2):
+    """
+        O2 do ar, com o O2 livre sobre os gases secos (CO2 + N2) da
+        combustão com ar teórico, e os produtos balanceados.
+    """
+    secos = prod_teo[:, PRODUTOS.index("CO2")] +\
+        prod_teo[:, PRODUTOS.index("N2")]
+    o2_ar = o2_teo + fator_o2 * secos
+    produtos, _ = produtos_combustao(vazoes, compostos, o2_ar, razao_n2_o2)
+    return o2_ar, produtos
+
+
+def etapa_tad(compostos, vazoes, o2_ar, produtos, temp_entrada, razao_n2_o2,
+    backend):
+    """
+        Temperatura adiabática da chama e máscara de convergência.
+    """
+    reagentes, n_reag = _reagentes(compostos, vazoes, o2_ar, razao_n2_o2)
+    presentes = _presentes(produtos)
+    tad, convergiu, _ = temp_adiabatica_lote(
+        n_reag,
+        produtos[:, presentes],
+        reagentes,
+        [PRODUTOS[j] for j in presentes],
+        temp_reagentes=temp_entrada,
+        backend=backend,
+    )
+    return tad, convergiu
+
+
+def etapa_sensibilidades(compostos, vazoes, o2_ar, produtos, tad, 
+    temp_entrada, fator_o2, razao_n2_o2, backend):
+    """
+        Derivadas da temperatura adiabática na raiz, por diferenciação
+        implícita do balanço de energia (ver lote.sensibilidades_tad)
+        encadeada com o balanço estequiométrico, ao custo de uma avaliação
+        do resíduo.
+
+        Retornos:
+        · dict de arrays (N,) com:
+            "dtad_dvaz_<composto>" - K por mol/s de cada composto do gás
+            combustível, com o fator de O2 livre mantido (o ar acompanha
+            o combustível);
+            "dtad_do2_ar" - K por mol/s de O2 do ar (com o seu N2);
+            "dtad_dfator_o2" - K por unidade de fator_o2;
+            "dtad_dtemp_entrada" - K por K da temperatura de entrada.
+    """
+    reagentes, n_reag = _reagentes(compostos, vazoes, o2_ar, razao_n2_o2)
+    presentes = _presentes(produtos)
+    derivadas = sensibilidades_tad(
+        tad, n_reag, produtos[:, presentes], reagentes,
+        [PRODUTOS[j] for j in presentes], temp_entrada, backend
+    )
+    d_reag = derivadas["n_reagentes"]
+    d_o2_ar = d_reag[:, reagentes.index("O2")] +\
+        razao_n2_o2 * d_reag[:, reagentes.index("N2")]
+
+    # O2 do ar por mol de cada composto: o2_ar = o2_teo + fator_o2 · secos,
+    # ambos lineares nas vazões
+    prod_unit, o2_unit = produtos_combustao(
+        np.eye(len(compostos)), compostos, razao_n2_o2=razao_n2_o2
+    )
+    secos_unit = prod_unit[:, PRODUTOS.index("CO2")] +\
+        prod_unit[:, PRODUTOS.index("N2")]
+    d_o2_vaz = o2_unit + fator_o2[:, None] * secos_unit
+
+    resultado = {
+        "dtad_dvaz_" + c: d_reag[:, j] + d_o2_ar * d_o2_vaz[:, j]
+            for j, c in enumerate(compostos)
+    }
+    resultado["dtad_do2_ar"] = d_o2_ar
+    resultado["dtad_dfator_o2"] = d_o2_ar * (vazoes @ secos_unit)
+    resultado["dtad_dtemp_entrada"] = derivadas["temp_reagentes"]
+    return resultado
+
+
+def _reagentes(compostos, vazoes, o2_ar, razao_n2_o2):
+    """
+        Reagentes (gás combustível + ar) e as suas vazões molares.
+    """
+    reagentes = list(compostos)
+    n_reag = vazoes.copy()
+    for c in ("O2", "N2"):
+        if c not in reagentes:
+            reagentes.append(c)
+            n_reag = np.column_stack([n_reag, np.zeros(len(vazoes))])
+    n_reag[:, reagentes.index("O2")] += o2_ar
+    n_reag[:, reagentes.index("N2")] += razao_n2_o2 * o2_ar
+    return reagentes, n_reag
+
+
+def _presentes(produtos, sempre=("CO2", "H2O", "N2")):
+    """
+        Colunas de PRODUTOS presentes no lote (os compostos de sempre são
+        incluídos mesmo com vazão nula).
+    """
+    return [
+        j for j, c in enumerate(PRODUTOS)
+            if c in sempre or not np.allclose(produtos[:, j], 0)
+    ]
+
+
+def etapa_o2_alvo(compostos, vazoes, tad_alvo, temp_entrada, razao_n2_o2,
+    backend):
+    """
+        O2 do ar que anula o resíduo de energia na temperatura alvo:
+
+            f(T) = f_0(T) + o2_ar · f_ar(T) = 0
+
+        em que f_0 é o resíduo sem ar (produtos com O2 negativo) e f_ar o
+        aquecimento de um mol de O2 e razao_n2_o2 mols de N2 da
+        temperatura de entrada até T.
+    """
+    zeros = np.zeros(len(vazoes))
+    reagentes, n_reag = _reagentes(compostos, vazoes, zeros, razao_n2_o2)
+    prod_0, _ = produtos_combustao(vazoes, compostos, zeros, razao_n2_o2)
+    # O2 e N2 entram no termo do ar mesmo que o lote não os produza
+    presentes = _presentes(prod_0, ("CO2", "H2O", "N2", "O2"))
+    nomes = [PRODUTOS[j] for j in presentes]
+
+    h_prod = entalpias_formacao(nomes) +\
+        cria_backend(backend, tuple(nomes)).h_sensivel(tad_alvo)
+    h_reag = entalpias_formacao(reagentes) +\
+        cria_backend(backend, tuple(reagentes)).h_sensivel(temp_entrada)
+    f_0 = np.einsum("ij,ij->i", prod_0[:, presentes], h_prod) -\
+        np.einsum("ij,ij->i", n_reag, h_reag)
+
+    # Ar: 1 O2 + razao_n2_o2 N2, nos reagentes e nos produtos
+    ar_prod = h_prod[:, nomes.index("O2")] +\
+        razao_n2_o2 * h_prod[:, nomes.index("N2")]
+    ar_reag = h_reag[:, reagentes.index("O2")] +\
+        razao_n2_o2 * h_reag[:, reagentes.index("N2")]
+    return -f_0 / (ar_prod - ar_reag)
+
+
+def monta_resultado(
+    mma, z_m, vaz_mass, vaz_mol, o2_teo, o2_ar, produtos, tad, convergiu
+):
+    resultado = {
+        "mma": mma,
+        "z_m": z_m,
+        "vaz_mass": vaz_mass,
+        "vaz_mol": vaz_mol,
+        "o2_teorico": o2_teo,
+        "o2_ar": o2_ar,
+        "excesso_ar": 100 * (o2_ar / o2_teo - 1),
+        "tad": tad,
+        "convergiu": convergiu,
+    }
+    for j, c in enumerate(PRODUTOS):
+        resultado["prod_" + c] = produtos[:, j]
+    return resultado
@@ -0,0 +1,221 @@
+"""
+    Propriedades de compostos puros com memorização.
+
+    · massas molares - constantes, memorizadas por composto;
+    · fator de compressibilidade Z - memorizado por (composto, T, p) em um
+    cache LRU de tamanho limitado. Estados ausentes do cache são calculados
+    em uma única chamada vetorizada do PropsSI por composto;
+    · densidade molar de misturas reais - avaliada por objetos
+    AbstractState do CoolProp construídos uma única vez por (equação de
+    estado, compostos) e por thread, evitando a interpretação das strings
+    da interface PropsSI a cada chamada.
+"""
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+
+import CoolProp
+import numpy as np
+from CoolProp.CoolProp import AbstractState
+from CoolProp.CoolProp import PropsSI
+
+from .instrumentacao import conta
+
+
+class CacheLRU:
+    """
+        Dicionário de tamanho limitado que descarta as entradas usadas há
+        mais tempo. Contabiliza acertos e faltas.
+    """
+
+    def __init__(self, tamanho_max):
+        self.tamanho_max = tamanho_max
+        self.acertos = 0
+        self.faltas = 0
+        self._dados = OrderedDict()
+
+    def __contains__(self, chave):
+        return chave in self._dados
+
+    def __len__(self):
+        return len(self._dados)
+
+    def busca(self, chave, padrao=None):
+        try:
+            valor = self._dados[chave]
+        except KeyError:
+            self.faltas += 1
+            return padrao
+        self._dados.move_to_end(chave)
+        self.acertos += 1
+        return valor
+
+    def insere(self, chave, valor):
+        self._dados[chave] = valor
+        self._dados.move_to_end(chave)
+        self._descarta()
+
+    def redimensiona(self, tamanho_max):
+        self.tamanho_max = tamanho_max
+        self._descarta()
+
+    def _descarta(self):
+        while len(self._dados) > self.tamanho_max:
+            self._dados.popitem(last=False)
+
+    def limpa(self):
+        self._dados.clear()
+        self.acertos = 0
+        self.faltas = 0
+
+    def info(self):
+        return {
+            "acertos": self.acertos,
+            "faltas": self.faltas,
+            "tamanho": len(self._dados),
+            "tamanho_max": self.tamanho_max,
+        }
+
+
+_CACHE_Z = CacheLRU(tamanho_max=2**16)
+_POOL_ESTADOS = threading.local()
+
+
+@lru_cache(maxsize=None)
+def massa_molar(composto):
+    """
+        Massa molar de um composto em kg/mol.
+    """
+    conta("propssi")
+    return PropsSI("MOLARMASS", composto)
+
+
+def massas_molares(compostos):
+    """
+        Array com as massas molares dos compostos em kg/mol.
+    """
+    return np.array([massa_molar(c) for c in compostos])
+
+
+def fator_z(compostos, temp, press):
+    """
+        Fatores de compressibilidade dos compostos puros em lotes de estados.
+
+        Parâmetros:
+        · compostos - sequência com os nomes dos compostos (CoolProp);
+        · temp - float ou array com as temperaturas em K;
+        · press - float ou array com as pressões em Pa.
+
+        Retornos:
+        · array com forma (forma dos estados) + (n_compostos,). Estados não
+        suportados pelo CoolProp retornam NaN.
+    """
+    temp, press = np.broadcast_arrays(
+        np.asarray(temp, dtype=float), np.asarray(press, dtype=float)
+    )
+    estados, inverso = np.unique(
+        np.column_stack([temp.ravel(), press.ravel()]),
+        axis=0,
+        return_inverse=True
+    )
+    z = np.empty((len(estados), len(compostos)))
+
+    for j, c in enumerate(compostos):
+        chaves = [(c, t, p) for t, p in estados.tolist()]
+        valores = [_CACHE_Z.busca(k) for k in chaves]
+        faltas = [i for i, v in enumerate(valores) if v is None]
+        if faltas:
+            conta("propssi")
+            novos = np.atleast_1d(PropsSI(
+                "Z", 'T', estados[faltas, 0], 'P', estados[faltas, 1], c
+            )).astype(float)
+            novos[~np.isfinite(novos)] = np.nan
+            for i, v in zip(faltas, novos.tolist()):
+                valores[i] = v
+                _CACHE_Z.insere(chaves[i], v)
+        z[:, j] = valores
+
+    return z[inverso.ravel()].reshape(temp.shape + (len(compostos),))
+
+
+def estado_mistura(compostos, eos="HEOS"):
+    """
+        Retorna o objeto AbstractState da mistura de compostos para a 
+        equação de estado indicada ("HEOS", "PR", "SRK", ...), construindo-o
+        apenas no primeiro uso em cada thread. A fase é fixada como gasosa.
+    """
+    pool = _POOL_ESTADOS.__dict__.setdefault("estados", {})
+    chave = (eos, tuple(compostos))
+    estado = pool.get(chave)
+    if estado is None:
+        estado = AbstractState(eos, "&".join(compostos))
+        estado.specify_phase(CoolProp.iphase_gas)
+        pool[chave] = estado
+    return estado
+
+
+def densidade_molar(compostos, fracoes, temp, press, eos="HEOS"):
+    """
+        Densidade molar (mol/m³) de uma mistura de gases reais em lotes de
+        estados, por meio do pool de objetos AbstractState.
+
+        Parâmetros:
+        · compostos - sequência com os nomes dos compostos (CoolProp);
+        · fracoes - array (n_compostos,) com as frações molares ou 
+        (N, n_compostos) com uma composição por estado;
+        · temp - float ou array com as temperaturas em K;
+        · press - float ou array com as pressões em Pa;
+        · [eos] opcional - equação de estado do CoolProp.
+
+        Retornos:
+        · float ou array com a forma dos estados.
+    """
+    estado = estado_mistura(compostos, eos)
+    fracoes = np.asarray(fracoes, dtype=float)
+    if fracoes.ndim > 1:
+        # Os estados seguem a forma comum de T, p e das composições
+        temp, press, _ = np.broadcast_arrays(
+            np.asarray(temp, dtype=float), np.asarray(press, dtype=float),
+            fracoes[..., 0]
+        )
+        fracoes = np.broadcast_to(fracoes, temp.shape + fracoes.shape[-1:])
+    else:
+        temp, press = np.broadcast_arrays(
+            np.asarray(temp, dtype=float), np.asarray(press, dtype=float)
+        )
+        estado.set_mole_fractions(fracoes.tolist())
+
+    rho = np.empty(temp.shape)
+    conta("abstractstate", rho.size)
+    for i in np.ndindex(temp.shape):
+        if fracoes.ndim > 1:
+            estado.set_mole_fractions(fracoes[i].tolist())
+        estado.update(CoolProp.PT_INPUTS, press[i], temp[i])
+        rho[i] = estado.rhomolar()
+
+    return rho if rho.ndim else float(rho)
+
+
+def define_tamanho_cache_z(tamanho_max):
+    """
+        Altera o número máximo de estados (composto, T, p) memorizados.
+    """
+    _CACHE_Z.redimensiona(tamanho_max)
+
+
+def info_caches():
+    """
+        Estatísticas dos caches de propriedades.
+    """
+    return {
+        "massa_molar": massa_molar.cache_info()._asdict(),
+        "fator_z": _CACHE_Z.info(),
+    }
+
+
+def limpa_caches():
+    """
+        Esvazia os caches de propriedades.
+    """
+    massa_molar.cache_clear()
+    _CACHE_Z.limpa()
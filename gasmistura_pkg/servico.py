@@ -0,0 +1,155 @@
+"""
+    Interface assíncrona (asyncio) para servir cálculos a vários clientes,
+    por exemplo painéis que consultam periodicamente o mesmo ponto de
+    operação do forno.
+
+    Os cálculos são despachados para um pool de trabalhadores (processos,
+    por padrão) e não bloqueiam o laço de eventos. Solicitações idênticas
+    (mesma função, composição, estado e opções) feitas enquanto a primeira
+    ainda está em andamento são agrupadas: todas aguardam o mesmo cálculo
+    e recebem o mesmo resultado, que deve ser tratado como somente leitura.
+
+    Os arquivos de cada cálculo (dados e log de temp_adiabatica com
+    salva_dados=True) são gravados em um diretório exclusivo da execução
+    (ver instrumentacao.diretorio_execucao), informado em info["diretorio"],
+    de modo que cálculos simultâneos não se sobrescrevem.
+
+        async with ServicoTad(n_trabalhadores=4) as servico:
+            temp, phi, info = await servico.temp_adiabatica(
+                reagentes, produtos, ar_teorico
+            )
+"""
+import asyncio
+import functools
+import hashlib
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from .corrente import LINHA_VAZAO
+from .corrente import CorrenteGas
+from .mistura import temp_adiabatica
+from .processo import calcula_processo
+
+
+def _chave(funcao, args, kwargs):
+    """
+        Hash de uma solicitação: nome da função e conteúdo dos argumentos.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"{funcao.__module__}.{funcao.__qualname__}".encode())
+    h.update(pickle.dumps(
+        (args, sorted(kwargs.items())), protocol=pickle.HIGHEST_PROTOCOL
+    ))
+    return h.hexdigest()
+
+
+def _corrente(valor):
+    if isinstance(valor, pd.DataFrame):
+        return CorrenteGas.de_dataframe(valor, LINHA_VAZAO)
+    return valor
+
+
+class ServicoTad:
+    """
+        Serviço assíncrono de cálculo com agrupamento de solicitações.
+
+        Parâmetros:
+        · [n_trabalhadores] opcional - número de processos do pool, por
+        padrão o número de CPUs;
+        · [executor] opcional - concurrent.futures.Executor a utilizar no
+        lugar do pool de processos (não é encerrado pelo serviço);
+        · [diretorio_execucoes] opcional - diretório base dos diretórios
+        de cada execução.
+
+        As funções executadas devem ser definidas no nível de módulo e os
+        argumentos serializáveis por pickle, como exigido pelo pool de
+        processos.
+    """
+
+    def __init__(
+        self,
+        n_trabalhadores = None,
+        executor = None,
+        diretorio_execucoes = "execucoes",
+    ):
+        self._proprio = executor is None
+        self._executor = executor or ProcessPoolExecutor(n_trabalhadores)
+        self.diretorio_execucoes = diretorio_execucoes
+        self._em_andamento = {}
+        self.estatisticas = {
+            "solicitacoes": 0, "execucoes": 0, "agrupadas": 0
+        }
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        self.fecha()
+
+    def fecha(self):
+        """
+            Encerra o pool de trabalhadores próprio do serviço.
+        """
+        if self._proprio:
+            self._executor.shutdown(wait=True)
+
+    def em_andamento(self):
+        """
+            Número de cálculos distintos em andamento.
+        """
+        return len(self._em_andamento)
+
+    async def submete(self, funcao, *args, **kwargs):
+        """
+            Executa funcao(*args, **kwargs) no pool, agrupando-a com uma
+            solicitação idêntica em andamento, se houver.
+
+            O cancelamento de um cliente não cancela o cálculo compartilhado
+            com os demais.
+        """
+        chave = _chave(funcao, args, kwargs)
+        self.estatisticas["solicitacoes"] += 1
+        futuro = self._em_andamento.get(chave)
+        if futuro is None:
+            self.estatisticas["execucoes"] += 1
+            futuro = asyncio.get_running_loop().run_in_executor(
+                self._executor, functools.partial(funcao, *args, **kwargs)
+            )
+            self._em_andamento[chave] = futuro
+
+            def remove(_):
+                if self._em_andamento.get(chave) is futuro:
+                    del self._em_andamento[chave]
+
+            futuro.add_done_callback(remove)
+        else:
+            self.estatisticas["agrupadas"] += 1
+        return await asyncio.shield(futuro)
+
+    async def temp_adiabatica(
+        self, reagentes, produtos, ar_teorico, metodo="brentq", **opcoes
+    ):
+        """
+            temp_adiabatica (ver mistura.py) no pool de trabalhadores.
+
+            Reagentes e produtos podem ser DataFrames ou CorrenteGas. Com
+            salva_dados=True, os arquivos são gravados em um diretório
+            exclusivo sob diretorio_execucoes.
+        """
+        opcoes.setdefault("diretorio_dados", self.diretorio_execucoes)
+        return await self.submete(
+            temp_adiabatica, _corrente(reagentes), _corrente(produtos),
+            ar_teorico, metodo, **opcoes
+        )
+
+    async def calcula_processo(self, compostos, fracao, vazao_nm3h,
+        temp_entrada, **opcoes):
+        """
+            calcula_processo (ver processo.py) no pool de trabalhadores.
+        """
+        return await self.submete(
+            calcula_processo, tuple(compostos), fracao, vazao_nm3h,
+            temp_entrada, **opcoes
+        )
@@ -0,0 +1,334 @@
+"""
+    Tabela pré-calculada da temperatura adiabática de chama para consultas
+    em tempo real (malha de controle dos queimadores).
+
+    A tabela é gerada uma única vez, fora da malha de controle, pela cadeia
+    vetorizada de `processo.py` em uma grade regular de composições
+    (frações molares de todos os compostos, exceto um composto de
+    balanço), fatores de O2 livre e temperaturas de entrada. A temperatura
+    adiabática não depende da vazão, de modo que a tabela vale para
+    qualquer vazão de gás.
+
+    O diretório da tabela contém:
+    · tad.npy - array da temperatura adiabática (K) na grade, lido como
+    arquivo mapeado em memória;
+    · meta.json - eixos da grade, compostos, parâmetros do cálculo e a
+    estimativa do erro de interpolação, obtida em pontos de validação
+    sorteados no interior da grade e resolvidos pelo método exato.
+
+    As consultas interpolam multilinearmente a tabela. Pontos fora da
+    faixa da grade e pontos de células com algum vértice sem solução
+    (composição de balanço negativa ou cálculo não convergido) são
+    resolvidos pelo método exato e sinalizados em máscaras distintas.
+
+    Uso pela linha de comando, com os eixos em um arquivo JSON:
+
+        python -m gasmistura_pkg.tabela_tad eixos.json destino/
+"""
+import argparse
+import itertools
+import json
+from pathlib import Path
+
+import numpy as np
+
+from .processo import calcula_processo
+
+EIXOS_OPERACAO = ("fator_o2", "temp_entrada")
+
+
+def eixos_composicao(compostos, fracao, balanco="N2", variacao=0.2, n=3):
+    """
+        Eixos de composição em torno de uma composição de referência.
+
+        Parâmetros:
+        · compostos - sequência com as fórmulas químicas do gás;
+        · fracao - frações molares de referência;
+        · [balanco] opcional - composto que completa a soma das frações;
+        · [variacao] opcional - variação relativa em torno de cada fração;
+        · [n] opcional - número de pontos por eixo.
+
+        Retornos:
+        · dict composto -> lista de frações, sem o composto de balanço.
+    """
+    fracao = np.asarray(fracao, dtype=float)
+    fracao = fracao / fracao.sum()
+    return {
+        c: np.linspace(
+            f * (1 - variacao), f * (1 + variacao), n
+        ).tolist()
+        for c, f in zip(compostos, fracao) if c != balanco
+    }
+
+
+def _fracoes_grade(compostos, balanco, eixos_comp, pontos):
+    """
+        Frações molares completas (N, n_compostos) a partir das coordenadas
+        de composição dos pontos; o composto de balanço completa a soma.
+    """
+    fracao = np.zeros((len(pontos), len(compostos)))
+    for j, c in enumerate(eixos_comp):
+        fracao[:, compostos.index(c)] = pontos[:, j]
+    fracao[:, compostos.index(balanco)] = 1 - pontos.sum(axis=1)
+    return fracao
+
+
+def _resolve_exato(meta, fracao, fator_o2, temp_entrada, tamanho_bloco):
+    """
+        Temperatura adiabática exata (cadeia de processo.py), em blocos.
+        Composições com fração de balanço negativa resultam em NaN.
+    """
+    tad = np.full(len(fracao), np.nan)
+    validos = np.flatnonzero(fracao[:, meta["compostos"].index(
+        meta["balanco"])] >= 0)
+    for inicio in range(0, len(validos), tamanho_bloco):
+        i = validos[inicio:inicio + tamanho_bloco]
+        resultado = calcula_processo(
+            meta["compostos"], fracao[i], 1.0, temp_entrada[i], fator_o2[i],
+            razao_n2_o2=meta["razao_n2_o2"], backend=meta["backend"],
+        )
+        tad[i] = np.where(resultado["convergiu"], resultado["tad"], np.nan)
+    return tad
+
+
+def gera_tabela_tad(
+    destino,
+    compostos,
+    eixos,
+    balanco = "N2",
+    razao_n2_o2 = 3.72,
+    backend = "tabela",
+    n_validacao = 2000,
+    tamanho_bloco = 100000,
+    semente = 0,
+):
+    """
+        Gera a tabela da temperatura adiabática de chama.
+
+        Parâmetros:
+        · destino - diretório da tabela, sobrescrito;
+        · compostos - sequência com as fórmulas químicas do gás;
+        · eixos - dict com as listas crescentes "fator_o2" (O2 livre sobre
+        os gases de combustão secos), "temp_entrada" (K) e as frações
+        molares de cada composto, exceto o de balanço (ver
+        eixos_composicao);
+        · [balanco] opcional - composto que completa a soma das frações;
+        · [razao_n2_o2] opcional - mols de N2 por mol de O2 no ar;
+        · [backend] opcional - backend de entalpia (ver entalpia.py);
+        · [n_validacao] opcional - número de pontos sorteados para a
+        estimativa do erro de interpolação;
+        · [tamanho_bloco] opcional - pontos resolvidos por chamada;
+        · [semente] opcional - semente do sorteio de validação.
+
+        A temperatura adiabática é praticamente linear na composição e na
+        temperatura de entrada, mas fortemente curva no fator de O2 livre:
+        concentre os pontos nesse eixo (cerca de 33 pontos entre 0 e 0,4
+        resultam em erro máximo próximo de 2 K). O erro estimado em
+        meta.json denuncia eixos com pontos insuficientes.
+
+        Retornos:
+        · dict com os metadados gravados em meta.json.
+    """
+    compostos = list(compostos)
+    eixos_comp = [c for c in compostos if c != balanco]
+    faltantes = [
+        e for e in EIXOS_OPERACAO + tuple(eixos_comp) if e not in eixos
+    ]
+    if balanco not in compostos or faltantes:
+        raise KeyError(
+            "Eixos ausentes da tabela: "
+            f"{', '.join(faltantes or [balanco])}."
+        )
+    nomes = list(EIXOS_OPERACAO) + eixos_comp
+    valores = [np.asarray(eixos[e], dtype=float) for e in nomes]
+    for nome, v in zip(nomes, valores):
+        if v.size < 2 or np.any(np.diff(v) <= 0):
+            raise ValueError(
+                f"O eixo '{nome}' deve ter ao menos dois valores crescentes."
+            )
+
+    meta = {
+        "compostos": compostos,
+        "balanco": balanco,
+        "eixos": {e: v.tolist() for e, v in zip(nomes, valores)},
+        "razao_n2_o2": razao_n2_o2,
+        "backend": backend,
+    }
+
+    forma = tuple(v.size for v in valores)
+    pontos = np.stack(
+        [m.ravel() for m in np.meshgrid(*valores, indexing="ij")], axis=1
+    )
+    tad = _resolve_exato(
+        meta, _fracoes_grade(compostos, balanco, eixos_comp, pontos[:, 2:]),
+        pontos[:, 0], pontos[:, 1], tamanho_bloco
+    )
+
+    destino = Path(destino)
+    destino.mkdir(parents=True, exist_ok=True)
+    np.save(destino / "tad.npy", tad.reshape(forma))
+
+    # Erro de interpolação em pontos sorteados no interior da grade
+    gerador = np.random.default_rng(semente)
+    amostra = np.column_stack([
+        gerador.uniform(v[0], v[-1], n_validacao) for v in valores
+    ])
+    fracao = _fracoes_grade(compostos, balanco, eixos_comp, amostra[:, 2:])
+    exato = _resolve_exato(
+        meta, fracao, amostra[:, 0], amostra[:, 1], tamanho_bloco
+    )
+    tabela = TabelaTad.__new__(TabelaTad)
+    tabela._inicializa(meta, tad.reshape(forma))
+    interpolado, _ = tabela._interpola(amostra)
+    erro = np.abs(interpolado - exato)
+    erro = erro[np.isfinite(erro)]
+    meta["erro"] = {
+        "n_pontos": int(erro.size),
+        "max": float(erro.max()) if erro.size else None,
+        "rms": float(np.sqrt(np.mean(erro**2))) if erro.size else None,
+        "p99": float(np.percentile(erro, 99)) if erro.size else None,
+    }
+
+    (destino / "meta.json").write_text(json.dumps(meta, indent=2))
+    return meta
+
+
+class TabelaTad:
+    """
+        Consultas vetorizadas à tabela da temperatura adiabática.
+
+        A tabela é mapeada em memória na construção; as consultas leem
+        apenas os vértices das células necessárias.
+
+        Parâmetros:
+        · diretorio - diretório gerado por gera_tabela_tad.
+    """
+
+    def __init__(self, diretorio):
+        diretorio = Path(diretorio)
+        meta = json.loads((diretorio / "meta.json").read_text())
+        self._inicializa(meta, np.load(diretorio / "tad.npy", mmap_mode="r"))
+
+    def _inicializa(self, meta, tad):
+        self.meta = meta
+        self.compostos = meta["compostos"]
+        self.erro = meta.get("erro")
+        self._tad = tad.reshape(-1)
+        self._eixos = [np.asarray(v) for v in meta["eixos"].values()]
+        self._colunas = [
+            self.compostos.index(c) for c in list(meta["eixos"])[2:]
+        ]
+        forma = np.array([v.size for v in self._eixos])
+        self._passos = np.append(np.cumprod(forma[::-1])[::-1][1:], 1)
+        # Vértices da célula: deslocamentos binários e índices lineares
+        self._vertices = np.array(
+            list(itertools.product((0, 1), repeat=len(self._eixos))),
+            dtype=bool
+        )
+        self._deslocamentos = self._vertices.astype(np.intp) @ self._passos
+
+    def _coordenadas(self, fracao, fator_o2, temp_entrada):
+        fracao = np.atleast_2d(np.asarray(fracao, dtype=float))
+        fator_o2, temp_entrada = np.broadcast_arrays(
+            np.atleast_1d(np.asarray(fator_o2, dtype=float)),
+            np.atleast_1d(np.asarray(temp_entrada, dtype=float)),
+        )
+        n_pontos = max(len(fracao), len(fator_o2))
+        fracao = np.broadcast_to(
+            fracao / fracao.sum(axis=1, keepdims=True),
+            (n_pontos, fracao.shape[1])
+        )
+        return np.column_stack([
+            np.broadcast_to(fator_o2, (n_pontos,)),
+            np.broadcast_to(temp_entrada, (n_pontos,)),
+            fracao[:, self._colunas],
+        ]), fracao
+
+    def _interpola(self, pontos):
+        """
+            Interpolação multilinear; pontos fora da grade e pontos de
+            células com algum vértice NaN retornam NaN.
+
+            Retornos:
+            · array (N,) - temperaturas interpoladas;
+            · array (N,) de booleanos - True nos pontos fora da grade.
+        """
+        n_pontos, n_eixos = pontos.shape
+        indices = np.empty((n_pontos, n_eixos), dtype=np.intp)
+        pesos = np.empty((n_pontos, n_eixos))
+        dentro = np.ones(n_pontos, dtype=bool)
+        for k, eixo in enumerate(self._eixos):
+            x = pontos[:, k]
+            dentro &= (x >= eixo[0]) & (x <= eixo[-1])
+            i = np.minimum(
+                np.maximum(eixo.searchsorted(x) - 1, 0), eixo.size - 2
+            )
+            indices[:, k] = i
+            pesos[:, k] = (x - eixo[i]) / (eixo[i + 1] - eixo[i])
+
+        base = indices @ self._passos
+        valores = self._tad[base[:, None] + self._deslocamentos]
+        pesos_vertices = np.where(
+            self._vertices, pesos[:, None, :], 1 - pesos[:, None, :]
+        ).prod(axis=2)
+        tad = np.einsum("ij,ij->i", valores, pesos_vertices)
+        tad[~dentro] = np.nan
+        return tad, ~dentro
+
+    def consulta(self, fracao, fator_o2, temp_entrada, exato=True):
+        """
+            Temperatura adiabática de N pontos de operação.
+
+            Parâmetros:
+            · fracao - array (n_compostos,) ou (N, n_compostos) com as
+            frações molares, na ordem de `self.compostos`;
+            · fator_o2 - float ou array (N,), O2 livre como fração dos
+            gases de combustão secos com ar teórico;
+            · temp_entrada - float ou array (N,) com a temperatura do gás
+            em K;
+            · [exato] opcional - quando True, pontos fora da grade e
+            pontos de células com vértice sem solução são resolvidos pelo
+            método exato; caso contrário retornam NaN.
+
+            Retornos:
+            · array (N,) - temperaturas adiabáticas em Kelvins;
+            · array (N,) de booleanos - True nos pontos fora da faixa dos
+            eixos da grade;
+            · array (N,) de booleanos - True nos pontos dentro da faixa
+            cuja célula tem algum vértice sem solução.
+        """
+        pontos, fracao = self._coordenadas(fracao, fator_o2, temp_entrada)
+        tad, fora = self._interpola(pontos)
+        lacuna = ~fora & np.isnan(tad)
+        exatos = fora | lacuna
+        if exato and exatos.any():
+            tad[exatos] = _resolve_exato(
+                self.meta, fracao[exatos], pontos[exatos, 0],
+                pontos[exatos, 1], len(fracao)
+            )
+        return tad, fora, lacuna
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Gera a tabela da temperatura adiabática de chama."
+    )
+    parser.add_argument(
+        "eixos",
+        help="arquivo JSON com 'compostos', 'balanco' e os eixos da tabela"
+    )
+    parser.add_argument("destino", help="diretório da tabela")
+    parser.add_argument("--validacao", type=int, default=2000)
+    args = parser.parse_args()
+
+    with open(args.eixos) as arq:
+        eixos = json.load(arq)
+    compostos = eixos.pop("compostos")
+    balanco = eixos.pop("balanco", "N2")
+    meta = gera_tabela_tad(
+        args.destino, compostos, eixos, balanco, n_validacao=args.validacao
+    )
+    print(
+        f"Tabela gravada em {args.destino}; erro de interpolação máximo "
+        f"{meta['erro']['max']:.3g} K, RMS {meta['erro']['rms']:.3g} K."
+    )
@@ -0,0 +1,138 @@
+"""
+    Banco local e versionado de entalpias de formação padrão (298,15 K).
+
+    As entalpias são mantidas em um arquivo binário compacto (.npz)
+    distribuído junto ao pacote, carregado uma única vez por processo e
+    indexado por um dicionário composto -> ΔHf° (J/mol). Desta forma o
+    cálculo da temperatura adiabática não depende de acesso à rede.
+
+    O arquivo pode ser reconstruído a partir da planilha "NBS_Tables
+    Library.xlsx" do NIST com:
+
+        python -m gasmistura_pkg.termoquimica [--fonte URL_OU_ARQUIVO]
+"""
+import argparse
+from datetime import date
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+URL_NIST = "https://data.nist.gov/od/ds/mds2-2124/NBS_Tables%20Library.xlsx"
+CAMINHO_TABELA = Path(__file__).parent / "dados" / "entalpias_formacao.npz"
+
+
+@lru_cache(maxsize=None)
+def carrega_tabela(caminho=CAMINHO_TABELA):
+    """
+        Lê o banco de entalpias de formação e constrói o índice em memória.
+
+        A leitura ocorre apenas na primeira chamada para cada caminho; as
+        chamadas seguintes retornam o mesmo índice sem acesso a disco.
+
+        Retornos:
+        · dict - índice composto -> entalpia de formação em J/mol;
+        · str - versão do banco.
+    """
+    with np.load(caminho, allow_pickle=False) as arq:
+        compostos = arq["compostos"].tolist()
+        entform = arq["entform"].tolist()
+        versao = str(arq["versao"])
+
+    return dict(zip(compostos, entform)), versao
+
+
+def entalpia_formacao(composto, caminho=CAMINHO_TABELA):
+    """
+        Retorna a entalpia de formação padrão de um composto em J/mol.
+    """
+    indice, _ = carrega_tabela(caminho)
+    try:
+        return indice[composto]
+    except KeyError:
+        raise KeyError(
+            f"Entalpia de formação de '{composto}' ausente do banco local "
+            f"{caminho}. Atualize o banco com "
+            "'python -m gasmistura_pkg.termoquimica'."
+        ) from None
+
+
+def entalpias_formacao(compostos, caminho=CAMINHO_TABELA):
+    """
+        Retorna um array com as entalpias de formação padrão, em J/mol, dos
+        compostos na ordem em que foram informados.
+    """
+    return np.array(
+        [entalpia_formacao(c, caminho) for c in compostos], dtype=float
+    )
+
+
+def salva_tabela(compostos, entform, destino=CAMINHO_TABELA, versao=None):
+    """
+        Grava o banco de entalpias de formação no formato binário do pacote.
+
+        Parâmetros:
+        · compostos - sequência com as fórmulas químicas;
+        · entform - sequência com as entalpias de formação em J/mol;
+        · destino (opcional) - caminho do arquivo .npz;
+        · versao (opcional) - string de identificação da versão do banco,
+        por padrão a data corrente.
+    """
+    if versao is None:
+        versao = date.today().isoformat()
+
+    destino = Path(destino)
+    destino.parent.mkdir(parents=True, exist_ok=True)
+    np.savez(
+        destino,
+        compostos=np.asarray(compostos, dtype=str),
+        entform=np.asarray(entform, dtype=float),
+        versao=np.asarray(versao),
+    )
+    carrega_tabela.cache_clear()
+
+
+def atualiza_tabela(fonte=URL_NIST, destino=CAMINHO_TABELA, fator=1e3):
+    """
+        Reconstrói o banco local a partir da planilha de tabelas NBS do NIST.
+
+        Parâmetros:
+        · fonte (opcional) - URL ou caminho da planilha .xlsx;
+        · destino (opcional) - caminho do arquivo .npz a ser gerado;
+        · fator (opcional) - fator de conversão das entalpias da planilha
+        para J/mol (as tabelas NBS são publicadas em kJ/mol).
+
+        Valores não numéricos são considerados nulos e, para compostos
+        repetidos, apenas a primeira ocorrência é mantida.
+
+        Retornos:
+        · int - número de compostos gravados.
+    """
+    df = pd.read_excel(fonte)
+    df = df.iloc[:, [0, 7]]
+    df.columns = ["compostos", "entform"]
+    df["compostos"] = df["compostos"].astype(str).str.strip()
+    df = df.drop_duplicates(subset="compostos", keep="first")
+    df["entform"] = pd.to_numeric(df["entform"], errors="coerce").fillna(0)
+
+    salva_tabela(
+        df["compostos"].to_numpy(),
+        df["entform"].to_numpy() * fator,
+        destino,
+        versao=f"{Path(str(fonte)).name} ({date.today().isoformat()})",
+    )
+    return len(df)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Atualiza o banco local de entalpias de formação."
+    )
+    parser.add_argument("--fonte", default=URL_NIST)
+    parser.add_argument("--destino", default=CAMINHO_TABELA)
+    parser.add_argument("--fator", type=float, default=1e3)
+    args = parser.parse_args()
+
+    n = atualiza_tabela(args.fonte, args.destino, args.fator)
+    print(f"{n} compostos gravados em {args.destino}.")
@@ -0,0 +1,422 @@
+"""
+    Validação cruzada da temperatura adiabática do pacote com o Cantera.
+
+    Sobre uma grade de cenários (composição × razão de equivalência ×
+    temperatura de entrada) são calculadas:
+    · "balanco" - o balanço de energia da combustão completa do pacote
+    (processo.etapa_tad, com o backend de entalpia escolhido), definido
+    apenas para misturas pobres ou estequiométricas (phi <= 1); sem a
+    dissociação, fica alguns kelvin acima do equilíbrio nas misturas
+    pobres e afasta-se dele à medida que phi se aproxima de 1;
+    · "nativo" - o equilíbrio HP vetorizado do pacote (equilibrio.py);
+    · "cantera_hp" - o equilíbrio HP do Cantera (gas.equilibrate("HP")),
+    tomado como referência;
+    · "chama" - opcionalmente, a temperatura final da chama livre
+    (ct.FreeFlame) e a velocidade de chama.
+
+    As duas misturas recebem exatamente os mesmos reagentes (gás e ar com
+    razao_n2_o2 mols de N2 por mol de O2). Os pontos do Cantera são
+    distribuídos em processos e cada resultado é gravado no diretório de
+    cache assim que termina, identificado pelo hash do conteúdo do arquivo
+    do mecanismo (ver mecanismos.assinatura_mecanismo), dos reagentes e do
+    estado; uma nova validação calcula somente os pontos ausentes e um
+    mecanismo editado ou gerado novamente não reaproveita resultados
+    antigos. Os caminhos do pacote são vetorizados e o tempo por ponto
+    informado é o tempo do lote dividido pelo número de pontos.
+
+    Uso pela linha de comando (gás de `composicao.json`, % em massa):
+
+        python -m gasmistura_pkg.validacao --temps 300 368.15 500 \\
+            [--chamas] [--processos 4] [--plot]
+
+    Requer: cantera >= 2.5.0
+"""
+import argparse
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import as_completed
+from functools import lru_cache
+from pathlib import Path
+
+import cantera as ct
+import numpy as np
+import pandas as pd
+
+from .chama import CRITERIOS_PADRAO
+from .equilibrio import equilibrio_hp
+from .estequiometria import o2_teorico
+from .estequiometria import produtos_combustao
+from .mecanismos import assinatura_mecanismo
+from .mecanismos import caminho_mecanismo
+from .processo import etapa_tad
+from .propriedades import massas_molares
+
+METODOS = ("balanco", "nativo", "chama")
+
+
+def _normaliza_grade(grade):
+    """
+        Valida a grade e expande os pontos (composição, phi, temperatura).
+    """
+    faltantes = [
+        e for e in ("compostos", "composicao", "phi", "temp_entrada")
+            if e not in grade
+    ]
+    if faltantes:
+        raise KeyError(
+            f"Eixos ausentes da grade de validação: {', '.join(faltantes)}."
+        )
+    compostos = list(grade["compostos"])
+    composicoes = np.atleast_2d(np.asarray(grade["composicao"], dtype=float))
+    if grade.get("t_fracao", "fmol") == "fmass":
+        composicoes = composicoes / massas_molares(compostos)
+    composicoes = composicoes / composicoes.sum(axis=1, keepdims=True)
+
+    i_comp, phi, temp = (
+        m.ravel() for m in np.meshgrid(
+            np.arange(len(composicoes)),
+            np.asarray(grade["phi"], dtype=float),
+            np.asarray(grade["temp_entrada"], dtype=float),
+            indexing="ij",
+        )
+    )
+    return compostos, composicoes, i_comp, phi, temp
+
+
+def _reagentes(compostos, fracoes, phi, razao_n2_o2):
+    """
+        Mols de gás e de ar de cada ponto, por mol de gás combustível.
+
+        Retornos:
+        · list - nomes dos reagentes;
+        · array (N, n_reagentes) - mols dos reagentes;
+        · array (N,) - O2 fornecido pelo ar.
+    """
+    o2_ar = o2_teorico(fracoes, compostos) / phi
+    reagentes = list(compostos)
+    n_reag = fracoes.copy()
+    for c in ("O2", "N2"):
+        if c not in reagentes:
+            reagentes.append(c)
+            n_reag = np.column_stack([n_reag, np.zeros(len(fracoes))])
+    n_reag[:, reagentes.index("O2")] += o2_ar
+    n_reag[:, reagentes.index("N2")] += razao_n2_o2 * o2_ar
+    return reagentes, n_reag, o2_ar
+
+
+# ----------------------------------------------------------------------------
+# Cantera (executado nos processos filhos)
+# ----------------------------------------------------------------------------
+
+@lru_cache(maxsize=None)
+def _solucao(mecanismo):
+    return ct.Solution(caminho_mecanismo(mecanismo))
+
+
+def _calcula_cantera(tipo, reagentes, temp, press, mecanismo, largura,
+    criterios):
+    """
+        Equilíbrio HP ("hp") ou chama livre ("chama") de um ponto.
+    """
+    gas = _solucao(mecanismo)
+    gas.TPX = temp, press, reagentes
+    inicio = time.perf_counter()
+    resultado = {"tad": np.nan, "velocidade": np.nan, "convergiu": False}
+    try:
+        if tipo == "hp":
+            gas.equilibrate("HP")
+            resultado["tad"] = gas.T
+        else:
+            chama = ct.FreeFlame(gas, width=largura)
+            chama.set_refine_criteria(**criterios)
+            chama.solve(loglevel=0, auto=True)
+            resultado["tad"] = chama.T[-1]
+            resultado["velocidade"] = chama.velocity[0]
+        resultado["convergiu"] = True
+    except ct.CanteraError:
+        pass
+    resultado["tempo"] = time.perf_counter() - inicio
+    return resultado
+
+
+def _chave(tipo, reagentes, temp, press, configuracao):
+    caso = {
+        "tipo": tipo,
+        "reagentes": {c: round(x, 10) for c, x in reagentes.items()},
+        "temp": round(float(temp), 6),
+        "press": round(float(press), 3),
+        "configuracao": configuracao,
+    }
+    texto = json.dumps(caso, sort_keys=True)
+    return hashlib.sha256(texto.encode()).hexdigest()[:24]
+
+
+def _executa_cantera(tarefas, diretorio_cache, n_processos):
+    """
+        Resolve as tarefas (chave, argumentos) ausentes do cache e grava
+        cada resultado assim que termina.
+
+        Retornos:
+        · dict chave -> resultado, com a origem "cache" ou "calculado".
+    """
+    resultados = {}
+    pendentes = {}
+    for chave, argumentos in tarefas:
+        arquivo = diretorio_cache / f"{chave}.json"
+        if chave in resultados or chave in pendentes:
+            continue
+        if arquivo.exists():
+            resultados[chave] = dict(
+                json.loads(arquivo.read_text()), origem="cache"
+            )
+        else:
+            pendentes[chave] = argumentos
+
+    def grava(chave, resultado):
+        arquivo = diretorio_cache / f"{chave}.json"
+        temporario = arquivo.with_suffix(".tmp")
+        temporario.write_text(json.dumps(resultado))
+        os.replace(temporario, arquivo)
+        resultados[chave] = dict(resultado, origem="calculado")
+
+    if n_processos == 0:
+        for chave, argumentos in pendentes.items():
+            grava(chave, _calcula_cantera(*argumentos))
+    elif pendentes:
+        with ProcessPoolExecutor(max_workers=n_processos) as pool:
+            futuros = {
+                pool.submit(_calcula_cantera, *argumentos): chave
+                    for chave, argumentos in pendentes.items()
+            }
+            for f in as_completed(futuros):
+                grava(futuros[f], f.result())
+    return resultados
+
+
+# ----------------------------------------------------------------------------
+# Validação
+# ----------------------------------------------------------------------------
+
+def valida_tad(
+    grade,
+    diretorio_cache = "cache_validacao",
+    chamas = False,
+    mecanismo = "gri30",
+    backend = "tabela",
+    largura = 0.03,
+    criterios = None,
+    n_processos = None,
+):
+    """
+        Compara as temperaturas adiabáticas do pacote com as do Cantera em
+        uma grade de cenários.
+
+        Parâmetros:
+        · grade - dict com "compostos", "composicao" (uma lista de frações
+        por composição), "phi" e "temp_entrada" (K); opcionalmente
+        "t_fracao" ("fmol" ou "fmass"), "press" (Pa) e "razao_n2_o2";
+        · [diretorio_cache] opcional - diretório dos resultados do Cantera;
+        · [chamas] opcional - booleano; quando True, resolve também as
+        chamas livres;
+        · [mecanismo] opcional - arquivo ou nome abreviado (mecanismos.py);
+        · [backend] opcional - backend de entalpia do balanço;
+        · [largura] opcional - largura do domínio da chama em metros;
+        · [criterios] opcional - critérios de refino (ver chama.py);
+        · [n_processos] opcional - número de processos do Cantera; 0
+        executa no processo corrente, None usa todos os núcleos.
+
+        Retornos:
+        · DataFrame com uma linha por ponto: "i_composicao", "phi",
+        "temp_entrada", as temperaturas "tad_<metodo>" e "tad_cantera_hp"
+        (K), os desvios "desvio_<metodo>" em relação ao equilíbrio do
+        Cantera (K), os tempos por ponto "t_<metodo>" e "t_cantera_hp" (s),
+        a origem dos resultados do Cantera ("origem_hp", "origem_chama")
+        e, com as chamas, a "velocidade" de chama (m/s). O balanço tem
+        temperatura e tempo NaN nos pontos ricos (phi > 1).
+    """
+    compostos, composicoes, i_comp, phi, temp = _normaliza_grade(grade)
+    press = float(grade.get("press", ct.one_atm))
+    razao_n2_o2 = grade.get("razao_n2_o2", 3.72)
+    n_pontos = len(phi)
+    fracoes = composicoes[i_comp]
+    reagentes, n_reag, o2_ar = _reagentes(compostos, fracoes, phi, razao_n2_o2)
+    tabela = pd.DataFrame({
+        "i_composicao": i_comp, "phi": phi, "temp_entrada": temp
+    })
+
+    # Balanço de energia da combustão completa (misturas pobres)
+    pobres = phi <= 1
+    tabela["tad_balanco"] = np.nan
+    tabela["t_balanco"] = np.nan
+    inicio = time.perf_counter()
+    if pobres.any():
+        produtos, _ = produtos_combustao(
+            fracoes[pobres], compostos, o2_ar[pobres], razao_n2_o2
+        )
+        tad, convergiu = etapa_tad(
+            compostos, fracoes[pobres], o2_ar[pobres], produtos,
+            temp[pobres], razao_n2_o2, backend
+        )
+        tabela.loc[pobres, "tad_balanco"] = np.where(convergiu, tad, np.nan)
+        tabela.loc[pobres, "t_balanco"] = \
+            (time.perf_counter() - inicio) / pobres.sum()
+
+    # Equilíbrio HP nativo
+    inicio = time.perf_counter()
+    tad, _, convergiu, _ = equilibrio_hp(
+        n_reag, reagentes, temp_reagentes=temp, press=press
+    )
+    tabela["tad_nativo"] = np.where(convergiu, tad, np.nan)
+    tabela["t_nativo"] = (time.perf_counter() - inicio) / n_pontos
+
+    # Cantera: mesmos reagentes, em frações molares
+    criterios = dict(criterios or CRITERIOS_PADRAO)
+    diretorio_cache = Path(diretorio_cache)
+    diretorio_cache.mkdir(parents=True, exist_ok=True)
+    x_reag = n_reag / n_reag.sum(axis=1, keepdims=True)
+    tipos = {"hp": assinatura_mecanismo(mecanismo)}
+    if chamas:
+        tipos["chama"] = [tipos["hp"], largura, criterios]
+    chaves = {t: [] for t in tipos}
+    tarefas = []
+    for i in range(n_pontos):
+        mistura = {
+            c: float(x) for c, x in zip(reagentes, x_reag[i]) if x > 0
+        }
+        for tipo, configuracao in tipos.items():
+            chave = tipo + "_" + _chave(
+                tipo, mistura, temp[i], press, configuracao
+            )
+            chaves[tipo].append(chave)
+            tarefas.append((chave, (
+                tipo, mistura, temp[i], press, mecanismo, largura, criterios
+            )))
+    cantera = _executa_cantera(tarefas, diretorio_cache, n_processos)
+
+    for tipo, sufixo in (("hp", "cantera_hp"), ("chama", "chama")):
+        if tipo not in chaves:
+            continue
+        pontos = [cantera[c] for c in chaves[tipo]]
+        tabela[f"tad_{sufixo}"] = [
+            p["tad"] if p["convergiu"] else np.nan for p in pontos
+        ]
+        tabela[f"t_{sufixo}"] = [p["tempo"] for p in pontos]
+        tabela[f"origem_{tipo}"] = [p["origem"] for p in pontos]
+        if tipo == "chama":
+            tabela["velocidade"] = [p["velocidade"] for p in pontos]
+
+    for metodo in METODOS:
+        if f"tad_{metodo}" in tabela:
+            tabela[f"desvio_{metodo}"] = tabela[f"tad_{metodo}"] -\
+                tabela["tad_cantera_hp"]
+    return tabela
+
+
+def mapa_desvios(resultados, metodo="balanco", i_composicao=0):
+    """
+        Mapa dos desvios de um método em relação ao equilíbrio do Cantera
+        para uma composição: DataFrame phi (linhas) × temperatura de
+        entrada (colunas), em K.
+    """
+    coluna = f"desvio_{metodo}"
+    if coluna not in resultados:
+        raise KeyError(f"Método '{metodo}' ausente dos resultados.")
+    dados = resultados[resultados["i_composicao"] == i_composicao]
+    return dados.pivot(index="phi", columns="temp_entrada", values=coluna)
+
+
+def resumo_validacao(resultados, tolerancia=10.):
+    """
+        Resumo por método: desvio absoluto máximo e médio (K), fração dos
+        pontos calculados dentro da tolerância, maior phi até o qual todos
+        os pontos estão dentro da tolerância, tempo médio por ponto (s) e
+        aceleração em relação ao equilíbrio do Cantera.
+    """
+    linhas = {}
+    t_referencia = resultados["t_cantera_hp"].mean()
+    for metodo in METODOS:
+        coluna = f"desvio_{metodo}"
+        if coluna not in resultados:
+            continue
+        desvio = resultados[coluna].abs()
+        fora = resultados.loc[~(desvio <= tolerancia), "phi"]
+        dentro = resultados.loc[resultados["phi"] < fora.min(), "phi"] \
+            if len(fora) else resultados["phi"]
+        t_ponto = resultados[f"t_{metodo}"].mean()
+        linhas[metodo] = {
+            "desvio_max": desvio.max(),
+            "desvio_medio": desvio.mean(),
+            "fracao_tolerancia": (desvio <= tolerancia).sum() /
+                desvio.notna().sum() if desvio.notna().any() else np.nan,
+            "phi_max_tolerancia": dentro.max() if len(dentro) else np.nan,
+            "t_ponto": t_ponto,
+            "aceleracao": t_referencia / t_ponto,
+        }
+    return pd.DataFrame(linhas).T
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Valida a temperatura adiabática do pacote com o "
+            "Cantera para o gás de composicao.json com ar."
+    )
+    parser.add_argument("--composicao", default="composicao.json")
+    parser.add_argument("--phi", type=float, nargs=3,
+        default=[0.5, 1.5, 21], metavar=("MIN", "MAX", "N"))
+    parser.add_argument("--temps", type=float, nargs="+",
+        default=[300., 368.15, 500.])
+    parser.add_argument("--chamas", action="store_true")
+    parser.add_argument("--mecanismo", default="gri30")
+    parser.add_argument("--backend", default="tabela")
+    parser.add_argument("--cache", default="cache_validacao")
+    parser.add_argument("--processos", type=int, default=None)
+    parser.add_argument("--tolerancia", type=float, default=10.,
+        help="desvio tolerado em K")
+    parser.add_argument("--destino", default=None,
+        help="grava os resultados por ponto em CSV")
+    parser.add_argument("--plot", action="store_true")
+    args = parser.parse_args()
+
+    df_composicao = pd.read_json(args.composicao, orient="split")
+    grade = {
+        "compostos": list(df_composicao.columns),
+        "composicao": [df_composicao.loc["% em Massa"].astype(float)],
+        "t_fracao": "fmass",
+        "phi": np.linspace(args.phi[0], args.phi[1], int(args.phi[2])),
+        "temp_entrada": args.temps,
+    }
+    resultados = valida_tad(
+        grade, args.cache, args.chamas, args.mecanismo, args.backend,
+        n_processos=args.processos,
+    )
+    if args.destino:
+        resultados.to_csv(args.destino, index=False)
+
+    metodos = [m for m in METODOS if f"desvio_{m}" in resultados]
+    with pd.option_context("display.width", 200,
+            "display.max_columns", None):
+        for metodo in metodos:
+            print(f"\nDesvio de '{metodo}' em relação ao Cantera HP (K):")
+            print(mapa_desvios(resultados, metodo).round(1))
+        print(f"\nResumo (tolerância de {args.tolerancia} K):")
+        print(resumo_validacao(resultados, args.tolerancia))
+
+    if args.plot:
+        import matplotlib.pyplot as plt
+        fig, eixos = plt.subplots(1, len(metodos), squeeze=False,
+            figsize=(5 * len(metodos), 4))
+        for eixo, metodo in zip(eixos[0], metodos):
+            mapa = mapa_desvios(resultados, metodo)
+            imagem = eixo.pcolormesh(
+                mapa.columns, mapa.index, mapa.to_numpy(),
+                cmap="coolwarm", shading="nearest",
+            )
+            fig.colorbar(imagem, ax=eixo, label="Desvio [K]")
+            eixo.set_title(metodo)
+            eixo.set_xlabel("Temperatura de entrada [K]")
+            eixo.set_ylabel("Razão de equivalência")
+        plt.tight_layout()
+        plt.show()
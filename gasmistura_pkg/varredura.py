@@ -0,0 +1,223 @@
+"""
+    Varredura de cenários em paralelo com gravação incremental e retomada.
+
+    A grade de cenários é declarada como o produto cartesiano de vazões,
+    temperaturas de entrada, fatores de O2 livre e composições. Os pontos
+    são divididos em partes de tamanho fixo, calculadas em um
+    ProcessPoolExecutor pela cadeia vetorizada de `processo.py`. Cada parte
+    é gravada em seu próprio arquivo .npz assim que termina; ao executar de
+    novo uma varredura interrompida, apenas as partes ausentes são
+    calculadas.
+
+    Uso pela linha de comando, com a grade em um arquivo JSON:
+
+        python -m gasmistura_pkg.varredura grade.json destino/ [-n 8]
+"""
+import argparse
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import as_completed
+from pathlib import Path
+
+import numpy as np
+
+from .instrumentacao import coleta_metricas
+from .instrumentacao import etapa
+from .instrumentacao import incorpora
+from .processo import calcula_processo
+
+EIXOS = ("vazao_nm3h", "temp_entrada", "fator_o2", "composicao")
+
+
+def _normaliza_grade(grade):
+    """
+        Valida a grade e converte os eixos em listas simples (JSON).
+    """
+    faltantes = [e for e in EIXOS + ("compostos",) if e not in grade]
+    if faltantes:
+        raise KeyError(
+            f"Eixos ausentes da grade de cenários: {', '.join(faltantes)}."
+        )
+    normal = {e: np.asarray(grade[e], dtype=float).tolist() for e in EIXOS}
+    normal["composicao"] = np.atleast_2d(normal["composicao"]).tolist()
+    normal["compostos"] = list(grade["compostos"])
+    for chave in ("t_fracao", "mmolar", "backend"):
+        if grade.get(chave) is not None:
+            normal[chave] = grade[chave]
+    return normal
+
+
+def _assinatura(grade, tamanho_parte):
+    texto = json.dumps([grade, tamanho_parte], sort_keys=True)
+    return hashlib.sha256(texto.encode()).hexdigest()
+
+
+def _dimensoes(grade):
+    return tuple(len(grade[e]) for e in EIXOS)
+
+
+def pontos_grade(grade, inicio, fim):
+    """
+        Expande os pontos [inicio, fim) da grade normalizada.
+
+        Retornos:
+        · dict de arrays com os valores de cada eixo por ponto e o índice
+        da composição em "i_composicao".
+    """
+    indices = np.unravel_index(np.arange(inicio, fim), _dimensoes(grade))
+    pontos = {
+        e: np.asarray(grade[e])[i] for e, i in zip(EIXOS, indices)
+    }
+    pontos["i_composicao"] = indices[-1]
+    return pontos
+
+
+def _calcula_parte(grade, k, inicio, fim, destino):
+    """
+        Calcula e grava a parte k da grade (executado nos processos filhos).
+
+        Retornos:
+        · int - índice da parte;
+        · dict - resumo das métricas da parte (ver instrumentacao.py).
+    """
+    with coleta_metricas() as metricas:
+        pontos = pontos_grade(grade, inicio, fim)
+        resultado = calcula_processo(
+            grade["compostos"],
+            pontos["composicao"],
+            pontos["vazao_nm3h"],
+            pontos["temp_entrada"],
+            pontos["fator_o2"],
+            t_fracao=grade.get("t_fracao", "fmol"),
+            mmolar=grade.get("mmolar"),
+            backend=grade.get("backend", "tabela"),
+        )
+        resultado.update(
+            {e: pontos[e] for e in EIXOS if e != "composicao"},
+            i_composicao=pontos["i_composicao"],
+            indice=np.arange(inicio, fim),
+        )
+
+        arquivo = Path(destino) / f"parte_{k:06d}.npz"
+        temporario = arquivo.with_suffix(".tmp.npz")
+        with etapa("gravacao"):
+            np.savez(temporario, **resultado)
+            os.replace(temporario, arquivo)
+    return k, metricas.resumo()
+
+
+def executa_varredura(grade, destino, tamanho_parte=10000, n_processos=None):
+    """
+        Executa (ou retoma) uma varredura de cenários.
+
+        Parâmetros:
+        · grade - dict com as listas "vazao_nm3h" (Nm³/h), "temp_entrada"
+        (K), "fator_o2", "composicao" (uma lista de frações por composição)
+        e "compostos". Opcionalmente "t_fracao", "mmolar" e "backend" (ver
+        processo.calcula_processo);
+        · destino - diretório das partes e do manifesto da varredura;
+        · [tamanho_parte] opcional - número de pontos por parte;
+        · [n_processos] opcional - número de processos; 0 executa no
+        processo corrente, None usa todos os núcleos.
+
+        Retornos:
+        · dict com o número de pontos, de partes, de partes calculadas nesta
+        execução e o caminho do destino.
+
+        A varredura é identificada por uma assinatura da grade e do tamanho
+        das partes, gravada no manifesto; retomar um destino com outra
+        grade resulta em erro.
+    """
+    grade = _normaliza_grade(grade)
+    destino = Path(destino)
+    destino.mkdir(parents=True, exist_ok=True)
+
+    n_pontos = int(np.prod(_dimensoes(grade)))
+    n_partes = -(-n_pontos // tamanho_parte)
+    assinatura = _assinatura(grade, tamanho_parte)
+
+    manifesto = destino / "manifesto.json"
+    if manifesto.exists():
+        anterior = json.loads(manifesto.read_text())
+        if anterior["assinatura"] != assinatura:
+            raise ValueError(
+                f"O destino {destino} contém uma varredura de outra grade."
+            )
+    else:
+        manifesto.write_text(json.dumps({
+            "assinatura": assinatura,
+            "tamanho_parte": tamanho_parte,
+            "n_pontos": n_pontos,
+            "n_partes": n_partes,
+            "grade": grade,
+        }, indent=2))
+
+    pendentes = [
+        k for k in range(n_partes)
+            if not (destino / f"parte_{k:06d}.npz").exists()
+    ]
+    tarefas = [
+        (grade, k, k * tamanho_parte,
+            min((k + 1) * tamanho_parte, n_pontos), destino)
+        for k in pendentes
+    ]
+
+    # As métricas dos processos filhos são somadas à coleta ativa, se 
+    # houver; no processo corrente a coleta aninhada já as repassa
+    if n_processos == 0:
+        for t in tarefas:
+            _calcula_parte(*t)
+    else:
+        with ProcessPoolExecutor(max_workers=n_processos) as pool:
+            futuros = [pool.submit(_calcula_parte, *t) for t in tarefas]
+            for f in as_completed(futuros):
+                incorpora(f.result()[1])
+
+    return {
+        "n_pontos": n_pontos,
+        "n_partes": n_partes,
+        "n_calculadas": len(tarefas),
+        "destino": str(destino),
+    }
+
+
+def carrega_varredura(destino):
+    """
+        Lê todas as partes gravadas de uma varredura.
+
+        Retornos:
+        · dict de arrays concatenados na ordem dos pontos da grade.
+    """
+    partes = [
+        p for p in sorted(Path(destino).glob("parte_*.npz"))
+            if ".tmp" not in p.suffixes
+    ]
+    if not partes:
+        return {}
+    dados = [dict(np.load(p)) for p in partes]
+    return {
+        chave: np.concatenate([d[chave] for d in dados]) for chave in dados[0]
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Executa uma varredura de cenários de combustão."
+    )
+    parser.add_argument("grade", help="arquivo JSON com a grade de cenários")
+    parser.add_argument("destino", help="diretório dos resultados")
+    parser.add_argument("-n", "--n-processos", type=int, default=None)
+    parser.add_argument("-t", "--tamanho-parte", type=int, default=10000)
+    args = parser.parse_args()
+
+    with open(args.grade) as arq:
+        grade = json.load(arq)
+    resumo = executa_varredura(
+        grade, args.destino, args.tamanho_parte, args.n_processos
+    )
+    print(
+        f"{resumo['n_calculadas']} de {resumo['n_partes']} partes calculadas "
+        f"({resumo['n_pontos']} pontos) em {resumo['destino']}."
+    )
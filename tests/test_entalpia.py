@@ -0,0 +1,43 @@
+"""
+    Ajuste do backend NASA-7 aos valores do PropsSI e referência de gás
+    ideal dos backends.
+"""
+import numpy as np
+import pytest
+
+from gasmistura_pkg.entalpia import BackendNasa7
+from gasmistura_pkg.entalpia import cria_backend
+from gasmistura_pkg.entalpia import valida_backend
+
+COMPOSTOS = ("CO", "H2", "H2O", "CH4", "N2", "CO2", "O2")
+
+
+def test_nasa7_reproduz_propssi():
+    backend = cria_backend("nasa7", COMPOSTOS)
+    desvios = valida_backend(backend)
+    assert desvios["desvio_max"].max() < 100.
+
+
+@pytest.mark.parametrize("tipo", ["coolprop", "tabela", "nasa7"])
+def test_h2o_sem_calor_latente(tipo):
+    # Vapor de gás ideal: cp de ~34 J/mol.K entre 298 e 400 K, sem os
+    # ~44 kJ/mol da vaporização
+    backend = cria_backend(tipo, ("H2O", "SO2"))
+    h = backend.h_sensivel(np.array([400.]))[0]
+    assert np.allclose(h, [3457., 4254.], rtol=2e-3)
+
+
+def test_nasa7_continuo_em_temp_medio():
+    backend = cria_backend("nasa7", COMPOSTOS)
+    temps = np.array([np.nextafter(1000., 0.), 1000.])
+    h = backend.h_sensivel(temps)
+    cp = backend.cp(temps)
+    assert np.allclose(h[0], h[1], atol=1e-3)
+    assert np.allclose(cp[0], cp[1], atol=1e-6)
+
+
+def test_valida_backend_rejeita_cp_negativo():
+    coefs = np.zeros((1, 2, 7))
+    coefs[..., 0] = -1.
+    with pytest.raises(ValueError, match="cp não positivo"):
+        valida_backend(BackendNasa7(["N2"], coefs))
@@ -0,0 +1,50 @@
+"""
+    Invalidação dos nós do grafo memorizado da cadeia de cálculo.
+"""
+import numpy as np
+
+from gasmistura_pkg.grafo import GrafoProcesso
+from gasmistura_pkg.processo import calcula_processo
+
+COMPOSTOS = ["CO", "H2", "N2"]
+FRACAO = [.25, .05, .70]
+
+
+def _grafo():
+    grafo = GrafoProcesso(COMPOSTOS)
+    grafo.define(
+        fracao=FRACAO, vazao_nm3h=1000., temp_entrada=300., fator_o2=.1
+    )
+    grafo.calcula()
+    return grafo
+
+
+def test_fator_o2_recalcula_apenas_os_nos_a_jusante():
+    grafo = _grafo()
+    grafo.define(fator_o2=.2)
+    resultado = grafo.calcula()
+    assert grafo.info()["ultima_execucao"] == {
+        "mistura": "cache", "vazoes": "cache", "ar_teorico": "cache",
+        "produtos": "calculado", "tad": "calculado",
+    }
+    direto = calcula_processo(COMPOSTOS, FRACAO, 1000., 300., .2)
+    assert np.allclose(resultado["tad"], direto["tad"])
+
+
+def test_resultado_identico_nao_invalida_os_nos_a_jusante():
+    grafo = _grafo()
+    grafo.define(fator_o2=[.1])
+    grafo.calcula()
+    execucao = grafo.info()["ultima_execucao"]
+    assert execucao["produtos"] == "calculado"
+    assert execucao["tad"] == "cache"
+
+
+def test_valor_anterior_volta_do_cache():
+    grafo = _grafo()
+    tad = grafo.valor("tad").copy()
+    grafo.define(temp_entrada=400.)
+    assert not np.allclose(grafo.calcula()["tad"], tad)
+    grafo.define(temp_entrada=300.)
+    assert np.allclose(grafo.calcula()["tad"], tad)
+    assert set(grafo.info()["ultima_execucao"].values()) == {"cache"}
@@ -0,0 +1,42 @@
+"""
+    Processamento em fluxo do historiador: blocos sem linhas válidas e
+    encerramento da thread leitora em caso de erro.
+"""
+import io
+import threading
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from gasmistura_pkg.historiador import processa_historico
+
+COMPOSTOS = ["CO", "H2", "N2"]
+VALIDA = "1000,25,25,5,70"
+
+
+def _csv(linhas):
+    return io.StringIO("vazao,temp,CO,H2,N2\n" + "\n".join(linhas))
+
+
+def test_bloco_sem_linhas_validas(tmp_path):
+    destino = tmp_path / "saida.csv"
+    resumo = processa_historico(
+        _csv([VALIDA, VALIDA, ",25,25,5,70", "1000,,25,5,70", VALIDA]),
+        destino, COMPOSTOS, "vazao", "temp", tamanho_bloco=2,
+    )
+    assert resumo == {"n_linhas": 5, "n_blocos": 3, "n_nao_convergidos": 2}
+    saida = pd.read_csv(destino)
+    assert saida["convergiu"].tolist() == [True, True, False, False, True]
+    assert saida["tad"][2:4].isna().all()
+    assert np.isclose(saida["tad"][0], saida["tad"][4])
+
+
+def test_erro_na_gravacao_encerra_a_leitora(tmp_path):
+    n_threads = threading.active_count()
+    with pytest.raises(OSError):
+        processa_historico(
+            _csv([VALIDA] * 50), tmp_path / "ausente" / "saida.csv",
+            COMPOSTOS, "vazao", "temp", tamanho_bloco=1, n_fila=1,
+        )
+    assert threading.active_count() == n_threads
@@ -0,0 +1,31 @@
+"""
+    Amostras de Sobol e índices de primeira ordem em funções de índices
+    conhecidos.
+"""
+import numpy as np
+
+from gasmistura_pkg.incerteza import amostras_sobol
+from gasmistura_pkg.incerteza import efeitos_principais
+
+
+def test_amostras_padronizadas():
+    amostras = amostras_sobol(3, 3000, semente=0)
+    assert amostras.shape == (4096, 3)
+    assert np.allclose(amostras.mean(axis=0), 0., atol=1e-2)
+    assert np.allclose(amostras.std(axis=0), 1., atol=1e-2)
+
+
+def test_indices_de_funcao_linear():
+    # Var(x1 + 2 x2) = 1 + 4: índices 0,2 e 0,8; x3 não contribui
+    x = amostras_sobol(3, 2**12, semente=2)
+    indices = efeitos_principais(x, x[:, 0] + 2 * x[:, 1])
+    assert np.allclose(indices, [.2, .8, 0.], atol=1e-2)
+
+
+def test_indices_da_funcao_de_ishigami():
+    # Índices analíticos para a = 7 e b = 0,1 com x uniforme em [-π, π]
+    x = amostras_sobol(3, 2**14, "uniforme", semente=1) * np.pi / np.sqrt(3)
+    y = np.sin(x[:, 0]) + 7 * np.sin(x[:, 1])**2 +\
+        .1 * x[:, 2]**4 * np.sin(x[:, 0])
+    indices = efeitos_principais(x, y)
+    assert np.allclose(indices, [.3139, .4424, 0.], atol=1e-2)
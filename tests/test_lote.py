@@ -0,0 +1,89 @@
+"""
+    Máscara de convergência de temp_adiabatica_lote para pontos sem troca
+    de sinal do resíduo no intervalo de busca e derivadas de
+    sensibilidades_tad.
+"""
+import numpy as np
+
+from gasmistura_pkg.lote import sensibilidades_tad
+from gasmistura_pkg.lote import temp_adiabatica_lote
+
+
+def test_co_estequiometrico_acima_do_limite_nao_converge():
+    # CO + 0,5 O2 -> CO2 sem dissociação supera 3500 K
+    temp, convergiu, _ = temp_adiabatica_lote(
+        [[1., .5]], [[1.]], ["CO", "O2"], ["CO2"]
+    )
+    assert not convergiu[0]
+    assert temp[0] == 3500.
+
+
+def test_inerte_abaixo_do_limite_nao_converge():
+    temp, convergiu, _ = temp_adiabatica_lote(
+        [[1.]], [[1.]], ["N2"], ["N2"], temp_reagentes=240.
+    )
+    assert not convergiu[0]
+    assert temp[0] == 250.
+
+
+def test_inerte_dentro_do_intervalo_converge():
+    temp, convergiu, _ = temp_adiabatica_lote(
+        [[1.]], [[1.]], ["N2"], ["N2"], temp_reagentes=260.
+    )
+    assert convergiu[0]
+    assert np.isclose(temp[0], 260., atol=1e-2)
+
+
+def test_lote_misto():
+    temp, convergiu, _ = temp_adiabatica_lote(
+        [[1., .5, 0.], [1., 2., 7.44]],
+        [[1., 0., 0.], [1., 1.5, 7.44]],
+        ["CO", "O2", "N2"],
+        ["CO2", "O2", "N2"],
+    )
+    assert convergiu.tolist() == [False, True]
+    assert 1000. < temp[1] < 1500.
+
+
+def _produtos(n_reag):
+    # CO + H2 + O2 + N2 -> CO2 + H2O + O2 + N2 (combustão completa)
+    co, h2, o2, n2 = n_reag
+    return [co, h2, o2 - (co + h2) / 2, n2]
+
+
+def test_sensibilidades_conferem_com_diferencas_finitas():
+    reagentes = ["CO", "H2", "O2", "N2"]
+    produtos = ["CO2", "H2O", "O2", "N2"]
+    n_reag = np.array([.3, .1, .4, 1.8])
+    temp_r = 400.
+    opcoes = {"backend": "nasa7", "tol": 1e-9}
+
+    def tad(n_r=n_reag, n_p=None, t_r=temp_r):
+        n_p = _produtos(n_r) if n_p is None else n_p
+        temp, convergiu, _ = temp_adiabatica_lote(
+            [n_r], [n_p], reagentes, produtos, temp_reagentes=t_r, **opcoes
+        )
+        assert convergiu[0]
+        return temp[0]
+
+    derivadas = sensibilidades_tad(
+        tad(), n_reag, _produtos(n_reag), reagentes, produtos, temp_r,
+        opcoes["backend"]
+    )
+    passo = 1e-4
+    for j in range(len(reagentes)):
+        delta = np.zeros(len(reagentes))
+        delta[j] = passo
+        numerica = (tad(n_reag + delta) - tad(n_reag - delta)) / (2 * passo)
+        assert np.isclose(
+            derivadas["n_reagentes"][0, j], numerica, rtol=1e-4
+        )
+    n_prod = np.array(_produtos(n_reag))
+    for j in range(len(produtos)):
+        delta = np.zeros(len(produtos))
+        delta[j] = passo
+        numerica = (tad(n_p=n_prod + delta) - tad(n_p=n_prod - delta)) /\
+            (2 * passo)
+        assert np.isclose(derivadas["n_produtos"][0, j], numerica, rtol=1e-4)
+    numerica = (tad(t_r=temp_r + .1) - tad(t_r=temp_r - .1)) / .2
+    assert np.isclose(derivadas["temp_reagentes"][0], numerica, rtol=1e-4)
@@ -0,0 +1,22 @@
+"""
+    Assinatura dos mecanismos usada nas chaves dos caches do Cantera.
+"""
+import shutil
+
+from gasmistura_pkg.mecanismos import CAMINHO_REDUZIDO
+from gasmistura_pkg.mecanismos import assinatura_mecanismo
+
+
+def test_assinatura_independe_da_localizacao(tmp_path):
+    copia = tmp_path / "copia.yaml"
+    shutil.copy(CAMINHO_REDUZIDO, copia)
+    assert assinatura_mecanismo(str(copia)) == \
+        assinatura_mecanismo("reduzido")
+
+
+def test_assinatura_muda_com_o_conteudo(tmp_path):
+    copia = tmp_path / "copia.yaml"
+    shutil.copy(CAMINHO_REDUZIDO, copia)
+    original = assinatura_mecanismo(str(copia))
+    copia.write_text(copia.read_text() + "\n# editado\n")
+    assert assinatura_mecanismo(str(copia)) != original
@@ -0,0 +1,74 @@
+"""
+    Validação das entradas de mistura.py.
+"""
+import numpy as np
+import pytest
+
+from gasmistura_pkg.corrente import CorrenteGas
+from gasmistura_pkg.mistura import COLUNA_AR
+from gasmistura_pkg.mistura import temp_adiabatica
+from gasmistura_pkg.mistura import vaz_combustao
+
+
+def test_temp_adiabatica_rejeita_corrente_com_varios_pontos():
+    reagentes = CorrenteGas(["CO", "O2", "N2"], [[1., 2., 7.44]] * 2)
+    produtos = CorrenteGas(["CO2", "O2", "N2"], [[1., 1.5, 7.44]] * 2)
+    with pytest.raises(ValueError, match="temp_adiabatica_lote"):
+        temp_adiabatica(
+            reagentes, produtos, 0.5, "brentq", salva_dados=False
+        )
+
+
+def test_vaz_combustao_mantem_argonio_do_gas():
+    gas = CorrenteGas(["CO", "N2", "Ar"], [[1., 1., .1]])
+    reagentes, produtos = vaz_combustao(gas, coluna_ar="ar_combustao")
+    assert reagentes["Ar"][0] == .1
+    assert reagentes["O2"][0] == .5
+    assert produtos["Ar"][0] == .1
+
+
+def test_vaz_combustao_ar_informado():
+    gas = CorrenteGas(["CO", "N2", COLUNA_AR], [[1., 0., .6]])
+    reagentes, produtos = vaz_combustao(gas)
+    assert reagentes["O2"][0] == .6
+    assert np.isclose(produtos["O2"][0], .1)
+    assert "Ar" not in reagentes.compostos
+
+
+def test_vaz_combustao_rejeita_ar_insuficiente():
+    gas = CorrenteGas(["CO", "N2", COLUNA_AR], [[1., 0., .6], [1., 0., .4]])
+    with pytest.raises(ValueError, match=r"insuficiente .*\[1\]"):
+        vaz_combustao(gas)
+
+
+def test_vaz_combustao_rejeita_duas_colunas_de_ar():
+    gas = CorrenteGas(["CO", "O2", COLUNA_AR], [[1., .6, .6]])
+    with pytest.raises(ValueError, match="apenas uma"):
+        vaz_combustao(gas)
+
+
+def test_temp_adiabatica_sem_raiz_no_intervalo():
+    # CO + 0,5 O2 -> CO2 sem dissociação supera 3500 K
+    reagentes = CorrenteGas(["CO", "O2"], [1., .5])
+    produtos = CorrenteGas(["CO2"], [1.])
+    with pytest.raises(ValueError, match="fora do intervalo de busca"):
+        temp_adiabatica(
+            reagentes, produtos, .5, "brentq", salva_dados=False
+        )
+
+
+def test_temp_adiabatica_sem_o2_nos_reagentes():
+    reagentes = CorrenteGas(["N2"], [1.])
+    produtos = CorrenteGas(["N2"], [1.])
+    with pytest.raises(ValueError, match="sem O2"):
+        temp_adiabatica(reagentes, produtos, .5, "brentq")
+
+
+def test_temp_adiabatica_nao_grava_por_padrao(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    reagentes = CorrenteGas(["CO", "O2", "N2"], [1., 1., 3.72])
+    produtos = CorrenteGas(["CO2", "O2", "N2"], [1., .5, 3.72])
+    _, phi, info = temp_adiabatica(reagentes, produtos, .5, "brentq")
+    assert np.isclose(phi, .5)
+    assert "diretorio" not in info
+    assert not any(tmp_path.iterdir())
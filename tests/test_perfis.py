@@ -0,0 +1,40 @@
+"""
+    Ida e volta do arquivo colunar de perfis.
+"""
+import numpy as np
+
+from gasmistura_pkg.perfis import PerfilChama
+from gasmistura_pkg.perfis import grava_perfil
+
+
+def _colunas():
+    return {
+        "grid": np.linspace(0., .03, 5),
+        "T": np.linspace(300., 2000., 5),
+        "X_N2": np.full(5, .7),
+        "X_CH2": np.array([0., 1.6e-15, 0., 0., 0.]),
+        "X_AR": np.zeros(5),
+    }
+
+
+def test_padrao_descarta_apenas_colunas_nulas(tmp_path):
+    colunas = _colunas()
+    grava_perfil(tmp_path / "perfil", colunas)
+    perfil = PerfilChama(tmp_path / "perfil")
+    assert perfil.nulas == ["X_AR"]
+    for nome, valores in colunas.items():
+        assert np.array_equal(perfil[nome], valores)
+
+
+def test_limiar_opcional(tmp_path):
+    perfil = grava_perfil(tmp_path / "perfil", _colunas(), limiar=1e-14)
+    assert perfil.nulas == ["X_CH2", "X_AR"]
+
+
+def test_comprimido_nao_retem_colunas(tmp_path):
+    colunas = _colunas()
+    perfil = grava_perfil(tmp_path / "perfil", colunas, comprime=True)
+    for nome, valores in colunas.items():
+        assert np.array_equal(perfil[nome], valores)
+    assert perfil["T"] is not perfil["T"]
+    assert not perfil["T"].flags.writeable
@@ -0,0 +1,29 @@
+"""
+    Problema inverso da cadeia vetorizada: ar de combustão para uma
+    temperatura adiabática alvo.
+"""
+import numpy as np
+
+from gasmistura_pkg.processo import calcula_fator_o2
+from gasmistura_pkg.processo import calcula_processo
+
+COMPOSTOS = ["CO", "H2", "N2"]
+
+
+def test_fator_o2_reproduz_o_alvo():
+    fracao = [.25, .05, .70]
+    inverso = calcula_fator_o2(COMPOSTOS, fracao, 1000., 300., 1500.)
+    assert inverso["convergiu"][0]
+    direto = calcula_processo(
+        COMPOSTOS, fracao, 1000., 300., inverso["fator_o2"]
+    )
+    assert np.isclose(direto["tad"][0], 1500., atol=.1)
+
+
+def test_fator_o2_com_lote_somente_inerte():
+    # Sem combustível, o O2 não aparece nos produtos sem ar
+    with np.errstate(divide="ignore", invalid="ignore"):
+        resultado = calcula_fator_o2(
+            COMPOSTOS, [[0., 0., 1.]] * 2, 1000., 300., 1500.
+        )
+    assert not resultado["convergiu"].any()
@@ -0,0 +1,27 @@
+"""
+    Formas de entrada de densidade_molar.
+"""
+import numpy as np
+
+from gasmistura_pkg.corrente import CorrenteGas
+from gasmistura_pkg.mistura import corr_vazao_normal
+from gasmistura_pkg.propriedades import densidade_molar
+
+COMPOSTOS = ["CO", "N2", "CO2"]
+FRACOES = np.array([[.3, .5, .2], [.2, .6, .2]])
+
+
+def test_composicoes_por_estado_com_temp_e_press_escalares():
+    rho = densidade_molar(COMPOSTOS, FRACOES, 300., 101325.)
+    assert rho.shape == (2,)
+    assert np.isclose(rho[0], densidade_molar(COMPOSTOS, FRACOES[0], 300.,
+        101325.))
+
+
+def test_corr_vazao_normal_heos_com_corrente():
+    vaz_mass, vazoes = corr_vazao_normal(
+        1., None, 29., 300., eos="HEOS",
+        fracoes=CorrenteGas(COMPOSTOS, FRACOES),
+    )
+    assert vaz_mass.shape == (2,)
+    assert len(vazoes) == 2
@@ -0,0 +1,53 @@
+"""
+    Agrupamento de solicitações idênticas em andamento no ServicoTad.
+"""
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from gasmistura_pkg.servico import ServicoTad
+
+
+def test_solicitacoes_identicas_compartilham_o_calculo():
+    chamadas = []
+    liberado = threading.Event()
+
+    def calculo(x, fator=1):
+        liberado.wait(5)
+        chamadas.append(x)
+        return {"valor": x * fator}
+
+    async def clientes(servico):
+        tarefas = [
+            asyncio.create_task(servico.submete(calculo, 2, fator=3)),
+            asyncio.create_task(servico.submete(calculo, 2, fator=3)),
+            asyncio.create_task(servico.submete(calculo, 5, fator=3)),
+        ]
+        await asyncio.sleep(0.05)
+        assert servico.em_andamento() == 2
+        liberado.set()
+        return await asyncio.gather(*tarefas)
+
+    with ThreadPoolExecutor(2) as executor:
+        servico = ServicoTad(executor=executor)
+        a, b, c = asyncio.run(clientes(servico))
+
+    assert a is b
+    assert a == {"valor": 6} and c == {"valor": 15}
+    assert sorted(chamadas) == [2, 5]
+    assert servico.estatisticas == {
+        "solicitacoes": 3, "execucoes": 2, "agrupadas": 1
+    }
+    assert servico.em_andamento() == 0
+
+
+def test_solicitacao_apos_conclusao_executa_novamente():
+    async def cliente(servico):
+        primeiro = await servico.submete(sum, (1, 2))
+        segundo = await servico.submete(sum, (1, 2))
+        return primeiro, segundo
+
+    with ThreadPoolExecutor(1) as executor:
+        servico = ServicoTad(executor=executor)
+        assert asyncio.run(cliente(servico)) == (3, 3)
+    assert servico.estatisticas["execucoes"] == 2
@@ -0,0 +1,33 @@
+"""
+    Máscaras de TabelaTad.consulta: pontos fora da grade e células com
+    vértice sem solução.
+"""
+import numpy as np
+
+from gasmistura_pkg.tabela_tad import TabelaTad
+
+
+def _tabela():
+    meta = {
+        "compostos": ["CO", "N2"],
+        "balanco": "N2",
+        "eixos": {
+            "fator_o2": [0., 1.], "temp_entrada": [300., 400.],
+            "CO": [0., .5, 1.],
+        },
+    }
+    tad = np.full((2, 2, 3), 1500.)
+    tad[1, 1, 2] = np.nan
+    tabela = TabelaTad.__new__(TabelaTad)
+    tabela._inicializa(meta, tad)
+    return tabela
+
+
+def test_consulta_separa_fora_da_grade_e_vertice_sem_solucao():
+    tad, fora, lacuna = _tabela().consulta(
+        [[.2, .8], [.8, .2], [.2, .8]], [.5, .5, 2.], 350., exato=False
+    )
+    assert np.isclose(tad[0], 1500.)
+    assert fora.tolist() == [False, False, True]
+    assert lacuna.tolist() == [False, True, False]
+    assert np.isnan(tad[1:]).all()
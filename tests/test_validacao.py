@@ -0,0 +1,34 @@
+"""
+    Balanço de energia da combustão completa contra o equilíbrio HP do
+    Cantera para o gás de composicao.json.
+"""
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("cantera")
+
+from gasmistura_pkg.validacao import valida_tad  # noqa: E402
+
+COMPOSICAO = Path(__file__).resolve().parents[1] / "composicao.json"
+
+
+@pytest.mark.parametrize("backend", ["tabela", "nasa7"])
+def test_balanco_pobre_proximo_do_equilibrio(tmp_path, backend):
+    df = pd.read_json(COMPOSICAO, orient="split")
+    grade = {
+        "compostos": list(df.columns),
+        "composicao": [df.loc["% em Massa"].astype(float)],
+        "t_fracao": "fmass",
+        "phi": [0.5, 0.6],
+        "temp_entrada": [300.],
+    }
+    resultados = valida_tad(
+        grade, tmp_path, backend=backend, n_processos=0
+    )
+    desvio = resultados["desvio_balanco"].to_numpy()
+    # Sem dissociação, a combustão completa fica pouco acima do equilíbrio
+    assert np.all(desvio > 0)
+    assert np.all(desvio < 8.)